@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Script to add the denormalized requirement totals to compliance_categories
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+def add_compliance_category_totals():
+    """Add and backfill total/compliant requirement counts and compliance score"""
+    
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                ALTER TABLE compliance_categories
+                ADD COLUMN IF NOT EXISTS total_requirements INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS compliant_requirements INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS compliance_score FLOAT NOT NULL DEFAULT 100
+            """))
+            
+            # Backfill from the existing requirements
+            connection.execute(text("""
+                UPDATE compliance_categories c
+                SET total_requirements = t.total,
+                    compliant_requirements = t.compliant,
+                    compliance_score = CASE WHEN t.total = 0 THEN 100
+                                            ELSE t.compliant * 100.0 / t.total END
+                FROM (
+                    SELECT cat.id,
+                           COUNT(r.id) AS total,
+                           COUNT(r.id) FILTER (WHERE r.status::text IN ('COMPLIANT', 'compliant')) AS compliant
+                    FROM compliance_categories cat
+                    LEFT JOIN compliance_requirements r ON r.category_id = cat.id
+                    GROUP BY cat.id
+                ) t
+                WHERE c.id = t.id
+            """))
+            
+            connection.commit()
+            print("✅ Successfully added requirement totals to compliance_categories")
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error adding compliance category totals: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Adding requirement totals to compliance_categories...")
+    success = add_compliance_category_totals()
+    if not success:
+        sys.exit(1)
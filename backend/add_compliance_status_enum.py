@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Script to convert compliance status columns to the native compliancestatus enum
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+def add_compliance_status_enum():
+    """Convert VARCHAR status columns (lowercase values) to compliancestatus"""
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                DO $$ BEGIN
+                    CREATE TYPE compliancestatus AS ENUM (
+                        'COMPLIANT', 'WARNING', 'NON_COMPLIANT', 'PENDING', 'UNDER_REVIEW'
+                    );
+                EXCEPTION
+                    WHEN duplicate_object THEN NULL;
+                END $$
+            """))
+
+            def status_is_varchar(table):
+                return connection.execute(text("""
+                    SELECT data_type <> 'USER-DEFINED'
+                    FROM information_schema.columns
+                    WHERE table_name = :table AND column_name = 'status'
+                """), {"table": table}).scalar()
+
+            if status_is_varchar("compliance_requirements"):
+                # The open-requirements partial index compares status as text;
+                # rebuild it against the enum once the column is converted
+                connection.execute(text("DROP INDEX IF EXISTS idx_compliance_requirements_org_due_open"))
+                connection.execute(text("ALTER TABLE compliance_requirements ALTER COLUMN status DROP DEFAULT"))
+                connection.execute(text("""
+                    ALTER TABLE compliance_requirements
+                    ALTER COLUMN status TYPE compliancestatus USING upper(status)::compliancestatus
+                """))
+                connection.execute(text("""
+                    ALTER TABLE compliance_requirements ALTER COLUMN status SET DEFAULT 'PENDING'
+                """))
+                connection.execute(text("""
+                    CREATE INDEX IF NOT EXISTS idx_compliance_requirements_org_due_open
+                    ON compliance_requirements (organization_id, due_date, id)
+                    WHERE status <> 'COMPLIANT'
+                """))
+                print("✅ Converted compliance_requirements.status")
+
+            if status_is_varchar("compliance_assessments"):
+                connection.execute(text("""
+                    ALTER TABLE compliance_assessments
+                    ALTER COLUMN status TYPE compliancestatus USING upper(status)::compliancestatus
+                """))
+                print("✅ Converted compliance_assessments.status")
+
+            connection.commit()
+            print("✅ Compliance status columns use the compliancestatus enum")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error converting compliance status columns: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Converting compliance status columns to compliancestatus...")
+    success = add_compliance_status_enum()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Script to add download tracking columns to documents table
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+def add_document_access_columns():
+    """Add download_count and last_accessed columns to documents table"""
+    
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                ALTER TABLE documents
+                ADD COLUMN IF NOT EXISTS download_count INTEGER NOT NULL DEFAULT 0,
+                ADD COLUMN IF NOT EXISTS last_accessed TIMESTAMP
+            """))
+            
+            connection.commit()
+            print("✅ Successfully added download tracking columns to documents table")
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error adding download tracking columns: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Adding download tracking columns to documents table...")
+    success = add_document_access_columns()
+    if not success:
+        sys.exit(1)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Script to add the canonical document pair columns to document_comparisons
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+def add_document_comparison_pair_columns():
+    """Add and backfill document_id_low and document_id_high on document_comparisons"""
+    
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                ALTER TABLE document_comparisons
+                ADD COLUMN IF NOT EXISTS document_id_low UUID,
+                ADD COLUMN IF NOT EXISTS document_id_high UUID
+            """))
+            
+            connection.execute(text("""
+                UPDATE document_comparisons
+                SET document_id_low = LEAST(primary_document_id, secondary_document_id),
+                    document_id_high = GREATEST(primary_document_id, secondary_document_id)
+                WHERE document_id_low IS NULL OR document_id_high IS NULL
+            """))
+            
+            connection.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_document_comparisons_pair_date
+                ON document_comparisons (document_id_low, document_id_high, comparison_date)
+            """))
+            
+            connection.commit()
+            print("✅ Successfully added document pair columns to document_comparisons table")
+            return True
+            
+    except Exception as e:
+        print(f"❌ Error adding document pair columns: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Adding document pair columns to document_comparisons table...")
+    success = add_document_comparison_pair_columns()
+    if not success:
+        sys.exit(1)
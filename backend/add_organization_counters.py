@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Script to create the trigger-maintained organization_counters table
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+# Per table: the organization_counters deltas contributed by one row (as SQL
+# over the row placeholder ``{r}``), and the columns whose change moves them
+COUNTED_TABLES = {
+    "users": (
+        {"users_count": "1", "active_users": "({r}.is_active IS TRUE)::int"},
+        ["organization_id", "is_active"],
+    ),
+    "deals": (
+        {
+            "deals_count": "1",
+            "active_deals": "({r}.status = 'active')::int",
+            "pipeline_value": "COALESCE({r}.deal_value, 0)",
+        },
+        ["organization_id", "status", "deal_value"],
+    ),
+    "clients": ({"clients_count": "1"}, ["organization_id"]),
+    "tasks": ({"tasks_count": "1"}, ["organization_id"]),
+    "documents": ({"documents_count": "1"}, ["organization_id"]),
+}
+
+COUNTER_COLUMNS = [
+    "users_count", "active_users", "deals_count", "active_deals",
+    "pipeline_value", "clients_count", "tasks_count", "documents_count",
+]
+
+
+def _bump_call(table: str, row: str, sign: str) -> str:
+    """PERFORM adding (sign=+) or removing (sign=-) one row's contribution"""
+    deltas, _ = COUNTED_TABLES[table]
+    args = ", ".join(
+        f"d_{column} => {sign}({expression.format(r=row)})"
+        for column, expression in deltas.items()
+    )
+    return f"PERFORM bump_organization_counters({row}.organization_id, {args});"
+
+
+def add_organization_counters():
+    """Create organization_counters, install its triggers and backfill it"""
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                CREATE TABLE IF NOT EXISTS organization_counters (
+                    organization_id UUID PRIMARY KEY REFERENCES organizations(id) ON DELETE CASCADE,
+                    users_count INTEGER NOT NULL DEFAULT 0,
+                    active_users INTEGER NOT NULL DEFAULT 0,
+                    deals_count INTEGER NOT NULL DEFAULT 0,
+                    active_deals INTEGER NOT NULL DEFAULT 0,
+                    pipeline_value NUMERIC(15, 2) NOT NULL DEFAULT 0,
+                    clients_count INTEGER NOT NULL DEFAULT 0,
+                    tasks_count INTEGER NOT NULL DEFAULT 0,
+                    documents_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP NOT NULL DEFAULT (now() AT TIME ZONE 'utc')
+                )
+            """))
+
+            # Upsert applying deltas to one organization's counters
+            params = ",\n                    ".join(
+                f"d_{column} {'NUMERIC' if column == 'pipeline_value' else 'INTEGER'} DEFAULT 0"
+                for column in COUNTER_COLUMNS
+            )
+            connection.execute(text(f"""
+                CREATE OR REPLACE FUNCTION bump_organization_counters(
+                    org UUID,
+                    {params}
+                ) RETURNS VOID AS $$
+                BEGIN
+                    IF org IS NULL THEN
+                        RETURN;
+                    END IF;
+                    INSERT INTO organization_counters AS c (
+                        organization_id, {", ".join(COUNTER_COLUMNS)}, updated_at
+                    ) VALUES (
+                        org, {", ".join(f"d_{column}" for column in COUNTER_COLUMNS)},
+                        now() AT TIME ZONE 'utc'
+                    )
+                    ON CONFLICT (organization_id) DO UPDATE SET
+                        {", ".join(f"{column} = c.{column} + EXCLUDED.{column}" for column in COUNTER_COLUMNS)},
+                        updated_at = EXCLUDED.updated_at;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+
+            for table, (_, watched_columns) in COUNTED_TABLES.items():
+                function_name = f"{table}_organization_counters"
+                connection.execute(text(f"""
+                    CREATE OR REPLACE FUNCTION {function_name}() RETURNS TRIGGER AS $$
+                    BEGIN
+                        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                            {_bump_call(table, "OLD", "-")}
+                        END IF;
+                        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                            {_bump_call(table, "NEW", "+")}
+                        END IF;
+                        RETURN NULL;
+                    END;
+                    $$ LANGUAGE plpgsql
+                """))
+
+                changed = " OR ".join(
+                    f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in watched_columns
+                )
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_counters_insert_delete ON {table}"))
+                connection.execute(text(f"""
+                    CREATE TRIGGER {table}_counters_insert_delete
+                    AFTER INSERT OR DELETE ON {table}
+                    FOR EACH ROW EXECUTE FUNCTION {function_name}()
+                """))
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {table}_counters_update ON {table}"))
+                connection.execute(text(f"""
+                    CREATE TRIGGER {table}_counters_update
+                    AFTER UPDATE OF {", ".join(watched_columns)} ON {table}
+                    FOR EACH ROW WHEN ({changed})
+                    EXECUTE FUNCTION {function_name}()
+                """))
+
+            # Backfill from the existing rows, in the same transaction as the
+            # trigger installation
+            connection.execute(text("""
+                INSERT INTO organization_counters (
+                    organization_id, users_count, active_users, deals_count, active_deals,
+                    pipeline_value, clients_count, tasks_count, documents_count, updated_at
+                )
+                SELECT o.id,
+                       (SELECT COUNT(*) FROM users u WHERE u.organization_id = o.id),
+                       (SELECT COUNT(*) FROM users u WHERE u.organization_id = o.id AND u.is_active IS TRUE),
+                       (SELECT COUNT(*) FROM deals d WHERE d.organization_id = o.id),
+                       (SELECT COUNT(*) FROM deals d WHERE d.organization_id = o.id AND d.status = 'active'),
+                       (SELECT COALESCE(SUM(d.deal_value), 0) FROM deals d WHERE d.organization_id = o.id),
+                       (SELECT COUNT(*) FROM clients c WHERE c.organization_id = o.id),
+                       (SELECT COUNT(*) FROM tasks t WHERE t.organization_id = o.id),
+                       (SELECT COUNT(*) FROM documents doc WHERE doc.organization_id = o.id),
+                       now() AT TIME ZONE 'utc'
+                FROM organizations o
+                ON CONFLICT (organization_id) DO UPDATE SET
+                    users_count = EXCLUDED.users_count,
+                    active_users = EXCLUDED.active_users,
+                    deals_count = EXCLUDED.deals_count,
+                    active_deals = EXCLUDED.active_deals,
+                    pipeline_value = EXCLUDED.pipeline_value,
+                    clients_count = EXCLUDED.clients_count,
+                    tasks_count = EXCLUDED.tasks_count,
+                    documents_count = EXCLUDED.documents_count,
+                    updated_at = EXCLUDED.updated_at
+            """))
+
+            connection.commit()
+            print("✅ Successfully created and backfilled organization_counters")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error creating organization counters: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Creating organization_counters table and triggers...")
+    success = add_organization_counters()
+    if not success:
+        sys.exit(1)
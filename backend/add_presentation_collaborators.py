@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Script to create the trigger-maintained presentation_collaborators table
+"""
+import sys
+import os
+
+# Add the parent directory to the path so we can import from app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from app.db.database import engine
+
+def add_presentation_collaborators():
+    """Create presentation_collaborators, install its trigger and backfill it"""
+
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("""
+                CREATE TABLE IF NOT EXISTS presentation_collaborators (
+                    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+                    presentation_id UUID NOT NULL REFERENCES presentations(id) ON DELETE CASCADE,
+                    PRIMARY KEY (user_id, presentation_id)
+                )
+            """))
+            connection.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_presentation_collaborators_presentation_id
+                ON presentation_collaborators (presentation_id)
+            """))
+
+            # Rebuild a presentation's rows from its collaborators JSON array;
+            # ids that are not existing users are skipped rather than failing
+            # the presentation write
+            connection.execute(text("""
+                CREATE OR REPLACE FUNCTION presentations_sync_collaborators() RETURNS TRIGGER AS $$
+                BEGIN
+                    IF TG_OP = 'UPDATE' THEN
+                        DELETE FROM presentation_collaborators WHERE presentation_id = NEW.id;
+                    END IF;
+                    IF json_typeof(NEW.collaborators) = 'array' THEN
+                        INSERT INTO presentation_collaborators (user_id, presentation_id)
+                        SELECT u.id, NEW.id
+                        FROM users u
+                        WHERE u.id::text IN (SELECT json_array_elements_text(NEW.collaborators))
+                        ON CONFLICT DO NOTHING;
+                    END IF;
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql
+            """))
+            connection.execute(text("DROP TRIGGER IF EXISTS presentations_collaborators_insert ON presentations"))
+            connection.execute(text("""
+                CREATE TRIGGER presentations_collaborators_insert
+                AFTER INSERT ON presentations
+                FOR EACH ROW EXECUTE FUNCTION presentations_sync_collaborators()
+            """))
+            connection.execute(text("DROP TRIGGER IF EXISTS presentations_collaborators_update ON presentations"))
+            connection.execute(text("""
+                CREATE TRIGGER presentations_collaborators_update
+                AFTER UPDATE OF collaborators ON presentations
+                FOR EACH ROW WHEN (OLD.collaborators::text IS DISTINCT FROM NEW.collaborators::text)
+                EXECUTE FUNCTION presentations_sync_collaborators()
+            """))
+
+            # Backfill from the existing collaborators arrays
+            connection.execute(text("""
+                INSERT INTO presentation_collaborators (user_id, presentation_id)
+                SELECT u.id, p.id
+                FROM presentations p
+                CROSS JOIN LATERAL json_array_elements_text(
+                    CASE WHEN json_typeof(p.collaborators) = 'array' THEN p.collaborators END
+                ) AS c(user_id)
+                JOIN users u ON u.id::text = c.user_id
+                ON CONFLICT DO NOTHING
+            """))
+
+            connection.commit()
+            print("✅ Successfully created and backfilled presentation_collaborators")
+            return True
+
+    except Exception as e:
+        print(f"❌ Error creating presentation collaborators: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🔧 Creating presentation_collaborators table and trigger...")
+    success = add_presentation_collaborators()
+    if not success:
+        sys.exit(1)
@@ -55,13 +55,14 @@ def login_for_access_token(
 
     if not user:
         # Track failed attempt
-        security.security_monitor.track_failed_attempt(form_data.username)
+        locked = security.security_monitor.track_failed_attempt_and_check_lock(form_data.username)
 
         logger.warning(
             "Failed login attempt",
             email=form_data.username,
             client_ip=client_ip,
-            user_agent=user_agent
+            user_agent=user_agent,
+            account_locked=locked
         )
 
         raise HTTPException(
@@ -152,12 +153,13 @@ def login_json(
 
     if not user:
         # Track failed attempt
-        security.security_monitor.track_failed_attempt(user_in.email)
+        locked = security.security_monitor.track_failed_attempt_and_check_lock(user_in.email)
 
         logger.warning(
             "Failed JSON login attempt",
             email=user_in.email,
-            client_ip=client_ip
+            client_ip=client_ip,
+            account_locked=locked
         )
 
         raise HTTPException(
@@ -1,7 +1,8 @@
 """
 Client management endpoints
 """
-from typing import Any, List
+from datetime import datetime
+from typing import Any, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -24,6 +25,12 @@ def read_clients(
     client_type: str = Query(None, description="Filter by client type"),
     industry: str = Query(None, description="Filter by industry"),
     search: str = Query(None, description="Search by name or company"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="Search pagination: created_at of the last client on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Search pagination: id of the last client on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -35,7 +42,9 @@ def read_clients(
             organization_id=current_user.organization_id,
             query=search,
             skip=skip,
-            limit=limit
+            limit=limit,
+            before_created_at=before_created_at,
+            before_id=before_id
         )
     else:
         clients = crud_client.get_by_organization(
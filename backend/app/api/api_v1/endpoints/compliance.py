@@ -173,14 +173,22 @@ def get_overdue_requirements(
     db: Session = Depends(get_db),
     current_user: User = Depends(deps.get_current_active_user),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    after_due_date: Optional[datetime] = Query(
+        None, description="Pagination: due_date of the last requirement on the previous page"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last requirement on the previous page"
+    )
 ):
     """Get overdue compliance requirements"""
     requirements = crud_compliance_requirement.get_overdue(
         db,
         organization_id=current_user.organization_id,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after_due_date=after_due_date,
+        after_id=after_id
     )
     return requirements
 
@@ -191,7 +199,13 @@ def get_upcoming_reviews(
     current_user: User = Depends(deps.get_current_active_user),
     days_ahead: int = Query(30, ge=1, le=365),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=1000),
+    after_review_date: Optional[datetime] = Query(
+        None, description="Pagination: next_review_date of the last requirement on the previous page"
+    ),
+    after_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last requirement on the previous page"
+    )
 ):
     """Get requirements with upcoming reviews"""
     requirements = crud_compliance_requirement.get_upcoming_reviews(
@@ -199,7 +213,9 @@ def get_upcoming_reviews(
         organization_id=current_user.organization_id,
         days_ahead=days_ahead,
         skip=skip,
-        limit=limit
+        limit=limit,
+        after_review_date=after_review_date,
+        after_id=after_id
     )
     return requirements
 
@@ -1,7 +1,8 @@
 """
 Deal management endpoints
 """
-from typing import Any, List
+from datetime import datetime
+from typing import Any, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
@@ -27,6 +28,12 @@ def read_deals(
     limit: int = 100,
     stage: str = Query(None, description="Filter by deal stage"),
     status: str = Query(None, description="Filter by deal status"),
+    before_updated_at: Optional[datetime] = Query(
+        None, description="Pagination: updated_at of the last deal on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last deal on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -36,7 +43,7 @@ def read_deals(
     cache_key = cache_service._generate_key(
         "deals_list",
         str(current_user.organization_id),
-        skip, limit, stage, status
+        skip, limit, stage, status, before_updated_at, before_id
     )
 
     # Try cache first
@@ -52,7 +59,9 @@ def read_deals(
         limit=limit,
         stage=stage,
         status=status,
-        include_relations=True
+        include_relations=True,
+        before_updated_at=before_updated_at,
+        before_id=before_id
     )
 
     # Cache the result
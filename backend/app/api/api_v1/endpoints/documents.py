@@ -1,7 +1,7 @@
 """
 Document management endpoints
 """
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -35,6 +35,12 @@ def read_documents(
     document_type: str = Query(None, description="Filter by document type"),
     deal_id: UUID = Query(None, description="Filter by deal"),
     status: str = Query(None, description="Filter by status"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="Pagination: created_at of the last document on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last document on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -47,7 +53,9 @@ def read_documents(
         limit=limit,
         document_type=document_type,
         deal_id=deal_id,
-        status=status
+        status=status,
+        before_created_at=before_created_at,
+        before_id=before_id
     )
     return documents
 
@@ -806,7 +814,7 @@ async def download_document(
 
     try:
         # Update download count
-        crud_document.increment_download_count(db, document_id)
+        document = crud_document.increment_download_count(db, document_id) or document
 
         # Generate secure download URL
         if use_cdn and cdn_service.is_enabled():
@@ -837,7 +845,7 @@ async def download_document(
                 "document_type": document.document_type,
                 "is_confidential": document.is_confidential,
                 "last_modified": file_metadata.get("last_modified"),
-                "download_count": document.download_count + 1
+                "download_count": document.download_count
             }
         }
 
@@ -1134,6 +1142,12 @@ def get_risk_assessments(
     limit: int = Query(100, ge=1, le=1000),
     assessment_type: str = Query(None, description="Filter by assessment type"),
     risk_level: str = Query(None, description="Filter by risk level"),
+    before_assessment_date: Optional[datetime] = Query(
+        None, description="Pagination: assessment_date of the last assessment on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last assessment on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -1147,7 +1161,10 @@ def get_risk_assessments(
         skip=skip,
         limit=limit,
         assessment_type=assessment_type,
-        risk_level=risk_level
+        risk_level=risk_level,
+        before_assessment_date=before_assessment_date,
+        before_id=before_id,
+        summary_only=True
     )
 
     return [
@@ -1316,7 +1333,8 @@ def get_high_risk_documents(
         db=db,
         organization_id=current_user.organization_id,
         risk_threshold=risk_threshold,
-        limit=limit
+        limit=limit,
+        summary_only=True
     )
 
     results = []
@@ -69,8 +69,8 @@ def get_prospects(
         sort_order=sort_order
     )
     
-    # Get prospects
-    prospects = crud_prospect.get_by_organization(
+    # Get prospects and the total count in one query
+    prospects, total = crud_prospect.get_page_by_organization(
         db=db,
         organization_id=current_user.organization_id,
         skip=skip,
@@ -78,13 +78,6 @@ def get_prospects(
         filters=filters
     )
     
-    # Get total count
-    total = crud_prospect.count_by_organization(
-        db=db,
-        organization_id=current_user.organization_id,
-        filters=filters
-    )
-    
     return ProspectListResponse(
         prospects=prospects,
         total=total,
@@ -105,13 +98,11 @@ def create_prospect(
     Create new prospect
     """
     # Check if prospect already exists
-    existing_prospect = crud_prospect.get_by_company_name(
+    if crud_prospect.exists_by_company_name(
         db=db,
         company_name=prospect_in.company_name,
         organization_id=current_user.organization_id
-    )
-    
-    if existing_prospect:
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Prospect with this company name already exists"
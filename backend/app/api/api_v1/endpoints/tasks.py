@@ -1,8 +1,9 @@
 """
 Task management endpoints
 """
-from typing import Any, List
+from typing import Any, List, Optional
 from uuid import UUID
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
@@ -25,6 +26,12 @@ def read_tasks(
     priority: str = Query(None, description="Filter by priority"),
     assignee_id: UUID = Query(None, description="Filter by assignee"),
     deal_id: UUID = Query(None, description="Filter by deal"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="Pagination: created_at of the last task on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last task on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -38,7 +45,9 @@ def read_tasks(
         status=status,
         priority=priority,
         assignee_id=assignee_id,
-        deal_id=deal_id
+        deal_id=deal_id,
+        before_created_at=before_created_at,
+        before_id=before_id
     )
     return tasks
 
@@ -67,6 +76,12 @@ def read_my_tasks(
     skip: int = 0,
     limit: int = 100,
     status: str = Query(None, description="Filter by task status"),
+    before_created_at: Optional[datetime] = Query(
+        None, description="Pagination: created_at of the last task on the previous page"
+    ),
+    before_id: Optional[UUID] = Query(
+        None, description="Pagination: id of the last task on the previous page"
+    ),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
@@ -77,7 +92,9 @@ def read_my_tasks(
         assignee_id=current_user.id,
         skip=skip,
         limit=limit,
-        status=status
+        status=status,
+        before_created_at=before_created_at,
+        before_id=before_id
     )
     return tasks
 
@@ -0,0 +1,11 @@
+"""
+Shared .env loading for DealVerse OS settings
+"""
+from dotenv import load_dotenv
+
+ENV_FILE = ".env"
+
+# Parse .env once per process into os.environ (variables already set in the
+# real environment take precedence), so Settings and AISettings both read from
+# the environment instead of each opening and parsing the file.
+load_dotenv(ENV_FILE, override=False)
@@ -2,10 +2,20 @@
 AI Configuration for DealVerse OS
 """
 import os
-from typing import Dict, Any, Optional
+import sys
+from collections.abc import Mapping as MappingABC
+from functools import cached_property, lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Mapping, Optional, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+import app.core._env  # noqa: F401  (loads .env into os.environ)
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class AISettings(BaseSettings):
     """AI service configuration settings"""
@@ -49,10 +59,74 @@ class AISettings(BaseSettings):
     enable_financial_analysis: bool = Field(default=True, env="ENABLE_FINANCIAL_ANALYSIS")
     
     class Config:
-        env_file = ".env"
+        env_file = None  # .env is loaded once by app.core._env
         case_sensitive = False
         extra = "ignore"  # Ignore extra environment variables
 
+    # Request-invariant OpenRouter values, resolved once per settings instance
+    @cached_property
+    def openrouter_chat_completions_url(self) -> str:
+        """Fully resolved OpenRouter chat completions endpoint"""
+        return f"{self.openrouter_base_url.rstrip('/')}/chat/completions"
+
+    @cached_property
+    def openrouter_default_headers(self) -> Mapping[str, str]:
+        """Read-only attribution headers sent with every OpenRouter request"""
+        return MappingProxyType({
+            "HTTP-Referer": self.openrouter_site_url or "https://dealverse.com",
+            "X-Title": self.openrouter_site_name or "DealVerse OS - AI Document Analysis"
+        })
+
+
+# Long prompt templates live as text resources next to this module and are
+# only read from disk the first time a caller asks for them.
+_PROMPTS_DIR = Path(__file__).with_name("prompts")
+_TEMPLATE_CACHE: Dict[str, str] = {}
+
+
+class _LazyTemplate:
+    """Placeholder for a prompt template stored in ``prompts/<name>.txt``"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def load(self) -> str:
+        template = _TEMPLATE_CACHE.get(self.name)
+        if template is None:
+            path = _PROMPTS_DIR / f"{self.name}.txt"
+            template = path.read_text(encoding="utf-8").rstrip("\n")
+            _TEMPLATE_CACHE[self.name] = template
+        return template
+
+
+def _lazy_template(name: str) -> _LazyTemplate:
+    return _LazyTemplate(name)
+
+
+class _PromptSection(MappingABC):
+    """Read-only prompt mapping that resolves lazy templates on first access"""
+
+    def __init__(self, entries: Dict[str, Any]):
+        self._entries = entries
+
+    def __getitem__(self, key: str) -> str:
+        value = self._entries[key]
+        if isinstance(value, _LazyTemplate):
+            value = value.load()
+            self._entries[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 # AI Prompts Configuration
 AI_PROMPTS = {
@@ -68,48 +142,7 @@ Key responsibilities:
 
 Always provide specific, quantifiable insights and flag any uncertainties or missing information.""",
         
-        "user_template": """Analyze the following document content and provide a comprehensive analysis:
-
-Document Type: {document_type}
-Document Title: {document_title}
-Analysis Type: {analysis_type}
-
-Content:
-{document_content}
-
-IMPORTANT: Respond with valid JSON in this exact structure:
-{{
-  "executive_summary": {{
-    "summary": "2-3 sentence overview",
-    "key_findings": ["finding1", "finding2", "finding3"],
-    "confidence_score": 0.95
-  }},
-  "financial_analysis": {{
-    "revenue_metrics": [{{"metric": "name", "value": "amount", "confidence": 0.9}}],
-    "cost_analysis": "analysis text",
-    "profitability": "analysis text",
-    "key_ratios": [{{"ratio": "name", "value": "number", "confidence": 0.85}}]
-  }},
-  "risk_assessment": {{
-    "overall_risk_level": "Low|Medium|High|Critical",
-    "risk_score": 0.75,
-    "identified_risks": [{{"type": "Financial|Operational|Legal|Strategic", "description": "details", "severity": "Low|Medium|High|Critical", "confidence": 0.8}}]
-  }},
-  "extracted_entities": {{
-    "organizations": [{{"name": "Company Name", "type": "corporation|partnership|llc", "confidence": 0.9}}],
-    "people": [{{"name": "John Doe", "role": "CEO|CFO|Director", "confidence": 0.95}}],
-    "financial_amounts": [{{"amount": "$1,000,000", "context": "revenue|cost|investment", "confidence": 0.85}}],
-    "dates": [{{"date": "2024-01-01", "context": "contract|deadline|milestone", "confidence": 0.9}}]
-  }},
-  "compliance_flags": [{{"issue": "description", "severity": "Low|Medium|High|Critical", "regulation": "SEC|SOX|GDPR|Other", "recommendation": "action needed", "confidence": 0.8}}],
-  "recommendations": {{
-    "immediate_actions": ["action1", "action2"],
-    "further_investigation": ["area1", "area2"],
-    "strategic_considerations": ["consideration1", "consideration2"]
-  }}
-}}
-
-Ensure all confidence scores are between 0.0 and 1.0. Be precise and analytical."""
+        "user_template": _lazy_template("document_analysis_user")
     },
     
     "entity_extraction": {
@@ -182,49 +215,7 @@ Flag any compliance issues with severity levels and recommendations."""
 
         Provide data-driven analysis with confidence scores and actionable recommendations.""",
 
-        "user_template": """Analyze the following company prospect for M&A potential:
-
-{company_profile}
-
-Analysis Type: {analysis_type}
-
-Provide comprehensive prospect analysis in this JSON format:
-{{
-  "ai_score": 85,
-  "confidence": 0.92,
-  "financial_health": 88,
-  "market_position": 82,
-  "growth_potential": 90,
-  "strategic_fit": 85,
-  "deal_probability": 78,
-  "deal_size_multiplier": 1.2,
-  "risk_factors": [
-    "Market volatility in target industry",
-    "Integration complexity due to technology stack",
-    "Regulatory approval requirements"
-  ],
-  "opportunities": [
-    "Strong market position with growth runway",
-    "Synergies with existing portfolio companies",
-    "Expansion into new geographic markets"
-  ],
-  "key_metrics": {{
-    "revenue_growth_rate": "25%",
-    "profit_margins": "18%",
-    "market_share": "12%",
-    "customer_retention": "94%"
-  }},
-  "strategic_recommendations": [
-    "Immediate engagement recommended",
-    "Focus on technology integration planning",
-    "Conduct thorough regulatory review"
-  ],
-  "valuation_insights": {{
-    "estimated_multiple": "8.5x EBITDA",
-    "comparable_deals": ["Deal A: 7.2x", "Deal B: 9.1x"],
-    "premium_justification": "Market leadership and growth trajectory"
-  }}
-}}"""
+        "user_template": _lazy_template("prospect_analysis_user")
     },
 
     "financial_modeling": {
@@ -241,52 +232,7 @@ Provide comprehensive prospect analysis in this JSON format:
 
         Provide detailed, actionable insights for model improvement and validation.""",
 
-        "user_template": """Analyze the following financial model for accuracy and optimization opportunities:
-
-{model_data}
-
-Analysis Type: {analysis_type}
-
-Provide comprehensive financial model analysis in this JSON format:
-{{
-  "model_quality_score": 85,
-  "key_insights": [
-    "Revenue growth assumptions appear reasonable for the industry",
-    "EBITDA margin expansion is achievable based on operational improvements",
-    "Discount rate is appropriate for the risk profile"
-  ],
-  "risk_factors": [
-    "High sensitivity to revenue growth assumptions",
-    "Terminal value represents significant portion of total value",
-    "Market multiple compression risk in downturn"
-  ],
-  "optimization_opportunities": [
-    "Add working capital detail to improve accuracy",
-    "Include management case scenario",
-    "Enhance sensitivity analysis for key variables"
-  ],
-  "assumption_analysis": {{
-    "revenue_growth": "reasonable",
-    "margin_assumptions": "optimistic",
-    "discount_rate": "market_appropriate",
-    "terminal_growth": "conservative"
-  }},
-  "valuation_reasonableness": "reasonable",
-  "recommended_scenarios": [
-    "Conservative case with 20% lower growth",
-    "Stress test with recession assumptions",
-    "Upside case with market expansion"
-  ],
-  "calculation_checks": {{
-    "dcf_methodology": "correct",
-    "terminal_value": "reasonable",
-    "working_capital": "needs_detail",
-    "tax_assumptions": "appropriate"
-  }},
-  "confidence_level": "high"
-}}
-
-Ensure all assessments are specific and actionable for model improvement."""
+        "user_template": _lazy_template("financial_modeling_user")
     },
 
     "compliance_monitoring": {
@@ -313,6 +259,13 @@ Provide comprehensive compliance analysis in this JSON format:
     }
 }
 
+# Intern prompt and section keys so lookups from call sites compare by identity
+AI_PROMPTS = {
+    sys.intern(key): _PromptSection({sys.intern(name): value for name, value in section.items()})
+    for key, section in AI_PROMPTS.items()
+}
+_EMPTY_PROMPT_SECTION = _PromptSection({})
+
 # Risk scoring configuration
 RISK_SCORING_CONFIG = {
     "weights": {
@@ -329,6 +282,10 @@ RISK_SCORING_CONFIG = {
     }
 }
 
+# Column order of the risk scoring vectors; the dicts above stay the source of truth
+RISK_CATEGORIES: Tuple[str, ...] = tuple(RISK_SCORING_CONFIG["weights"])
+RISK_LEVELS: Tuple[str, ...] = tuple(RISK_SCORING_CONFIG["thresholds"])
+
 # Entity extraction configuration
 ENTITY_EXTRACTION_CONFIG = {
     "confidence_threshold": 0.7,
@@ -352,9 +309,62 @@ def get_ai_settings() -> AISettings:
     return AISettings()
 
 
+@lru_cache(maxsize=1)
+def get_risk_scoring_vectors() -> Tuple["np.ndarray", "np.ndarray"]:
+    """Get risk weights and level thresholds as arrays for batch scoring.
+
+    Weights follow ``RISK_CATEGORIES`` and thresholds follow ``RISK_LEVELS``, so
+    for an ``(n_documents, n_categories)`` matrix of category risks::
+
+        weights, thresholds = get_risk_scoring_vectors()
+        scores = doc_risks @ weights
+        levels = np.searchsorted(thresholds, scores)  # index into RISK_LEVELS
+
+    numpy is imported on first call to keep it off the config import path.
+    """
+    import numpy as np
+
+    weights = np.array(
+        [RISK_SCORING_CONFIG["weights"][category] for category in RISK_CATEGORIES],
+        dtype=np.float32
+    )
+    thresholds = np.array(
+        [RISK_SCORING_CONFIG["thresholds"][level] for level in RISK_LEVELS],
+        dtype=np.float32
+    )
+    weights.setflags(write=False)
+    thresholds.setflags(write=False)
+    return weights, thresholds
+
+
 def get_ai_prompt(prompt_type: str, analysis_type: str = "system") -> str:
     """Get AI prompt template"""
-    return AI_PROMPTS.get(prompt_type, {}).get(analysis_type, "")
+    return AI_PROMPTS.get(prompt_type, _EMPTY_PROMPT_SECTION).get(analysis_type, "")
+
+
+# Renders whose arguments include a string longer than this bypass the cache so
+# large document bodies are not retained by it.
+_RENDER_CACHE_MAX_ARG_LENGTH = 2048
+
+
+@lru_cache(maxsize=256)
+def _render(prompt_type: str, kwargs_tuple: Tuple[Tuple[str, Any], ...]) -> str:
+    return get_ai_prompt(prompt_type, "user_template").format(**dict(kwargs_tuple))
+
+
+def render_prompt(prompt_type: str, /, **kwargs: Any) -> str:
+    """Render the user template of an AI prompt, memoising repeated small renders"""
+    cacheable = all(
+        not isinstance(value, str) or len(value) <= _RENDER_CACHE_MAX_ARG_LENGTH
+        for value in kwargs.values()
+    )
+    if cacheable:
+        try:
+            return _render(prompt_type, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable argument (dict, list, ...); render without caching
+            pass
+    return get_ai_prompt(prompt_type, "user_template").format(**kwargs)
 
 
 def validate_ai_configuration() -> Dict[str, Any]:
@@ -2,15 +2,22 @@
 Security utilities for authentication and authorization
 Enhanced with JWT token rotation, blacklisting, and security hardening
 """
-import hashlib
+import base64
 import secrets
+import hashlib
+import hmac
+import re
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional, Set, Dict
+from typing import Any, Union, Optional, Set, Dict, Tuple
+import jwt
+import orjson
 import redis
 import structlog
 
-from jose import jwt, JWTError
+from cachetools import TTLCache
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -20,23 +27,109 @@ from app.core.config import settings
 # Configure structured logging
 logger = structlog.get_logger()
 
-# Password hashing with enhanced security
+# Token settings resolved once at import instead of on every token operation
+_SECRET = settings.SECRET_KEY
+_ALGO = settings.ALGORITHM
+_ALGORITHMS = [_ALGO]
+_ISS = settings.PROJECT_NAME
+_REQUIRED_CLAIMS = ["exp", "iat", "sub", "jti", "iss", "type"]
+_RESERVED_CLAIMS = frozenset(_REQUIRED_CLAIMS)
+_ACCESS_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+_ACCESS_TTL_SECS = int(_ACCESS_TTL.total_seconds())
+_REFRESH_TTL_SECS = int(_REFRESH_TTL.total_seconds())
+
+# Every token we issue has the same claim layout, so for the HMAC algorithms
+# the header and the constant payload prefix are serialized once here and
+# new tokens are assembled from pre-formatted JSON fragments
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_HMAC_DIGEST = _HMAC_DIGESTS.get(_ALGO)
+_SECRET_BYTES = _SECRET.encode("utf-8")
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_JWT_HEADER_B64 = _b64url(orjson.dumps({"alg": _ALGO, "typ": "JWT"}))
+_PAYLOAD_PREFIXES = {
+    token_type: b'{"type":' + orjson.dumps(token_type) + b',"iss":' + orjson.dumps(_ISS)
+    for token_type in ("access", "refresh")
+}
+
+
+def _encode_token(
+    token_type: str,
+    exp_ts: int,
+    iat_ts: int,
+    sub: str,
+    jti: str,
+    extra_claims: Dict[str, Any]
+) -> str:
+    """Encode a token with the fixed claim layout
+
+    ``extra_claims`` must not repeat the fixed claim names; callers reject
+    them before encoding. Non-HMAC algorithms go through PyJWT.
+    """
+    if _HMAC_DIGEST is None:
+        claims = {"type": token_type, "iss": _ISS, "exp": exp_ts, "iat": iat_ts, "sub": sub, "jti": jti}
+        claims.update(extra_claims)
+        return jwt.encode(claims, _SECRET, algorithm=_ALGO)
+
+    parts = [
+        _PAYLOAD_PREFIXES[token_type],
+        b',"exp":%d,"iat":%d,"sub":' % (exp_ts, iat_ts),
+        orjson.dumps(sub),
+        b',"jti":',
+        orjson.dumps(jti),
+    ]
+    for name, value in extra_claims.items():
+        parts += (b",", orjson.dumps(name), b":", orjson.dumps(value))
+    parts.append(b"}")
+
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(b"".join(parts))
+    signature = hmac.new(_SECRET_BYTES, signing_input, _HMAC_DIGEST).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+# Password hashing with enhanced security: new hashes use Argon2id, existing
+# bcrypt hashes still verify and are upgraded on the next successful login
 pwd_context = CryptContext(
-    schemes=["bcrypt"],
+    schemes=["argon2", "bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12  # Increased rounds for better security
+    argon2__type="ID",
+    argon2__memory_cost=19456,  # KiB (19 MiB)
+    argon2__time_cost=2,
+    argon2__parallelism=1,
+    bcrypt__rounds=12
 )
 
+# Recently verified (password, hash) pairs; repeat checks within the TTL skip the
+# slow hash. Only successful verifications are cached.
+_verified_passwords: TTLCache = TTLCache(maxsize=10000, ttl=60)
+_verified_passwords_lock = threading.Lock()
+
 # JWT Security
 security = HTTPBearer()
 
 # Redis connection for token blacklisting and session management
+# A bounded, blocking pool shared by all request handlers in the worker; redis-py
+# picks the C hiredis parser automatically when the hiredis package is installed.
 try:
-    redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    redis_pool = redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        decode_responses=True,
+        max_connections=50,
+        timeout=5,  # Seconds to wait for a free connection
+        socket_keepalive=True,
+        health_check_interval=30
+    )
+    redis_client = redis.Redis(connection_pool=redis_pool)
     redis_client.ping()  # Test connection
     logger.info("Redis connection established for token management")
 except Exception as e:
     logger.warning("Redis connection failed, token blacklisting disabled", error=str(e))
+    redis_pool = None
     redis_client = None
 
 # Token blacklist and session management
@@ -47,39 +140,116 @@ class TokenManager:
         self.redis_client = redis_client
         self.blacklist_prefix = "dealverse:blacklist:"
         self.session_prefix = "dealverse:session:"
+        self.user_sessions_prefix = "dealverse:user_sessions:"
         self.failed_attempts_prefix = "dealverse:failed_attempts:"
 
-    def add_to_blacklist(self, token: str, expires_at: datetime) -> None:
-        """Add token to blacklist"""
+        # Process-local cache of blacklist lookups in front of Redis. Positive
+        # entries are safe to keep (a blacklisted token never becomes valid
+        # again); negative entries are short-lived, bounding how long another
+        # worker's revocation can go unnoticed here.
+        self._blacklist_pos_cache: TTLCache = TTLCache(maxsize=50_000, ttl=300)
+        self._blacklist_neg_cache: TTLCache = TTLCache(maxsize=50_000, ttl=30)
+        self._blacklist_cache_lock = threading.Lock()
+
+    def _cached_blacklist_status(self, token_id: str) -> Optional[bool]:
+        """Blacklist status from the local cache, or None if unknown"""
+        with self._blacklist_cache_lock:
+            if token_id in self._blacklist_pos_cache:
+                return True
+            if token_id in self._blacklist_neg_cache:
+                return False
+        return None
+
+    def _remember_blacklist_status(self, token_id: str, blacklisted: bool) -> None:
+        with self._blacklist_cache_lock:
+            if blacklisted:
+                self._blacklist_pos_cache[token_id] = True
+                self._blacklist_neg_cache.pop(token_id, None)
+            else:
+                self._blacklist_neg_cache[token_id] = True
+
+    def add_to_blacklist(self, payload: Dict[str, Any], exp_ts: int) -> None:
+        """Add token to blacklist, keyed by its ``jti`` claim"""
         if not self.redis_client:
             return
 
         try:
+            token_id = payload.get("jti")
             # Calculate TTL based on token expiration
-            ttl = int((expires_at - datetime.utcnow()).total_seconds())
-            if ttl > 0:
-                token_hash = hashlib.sha256(token.encode()).hexdigest()
+            ttl = int(exp_ts) - int(time.time())
+            if ttl > 0 and token_id:
                 self.redis_client.setex(
-                    f"{self.blacklist_prefix}{token_hash}",
+                    f"{self.blacklist_prefix}{token_id}",
                     ttl,
                     "blacklisted"
                 )
-                logger.info("Token added to blacklist", token_hash=token_hash[:16])
+                self._remember_blacklist_status(token_id, True)
+                logger.info("Token added to blacklist", token_id=token_id[:16])
         except Exception as e:
             logger.error("Failed to blacklist token", error=str(e))
 
-    def is_blacklisted(self, token: str) -> bool:
-        """Check if token is blacklisted"""
+    def is_blacklisted(self, payload: Dict[str, Any]) -> bool:
+        """Check if the token with this decoded payload is blacklisted"""
         if not self.redis_client:
             return False
 
         try:
-            token_hash = hashlib.sha256(token.encode()).hexdigest()
-            return self.redis_client.exists(f"{self.blacklist_prefix}{token_hash}")
+            token_id = payload.get("jti")
+            if not token_id:
+                return False
+            cached = self._cached_blacklist_status(token_id)
+            if cached is not None:
+                return cached
+            blacklisted = bool(self.redis_client.exists(f"{self.blacklist_prefix}{token_id}"))
+            self._remember_blacklist_status(token_id, blacklisted)
+            return blacklisted
         except Exception as e:
             logger.error("Failed to check token blacklist", error=str(e))
             return False
 
+    def verify_bundle(
+        self,
+        token_id: str,
+        user_id: str,
+        session_id: Optional[str] = None
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Fetch blacklist status and session data in at most one Redis round-trip
+
+        Blacklist status is served from the process-local cache when known.
+        """
+        if not self.redis_client or not token_id:
+            return False, None
+
+        cached = self._cached_blacklist_status(token_id)
+        if cached or (cached is False and not session_id):
+            return cached, None
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            if cached is None:
+                pipe.exists(f"{self.blacklist_prefix}{token_id}")
+            if session_id:
+                pipe.get(f"{self.session_prefix}{user_id}:{session_id}")
+            results = pipe.execute()
+        except Exception as e:
+            logger.error("Failed to check token blacklist", error=str(e))
+            return False, None
+
+        if cached is None:
+            blacklisted = bool(results.pop(0))
+            self._remember_blacklist_status(token_id, blacklisted)
+        else:
+            blacklisted = cached
+
+        session_data = None
+        if session_id and results[0] is not None:
+            try:
+                session_data = orjson.loads(results[0])
+            except orjson.JSONDecodeError:
+                # Sessions written before JSON encoding are not decodable
+                logger.debug("Undecodable session data", session_id=session_id[:16])
+        return blacklisted, session_data
+
     def create_session(self, user_id: str, session_data: Dict[str, Any]) -> str:
         """Create user session with unique session ID"""
         if not self.redis_client:
@@ -88,13 +258,16 @@ class TokenManager:
         try:
             session_id = str(uuid.uuid4())
             session_key = f"{self.session_prefix}{user_id}:{session_id}"
+            user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
+            ttl = _REFRESH_TTL_SECS  # Same as refresh token
 
-            # Store session data with TTL
-            self.redis_client.setex(
-                session_key,
-                settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600,  # Same as refresh token
-                str(session_data)
-            )
+            # Store session data with TTL and track the session ID per user so
+            # invalidate_all_sessions never has to walk the keyspace
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(session_key, ttl, orjson.dumps(session_data))
+            pipe.sadd(user_sessions_key, session_id)
+            pipe.expire(user_sessions_key, ttl)
+            pipe.execute()
 
             logger.info("Session created", user_id=user_id, session_id=session_id[:16])
             return session_id
@@ -109,7 +282,10 @@ class TokenManager:
 
         try:
             session_key = f"{self.session_prefix}{user_id}:{session_id}"
-            self.redis_client.delete(session_key)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.unlink(session_key)
+            pipe.srem(f"{self.user_sessions_prefix}{user_id}", session_id)
+            pipe.execute()
             logger.info("Session invalidated", user_id=user_id, session_id=session_id[:16])
         except Exception as e:
             logger.error("Failed to invalidate session", error=str(e))
@@ -120,10 +296,30 @@ class TokenManager:
             return
 
         try:
-            pattern = f"{self.session_prefix}{user_id}:*"
-            for key in self.redis_client.scan_iter(match=pattern):
-                self.redis_client.delete(key)
-            logger.info("All sessions invalidated", user_id=user_id)
+            user_sessions_key = f"{self.user_sessions_prefix}{user_id}"
+            session_ids = self.redis_client.smembers(user_sessions_key)
+            session_keys = [
+                f"{self.session_prefix}{user_id}:{session_id}" for session_id in session_ids
+            ]
+            # UNLINK frees memory asynchronously on the Redis side
+            self.redis_client.unlink(user_sessions_key, *session_keys)
+            count = len(session_keys)
+
+            # Sessions created before the per-user set existed are not in it;
+            # sweep them by pattern in batches. Can go once every such session
+            # has expired (one refresh token TTL after the set was introduced)
+            batch = []
+            for session_key in self.redis_client.scan_iter(
+                match=f"{self.session_prefix}{user_id}:*", count=500
+            ):
+                batch.append(session_key)
+                if len(batch) >= 500:
+                    count += self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                count += self.redis_client.unlink(*batch)
+
+            logger.info("All sessions invalidated", user_id=user_id, count=count)
         except Exception as e:
             logger.error("Failed to invalidate all sessions", error=str(e))
 
@@ -138,43 +334,32 @@ def create_access_token(
     additional_claims: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create JWT access token with enhanced security"""
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+    now_ts = int(time.time())
+    ttl_secs = int(expires_delta.total_seconds()) if expires_delta else _ACCESS_TTL_SECS
+    exp_ts = now_ts + ttl_secs
 
     # Generate unique token ID for tracking
-    token_id = str(uuid.uuid4())
-
-    # Base claims
-    to_encode = {
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "sub": str(subject),
-        "type": "access",
-        "jti": token_id,  # JWT ID for token tracking
-        "iss": settings.PROJECT_NAME,  # Issuer
-    }
+    token_id = secrets.token_hex(16)
 
-    # Add session ID if provided
+    # Optional claims appended after the fixed type/iss/exp/iat/sub/jti set
+    extra_claims: Dict[str, Any] = {}
     if session_id:
-        to_encode["sid"] = session_id
-
-    # Add additional claims if provided
+        extra_claims["sid"] = session_id
     if additional_claims:
-        to_encode.update(additional_claims)
+        # The encoder appends extra claims after the fixed ones, so a repeated
+        # name would produce duplicate JSON members (RFC 7519 section 4)
+        reserved = _RESERVED_CLAIMS.intersection(additional_claims)
+        if reserved:
+            raise ValueError(f"additional_claims must not set reserved claims: {sorted(reserved)}")
+        extra_claims.update(additional_claims)
 
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = _encode_token("access", exp_ts, now_ts, str(subject), token_id, extra_claims)
 
     logger.info(
         "Access token created",
         user_id=str(subject),
         token_id=token_id[:16],
-        expires_at=expire.isoformat()
+        expires_at=exp_ts
     )
 
     return encoded_jwt
@@ -185,33 +370,21 @@ def create_refresh_token(
     session_id: Optional[str] = None
 ) -> str:
     """Create JWT refresh token with enhanced security"""
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    now_ts = int(time.time())
+    exp_ts = now_ts + _REFRESH_TTL_SECS
 
     # Generate unique token ID
-    token_id = str(uuid.uuid4())
-
-    to_encode = {
-        "exp": expire,
-        "iat": datetime.utcnow(),
-        "sub": str(subject),
-        "type": "refresh",
-        "jti": token_id,
-        "iss": settings.PROJECT_NAME,
-    }
+    token_id = secrets.token_hex(16)
 
-    # Add session ID if provided
-    if session_id:
-        to_encode["sid"] = session_id
+    extra_claims: Dict[str, Any] = {"sid": session_id} if session_id else {}
 
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
+    encoded_jwt = _encode_token("refresh", exp_ts, now_ts, str(subject), token_id, extra_claims)
 
     logger.info(
         "Refresh token created",
         user_id=str(subject),
         token_id=token_id[:16],
-        expires_at=expire.isoformat()
+        expires_at=exp_ts
     )
 
     return encoded_jwt
@@ -222,41 +395,40 @@ def verify_token(
     token_type: str = "access",
     check_blacklist: bool = True
 ) -> Optional[Dict[str, Any]]:
-    """Verify JWT token and return payload with enhanced security checks"""
-    try:
-        # Check if token is blacklisted first
-        if check_blacklist and token_manager.is_blacklisted(token):
-            logger.warning("Blacklisted token used", token_hash=hashlib.sha256(token.encode()).hexdigest()[:16])
-            return None
+    """Verify JWT token and return payload with enhanced security checks
 
-        # Decode and verify token
+    When the token carries a session ID and the session exists, its stored data
+    is returned under the ``session`` key of the payload.
+    """
+    try:
+        # Decode and verify token; PyJWT enforces expiry, required claims and issuer
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": True, "verify_iat": True}
+            _SECRET,
+            algorithms=_ALGORITHMS,
+            issuer=_ISS,
+            options={"require": _REQUIRED_CLAIMS}
         )
 
-        # Validate required claims
-        token_sub: str = payload.get("sub")
-        token_type_claim: str = payload.get("type")
-        token_id: str = payload.get("jti")
-        issuer: str = payload.get("iss")
-
-        # Check required fields
-        if not all([token_sub, token_type_claim, token_id]):
-            logger.warning("Token missing required claims")
-            return None
+        token_sub: str = payload["sub"]
+        token_type_claim: str = payload["type"]
+        token_id: str = payload["jti"]
 
         # Verify token type
         if token_type_claim != token_type:
             logger.warning("Invalid token type", expected=token_type, actual=token_type_claim)
             return None
 
-        # Verify issuer
-        if issuer != settings.PROJECT_NAME:
-            logger.warning("Invalid token issuer", issuer=issuer)
-            return None
+        # Check blacklist by token ID and load the session in one round-trip
+        if check_blacklist:
+            blacklisted, session_data = token_manager.verify_bundle(
+                token_id, token_sub, payload.get("sid")
+            )
+            if blacklisted:
+                logger.warning("Blacklisted token used", token_id=token_id[:16])
+                return None
+            if session_data is not None:
+                payload["session"] = session_data
 
         # Log successful verification
         logger.debug(
@@ -285,9 +457,30 @@ def verify_token_simple(token: str, token_type: str = "access") -> Optional[str]
     return payload.get("sub") if payload else None
 
 
+def _password_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    return hashlib.blake2b(
+        f"{plain_password}\0{hashed_password}".encode(), digest_size=16
+    ).digest()
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    cache_key = _password_cache_key(plain_password, hashed_password)
+    with _verified_passwords_lock:
+        if cache_key in _verified_passwords:
+            return True
+
+    # The slow hash runs outside the lock so concurrent logins are not serialized
+    verified = pwd_context.verify(plain_password, hashed_password)
+    if verified:
+        with _verified_passwords_lock:
+            _verified_passwords[cache_key] = True
+    return verified
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check if a stored hash uses a deprecated scheme or parameters"""
+    return pwd_context.needs_update(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -316,15 +509,14 @@ def invalidate_token(token: str) -> None:
         # Decode token to get expiration
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+            _SECRET,
+            algorithms=_ALGORITHMS,
             options={"verify_exp": False}  # Don't verify expiration for blacklisting
         )
 
         exp_timestamp = payload.get("exp")
         if exp_timestamp:
-            expires_at = datetime.fromtimestamp(exp_timestamp)
-            token_manager.add_to_blacklist(token, expires_at)
+            token_manager.add_to_blacklist(payload, exp_timestamp)
 
             logger.info(
                 "Token invalidated",
@@ -343,12 +535,13 @@ def invalidate_all_user_tokens(user_id: str) -> None:
 
 def create_secure_session(user_id: str, user_agent: str = None, ip_address: str = None) -> str:
     """Create a secure session with metadata"""
+    now = datetime.utcnow().isoformat()
     session_data = {
         "user_id": user_id,
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now,
         "user_agent": user_agent or "unknown",
         "ip_address": ip_address or "unknown",
-        "last_activity": datetime.utcnow().isoformat()
+        "last_activity": now
     }
 
     return token_manager.create_session(user_id, session_data)
@@ -414,12 +607,40 @@ PERMISSIONS = {
 }
 
 
+# Frozen per-role permission sets for O(1) checks, and whether a role holds any
+# resource-wide "<resource>:all" grant
+_PERMISSION_SETS: Dict[str, frozenset] = {
+    role: frozenset(permissions) for role, permissions in PERMISSIONS.items()
+}
+_HAS_ALL: Dict[str, bool] = {
+    role: any(permission.endswith(":all") for permission in permissions)
+    for role, permissions in PERMISSIONS.items()
+}
+
+
 # Rate limiting and security monitoring
+# Increment a counter and start its expiry window on the first hit, atomically
+# and in a single round trip
+_INCR_WITH_EXPIRE_LUA = """
+local n = redis.call('INCR', KEYS[1])
+if n == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return n
+"""
+
+# Failed attempts are forgotten after 15 minutes
+_FAILED_ATTEMPTS_WINDOW_SECS = 900
+
+
 class SecurityMonitor:
     """Monitor and track security events"""
 
     def __init__(self):
         self.redis_client = redis_client
+        self._incr_script = (
+            redis_client.register_script(_INCR_WITH_EXPIRE_LUA) if redis_client else None
+        )
 
     def track_failed_attempt(self, identifier: str, attempt_type: str = "login") -> int:
         """Track failed authentication attempt"""
@@ -428,11 +649,7 @@ class SecurityMonitor:
 
         try:
             key = f"{token_manager.failed_attempts_prefix}{attempt_type}:{identifier}"
-            attempts = self.redis_client.incr(key)
-
-            # Set expiration for failed attempts (15 minutes)
-            if attempts == 1:
-                self.redis_client.expire(key, 900)
+            attempts = int(self._incr_script(keys=[key], args=[_FAILED_ATTEMPTS_WINDOW_SECS]))
 
             logger.warning(
                 "Failed authentication attempt",
@@ -476,17 +693,44 @@ class SecurityMonitor:
         attempts = self.get_failed_attempts(identifier)
         return attempts >= max_attempts
 
+    def track_failed_attempt_and_check_lock(
+        self,
+        identifier: str,
+        attempt_type: str = "login",
+        max_attempts: int = 5
+    ) -> bool:
+        """Track a failed attempt and return whether it locked the account
+
+        Uses the count returned by the increment, so no separate read is needed.
+        """
+        return self.track_failed_attempt(identifier, attempt_type) >= max_attempts
+
 # Initialize security monitor
 security_monitor = SecurityMonitor()
 
 
 def check_permission(user_role: str, required_permission: str) -> bool:
-    """Check if user role has required permission"""
-    user_permissions = PERMISSIONS.get(user_role, [])
-    return required_permission in user_permissions or "all" in user_permissions
+    """Check if user role has required permission
+
+    A ``<resource>:all`` grant covers every action on that resource.
+    """
+    permissions = _PERMISSION_SETS.get(user_role)
+    if not permissions:
+        return False
+    if required_permission in permissions:
+        return True
+    if not _HAS_ALL[user_role]:
+        return False
+    resource = required_permission.partition(":")[0]
+    return f"{resource}:all" in permissions
 
 
 # Enhanced password security
+_PASSWORD_SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+_COMMON_PASSWORD_PATTERNS = re.compile(r"123|abc|password|admin|user", re.IGNORECASE)
+_CHAR_UPPER, _CHAR_LOWER, _CHAR_DIGIT, _CHAR_SPECIAL = 1, 2, 4, 8
+
+
 def validate_password_strength(password: str) -> Dict[str, Any]:
     """Validate password strength and return detailed feedback"""
     result = {
@@ -513,34 +757,44 @@ def validate_password_strength(password: str) -> Dict[str, Any]:
         result["is_valid"] = False
         result["feedback"].append("Password must be at least 8 characters long")
 
-    # Check character types
-    if any(c.isupper() for c in password):
+    # Classify every character in a single pass
+    char_classes = 0
+    for c in password:
+        if c.isupper():
+            char_classes |= _CHAR_UPPER
+        elif c.islower():
+            char_classes |= _CHAR_LOWER
+        elif c.isdigit():
+            char_classes |= _CHAR_DIGIT
+        elif c in _PASSWORD_SPECIAL_CHARS:
+            char_classes |= _CHAR_SPECIAL
+
+    if char_classes & _CHAR_UPPER:
         result["score"] += 1
         result["requirements_met"]["uppercase"] = True
     else:
         result["feedback"].append("Password must contain at least one uppercase letter")
 
-    if any(c.islower() for c in password):
+    if char_classes & _CHAR_LOWER:
         result["score"] += 1
         result["requirements_met"]["lowercase"] = True
     else:
         result["feedback"].append("Password must contain at least one lowercase letter")
 
-    if any(c.isdigit() for c in password):
+    if char_classes & _CHAR_DIGIT:
         result["score"] += 1
         result["requirements_met"]["numbers"] = True
     else:
         result["feedback"].append("Password must contain at least one number")
 
-    if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
+    if char_classes & _CHAR_SPECIAL:
         result["score"] += 1
         result["requirements_met"]["special_chars"] = True
     else:
         result["feedback"].append("Password must contain at least one special character")
 
     # Check for common patterns
-    common_patterns = ["123", "abc", "password", "admin", "user"]
-    if not any(pattern in password.lower() for pattern in common_patterns):
+    if not _COMMON_PASSWORD_PATTERNS.search(password):
         result["score"] += 1
         result["requirements_met"]["no_common_patterns"] = True
     else:
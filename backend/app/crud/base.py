@@ -1,19 +1,42 @@
 """
 Base CRUD operations
 """
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import logging
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session, Query
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, Query, load_only
+from sqlalchemy import desc, exists as sa_exists, insert, inspect as sa_inspect
 
 from app.db.database import Base
 
+logger = logging.getLogger(__name__)
+
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# Rows fetched per round trip when a listing is streamed instead of loaded
+# into a list
+STREAM_BATCH_SIZE = 500
+
+# Upper bound on the rows a single listing call loads into memory
+MAX_PAGE_SIZE = 1000
+
+
+def clamp_limit(limit: int, *, strict: bool = False) -> int:
+    """Cap a listing ``limit`` at MAX_PAGE_SIZE
+
+    Larger limits are clamped with a warning, or rejected with ValueError
+    when ``strict`` is set.
+    """
+    if limit > MAX_PAGE_SIZE:
+        if strict:
+            raise ValueError(f"limit {limit} exceeds the maximum page size of {MAX_PAGE_SIZE}")
+        logger.warning("Clamping listing limit %s to %s", limit, MAX_PAGE_SIZE)
+        return MAX_PAGE_SIZE
+    return limit
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base CRUD class with default methods"""
@@ -28,9 +51,21 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        """Get a single record by ID"""
-        return db.query(self.model).filter(self.model.id == id).first()
+    def get(
+        self,
+        db: Session,
+        id: Any,
+        *,
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[ModelType]:
+        """Get a single record by ID
+
+        Pass ``fields`` to load only those columns (the rest are deferred).
+        """
+        query = db.query(self.model).filter(self.model.id == id)
+        if fields:
+            query = query.options(load_only(*(getattr(self.model, field) for field in fields)))
+        return query.first()
 
     def get_multi(
         self,
@@ -54,9 +89,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return query.offset(skip).limit(limit).all()
 
-    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
+    @staticmethod
+    def _to_model_data(obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> Dict[str, Any]:
+        """Plain dict of native Python values for the ORM constructor"""
+        if isinstance(obj_in, dict):
+            return obj_in
+        return obj_in.model_dump()
+
+    def create(self, db: Session, *, obj_in: Union[CreateSchemaType, Dict[str, Any]]) -> ModelType:
         """Create a new record"""
-        obj_in_data = jsonable_encoder(obj_in)
+        obj_in_data = self._to_model_data(obj_in)
         db_obj = self.model(**obj_in_data)  # type: ignore
         db.add(db_obj)
         db.commit()
@@ -71,19 +113,25 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
         """Update an existing record"""
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        self._apply_update(db_obj, obj_in)
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    @staticmethod
+    def _apply_update(db_obj: ModelType, obj_in: Union[UpdateSchemaType, Dict[str, Any]]) -> None:
+        """Set the submitted fields that map to model columns on ``db_obj``"""
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        # Only mapped columns: relationships and methods are never overwritten
+        columns = sa_inspect(type(db_obj)).column_attrs.keys()
+        for field, value in update_data.items():
+            if field in columns:
+                setattr(db_obj, field, value)
+
     def remove(self, db: Session, *, id: Any) -> ModelType:
         """Delete a record"""
         obj = db.query(self.model).get(id)
@@ -97,7 +145,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     def exists(self, db: Session, *, id: Any) -> bool:
         """Check if record exists"""
-        return db.query(self.model).filter(self.model.id == id).first() is not None
+        # SELECT EXISTS(...) resolves on the primary key index without fetching the row
+        return bool(db.query(sa_exists().where(self.model.id == id)).scalar())
 
     def get_by_field(
         self,
@@ -122,19 +171,30 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         return query.offset(skip).limit(limit).all()
 
-    def bulk_create(self, db: Session, *, objs_in: List[CreateSchemaType]) -> List[ModelType]:
-        """Create multiple records efficiently"""
-        db_objs = []
-        for obj_in in objs_in:
-            obj_in_data = jsonable_encoder(obj_in)
-            db_obj = self.model(**obj_in_data)  # type: ignore
-            db_objs.append(db_obj)
-
-        db.add_all(db_objs)
-        db.commit()
-
-        # Refresh all objects
-        for db_obj in db_objs:
-            db.refresh(db_obj)
+    def bulk_create(
+        self,
+        db: Session,
+        *,
+        objs_in: List[Union[CreateSchemaType, Dict[str, Any]]]
+    ) -> List[ModelType]:
+        """Create multiple records efficiently
 
-        return db_objs
+        Uses a single ORM-enabled INSERT ... RETURNING, so the returned objects
+        already hold server-generated values and need no per-row refresh.
+        """
+        if not objs_in:
+            return []
+
+        rows = [self._to_model_data(obj_in) for obj_in in objs_in]
+        db_objs = db.scalars(insert(self.model).returning(self.model), rows).all()
+
+        # Keep the RETURNING values loaded instead of expiring them on commit,
+        # which would lazily re-SELECT every row on first attribute access
+        expire_on_commit = db.expire_on_commit
+        db.expire_on_commit = False
+        try:
+            db.commit()
+        finally:
+            db.expire_on_commit = expire_on_commit
+
+        return list(db_objs)
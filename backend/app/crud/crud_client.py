@@ -1,10 +1,11 @@
 """
 CRUD operations for Client model
 """
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, tuple_
 
 from app.crud.base import CRUDBase
 from app.models.client import Client
@@ -45,11 +46,18 @@ class CRUDClient(CRUDBase[Client, ClientCreate, ClientUpdate]):
         organization_id: UUID,
         query: str,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Client]:
-        """Search clients by name, company, or email"""
+        """Search clients by name, company, or email, newest first
+
+        Pass the ``created_at`` and ``id`` of the last client from the previous
+        page as ``before_created_at``/``before_id`` to seek past it instead of
+        scanning and discarding ``skip`` rows.
+        """
         search_filter = f"%{query}%"
-        return (
+        search_query = (
             db.query(Client)
             .filter(
                 and_(
@@ -61,56 +69,79 @@ class CRUDClient(CRUDBase[Client, ClientCreate, ClientUpdate]):
                     )
                 )
             )
-            .offset(skip)
-            .limit(limit)
-            .all()
+            # id breaks created_at ties so the seek never skips or repeats a row
+            .order_by(Client.created_at.desc(), Client.id.desc())
         )
+        if before_created_at is not None and before_id is not None:
+            search_query = search_query.filter(
+                tuple_(Client.created_at, Client.id) < (before_created_at, before_id)
+            )
+        elif skip:
+            search_query = search_query.offset(skip)
+        return search_query.limit(limit).all()
     
     def get_recent_clients(
-        self, db: Session, *, organization_id: UUID, limit: int = 10
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        limit: int = 10,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Client]:
-        """Get recent clients for organization"""
-        return (
-            db.query(Client)
-            .filter(Client.organization_id == organization_id)
-            .order_by(Client.created_at.desc())
-            .limit(limit)
-            .all()
-        )
+        """Get recent clients for organization, optionally older than the given client"""
+        query = db.query(Client).filter(Client.organization_id == organization_id)
+        if before_created_at is not None and before_id is not None:
+            query = query.filter(tuple_(Client.created_at, Client.id) < (before_created_at, before_id))
+        return query.order_by(Client.created_at.desc(), Client.id.desc()).limit(limit).all()
     
     def get_organization_stats(self, db: Session, *, organization_id: UUID) -> Dict[str, Any]:
         """Get client statistics for organization"""
         
-        # Basic counts
-        total_clients = db.query(Client).filter(Client.organization_id == organization_id).count()
-        prospects = db.query(Client).filter(
-            and_(Client.organization_id == organization_id, Client.client_type == "prospect")
-        ).count()
-        active_clients = db.query(Client).filter(
-            and_(Client.organization_id == organization_id, Client.client_type == "active")
-        ).count()
-        inactive_clients = db.query(Client).filter(
-            and_(Client.organization_id == organization_id, Client.client_type == "inactive")
-        ).count()
-        
-        # Clients by type
-        type_counts = db.query(Client.client_type, func.count(Client.id)).filter(
-            Client.organization_id == organization_id
-        ).group_by(Client.client_type).all()
-        clients_by_type = {client_type: count for client_type, count in type_counts}
-        
-        # Clients by industry
-        industry_counts = db.query(Client.industry, func.count(Client.id)).filter(
-            and_(Client.organization_id == organization_id, Client.industry.isnot(None))
-        ).group_by(Client.industry).all()
-        clients_by_industry = {industry: count for industry, count in industry_counts}
-        
-        # Clients by source
-        source_counts = db.query(Client.source, func.count(Client.id)).filter(
-            and_(Client.organization_id == organization_id, Client.source.isnot(None))
-        ).group_by(Client.source).all()
-        clients_by_source = {source: count for source, count in source_counts}
-        
+        # One grouped scan over GROUPING SETS ((type), (industry), (source), ());
+        # GROUPING() yields a bitmask (type=4, industry=2, source=1) of the
+        # columns rolled up in each row, identifying which set it belongs to
+        grouping = func.grouping(Client.client_type, Client.industry, Client.source)
+        rows = (
+            db.query(
+                grouping,
+                Client.client_type,
+                Client.industry,
+                Client.source,
+                func.count(Client.id)
+            )
+            .filter(Client.organization_id == organization_id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Client.client_type),
+                    tuple_(Client.industry),
+                    tuple_(Client.source),
+                    tuple_()
+                )
+            )
+            .all()
+        )
+
+        total_clients = 0
+        clients_by_type: Dict[Optional[str], int] = {}
+        clients_by_industry: Dict[str, int] = {}
+        clients_by_source: Dict[str, int] = {}
+        for group_mask, client_type, industry, source, count in rows:
+            if group_mask == 0b011:
+                clients_by_type[client_type] = count
+            elif group_mask == 0b101:
+                if industry is not None:
+                    clients_by_industry[industry] = count
+            elif group_mask == 0b110:
+                if source is not None:
+                    clients_by_source[source] = count
+            else:
+                total_clients = count
+
+        prospects = clients_by_type.get("prospect", 0)
+        active_clients = clients_by_type.get("active", 0)
+        inactive_clients = clients_by_type.get("inactive", 0)
+
         # Recent clients
         recent_clients_raw = self.get_recent_clients(db, organization_id=organization_id, limit=5)
 
@@ -2,13 +2,14 @@
 CRUD operations for Compliance models
 """
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
+from sqlalchemy import Float, and_, case, cast, exists, func, or_, select, tuple_
 
 from app.crud.base import CRUDBase
+from app.services.cache_service import cache_service
 from app.models.compliance import (
     ComplianceCategory, 
     ComplianceRequirement, 
@@ -29,7 +30,35 @@ from app.schemas.compliance import (
 )
 
 
-class CRUDComplianceCategory(CRUDBase[ComplianceCategory, ComplianceCategoryCreate, ComplianceCategoryUpdate]):
+# Dashboard summaries are cached briefly and dropped whenever a record that
+# feeds them is written through the CRUD classes below
+DASHBOARD_CACHE_TTL = 60
+
+
+def _dashboard_cache_key(organization_id: Any) -> str:
+    return f"dealverse:compliance:dashboard:{organization_id}"
+
+
+class _InvalidatesDashboardCache:
+    """Invalidate the organization's cached dashboard summary on writes"""
+
+    def create(self, db: Session, *, obj_in: Union[Any, Dict[str, Any]]):
+        db_obj = super().create(db, obj_in=obj_in)
+        cache_service.delete(_dashboard_cache_key(db_obj.organization_id))
+        return db_obj
+
+    def update(self, db: Session, *, db_obj: Any, obj_in: Union[Any, Dict[str, Any]]):
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        cache_service.delete(_dashboard_cache_key(db_obj.organization_id))
+        return db_obj
+
+    def remove(self, db: Session, *, id: Any):
+        obj = super().remove(db, id=id)
+        cache_service.delete(_dashboard_cache_key(obj.organization_id))
+        return obj
+
+
+class CRUDComplianceCategory(_InvalidatesDashboardCache, CRUDBase[ComplianceCategory, ComplianceCategoryCreate, ComplianceCategoryUpdate]):
     """CRUD operations for ComplianceCategory"""
     
     def get_by_organization(
@@ -61,8 +90,91 @@ class CRUDComplianceCategory(CRUDBase[ComplianceCategory, ComplianceCategoryCrea
         )
 
 
-class CRUDComplianceRequirement(CRUDBase[ComplianceRequirement, ComplianceRequirementCreate, ComplianceRequirementUpdate]):
-    """CRUD operations for ComplianceRequirement"""
+class CRUDComplianceRequirement(_InvalidatesDashboardCache, CRUDBase[ComplianceRequirement, ComplianceRequirementCreate, ComplianceRequirementUpdate]):
+    """CRUD operations for ComplianceRequirement
+    
+    Writes keep the requirement totals stored on the affected categories
+    current within the same transaction.
+    """
+    
+    def create(self, db: Session, *, obj_in: Union[ComplianceRequirementCreate, Dict[str, Any]]) -> ComplianceRequirement:
+        """Create a requirement and update its category totals"""
+        db_obj = self.model(**self._to_model_data(obj_in))
+        db.add(db_obj)
+        db.flush()
+        self._refresh_category_totals(db, {db_obj.category_id})
+        db.commit()
+        db.refresh(db_obj)
+        cache_service.delete(_dashboard_cache_key(db_obj.organization_id))
+        return db_obj
+    
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: ComplianceRequirement,
+        obj_in: Union[ComplianceRequirementUpdate, Dict[str, Any]]
+    ) -> ComplianceRequirement:
+        """Update a requirement and the totals of its old and new category"""
+        previous_category_id = db_obj.category_id
+        self._apply_update(db_obj, obj_in)
+        db.add(db_obj)
+        db.flush()
+        self._refresh_category_totals(db, {previous_category_id, db_obj.category_id})
+        db.commit()
+        db.refresh(db_obj)
+        cache_service.delete(_dashboard_cache_key(db_obj.organization_id))
+        return db_obj
+    
+    def remove(self, db: Session, *, id: Any) -> ComplianceRequirement:
+        """Delete a requirement and update its category totals"""
+        obj = db.query(self.model).get(id)
+        db.delete(obj)
+        db.flush()
+        self._refresh_category_totals(db, {obj.category_id})
+        db.commit()
+        cache_service.delete(_dashboard_cache_key(obj.organization_id))
+        return obj
+    
+    @staticmethod
+    def _refresh_category_totals(db: Session, category_ids: set) -> None:
+        """Recount the requirements of the given categories into their stored totals"""
+        # Lock the category rows first (in a fixed order, against deadlocks).
+        # Under READ COMMITTED a concurrent writer to the same category is
+        # waited for here, so the recount below runs on a fresh snapshot that
+        # includes its requirement instead of overwriting its totals
+        (
+            db.query(ComplianceCategory.id)
+            .filter(ComplianceCategory.id.in_(category_ids))
+            .order_by(ComplianceCategory.id)
+            .with_for_update()
+            .all()
+        )
+        
+        requirement_count = (
+            select(func.count(ComplianceRequirement.id))
+            .where(ComplianceRequirement.category_id == ComplianceCategory.id)
+            .correlate(ComplianceCategory)
+        )
+        total = requirement_count.scalar_subquery()
+        compliant = requirement_count.where(
+            ComplianceRequirement.status == ComplianceStatus.COMPLIANT
+        ).scalar_subquery()
+        (
+            db.query(ComplianceCategory)
+            .filter(ComplianceCategory.id.in_(category_ids))
+            .update(
+                {
+                    ComplianceCategory.total_requirements: total,
+                    ComplianceCategory.compliant_requirements: compliant,
+                    ComplianceCategory.compliance_score: case(
+                        (total == 0, 100.0),
+                        else_=cast(compliant, Float) * 100 / total
+                    ),
+                },
+                synchronize_session=False
+            )
+        )
     
     def get_by_organization(
         self, 
@@ -108,43 +220,88 @@ class CRUDComplianceRequirement(CRUDBase[ComplianceRequirement, ComplianceRequir
         db: Session, 
         organization_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after_due_date: Optional[datetime] = None,
+        after_id: Optional[UUID] = None
     ) -> List[ComplianceRequirement]:
-        """Get overdue requirements"""
-        return (
+        """Get overdue requirements
+        
+        Pass the ``due_date`` and ``id`` of the last row of the previous page
+        as ``after_due_date``/``after_id`` to seek past it instead of
+        scanning and discarding ``skip`` rows.
+        """
+        query = (
             db.query(self.model)
             .filter(ComplianceRequirement.organization_id == organization_id)
             .filter(ComplianceRequirement.due_date < datetime.utcnow())
             .filter(ComplianceRequirement.status != ComplianceStatus.COMPLIANT)
-            .order_by(ComplianceRequirement.due_date.asc())
-            .offset(skip)
+        )
+        if after_due_date is not None and after_id is not None:
+            query = query.filter(
+                tuple_(ComplianceRequirement.due_date, ComplianceRequirement.id) > (after_due_date, after_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        return (
+            query
+            .order_by(ComplianceRequirement.due_date.asc(), ComplianceRequirement.id.asc())
             .limit(limit)
             .all()
         )
     
+    def has_overdue(self, db: Session, organization_id: UUID) -> bool:
+        """Whether the organization has any overdue requirement
+        
+        Uses EXISTS, which stops at the first match instead of counting.
+        """
+        return bool(
+            db.query(
+                exists().where(
+                    ComplianceRequirement.organization_id == organization_id,
+                    ComplianceRequirement.due_date < datetime.utcnow(),
+                    ComplianceRequirement.status != ComplianceStatus.COMPLIANT
+                )
+            ).scalar()
+        )
+    
     def get_upcoming_reviews(
         self, 
         db: Session, 
         organization_id: UUID,
         days_ahead: int = 30,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        after_review_date: Optional[datetime] = None,
+        after_id: Optional[UUID] = None
     ) -> List[ComplianceRequirement]:
-        """Get requirements with upcoming reviews"""
-        future_date = datetime.utcnow() + timedelta(days=days_ahead)
-        return (
+        """Get requirements with upcoming reviews
+        
+        ``after_review_date``/``after_id`` seek past the last row of the
+        previous page, like ``get_overdue``.
+        """
+        now = datetime.utcnow()
+        query = (
             db.query(self.model)
             .filter(ComplianceRequirement.organization_id == organization_id)
-            .filter(ComplianceRequirement.next_review_date <= future_date)
-            .filter(ComplianceRequirement.next_review_date >= datetime.utcnow())
-            .order_by(ComplianceRequirement.next_review_date.asc())
-            .offset(skip)
+            .filter(ComplianceRequirement.next_review_date <= now + timedelta(days=days_ahead))
+            .filter(ComplianceRequirement.next_review_date >= now)
+        )
+        if after_review_date is not None and after_id is not None:
+            query = query.filter(
+                tuple_(ComplianceRequirement.next_review_date, ComplianceRequirement.id)
+                > (after_review_date, after_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        return (
+            query
+            .order_by(ComplianceRequirement.next_review_date.asc(), ComplianceRequirement.id.asc())
             .limit(limit)
             .all()
         )
 
 
-class CRUDComplianceAssessment(CRUDBase[ComplianceAssessment, ComplianceAssessmentCreate, ComplianceAssessmentUpdate]):
+class CRUDComplianceAssessment(_InvalidatesDashboardCache, CRUDBase[ComplianceAssessment, ComplianceAssessmentCreate, ComplianceAssessmentUpdate]):
     """CRUD operations for ComplianceAssessment"""
     
     def get_by_organization(
@@ -204,7 +361,7 @@ class CRUDComplianceAssessment(CRUDBase[ComplianceAssessment, ComplianceAssessme
         )
 
 
-class CRUDRegulatoryUpdate(CRUDBase[RegulatoryUpdate, RegulatoryUpdateCreate, RegulatoryUpdateUpdate]):
+class CRUDRegulatoryUpdate(_InvalidatesDashboardCache, CRUDBase[RegulatoryUpdate, RegulatoryUpdateCreate, RegulatoryUpdateUpdate]):
     """CRUD operations for RegulatoryUpdate"""
     
     def get_by_organization(
@@ -246,44 +403,82 @@ class CRUDRegulatoryUpdate(CRUDBase[RegulatoryUpdate, RegulatoryUpdateCreate, Re
             .limit(limit)
             .all()
         )
+    
+    def has_unreviewed(self, db: Session, organization_id: UUID) -> bool:
+        """Whether the organization has any unreviewed regulatory update"""
+        return bool(
+            db.query(
+                exists().where(
+                    RegulatoryUpdate.organization_id == organization_id,
+                    RegulatoryUpdate.is_reviewed == False
+                )
+            ).scalar()
+        )
 
 
 class CRUDComplianceDashboard:
     """CRUD operations for compliance dashboard data"""
     
     def get_dashboard_summary(self, db: Session, organization_id: UUID) -> Dict[str, Any]:
-        """Get comprehensive dashboard summary"""
+        """Get comprehensive dashboard summary, served from cache when fresh"""
+        cache_key = _dashboard_cache_key(organization_id)
+        summary = cache_service.get(cache_key)
+        if summary is not None:
+            return summary
+        
+        summary = self._build_dashboard_summary(db, organization_id)
+        cache_service.set(cache_key, summary, ttl=DASHBOARD_CACHE_TTL)
+        return summary
+    
+    def _build_dashboard_summary(self, db: Session, organization_id: UUID) -> Dict[str, Any]:
+        """Compute the dashboard summary from the database"""
+        # One timestamp for every time-window filter in the summary
+        now = datetime.utcnow()
+        review_horizon = now + timedelta(days=30)
         
-        # Get requirement counts by status
-        requirement_counts = (
+        # Requirement totals by status and the weighted overall score
+        # (compliant=100, warning=70, pending=50) in one aggregate
+        status_weight = case(
+            (ComplianceRequirement.status == ComplianceStatus.COMPLIANT, 100),
+            (ComplianceRequirement.status == ComplianceStatus.WARNING, 70),
+            (ComplianceRequirement.status == ComplianceStatus.PENDING, 50),
+            else_=0
+        )
+        requirement_count = func.count(ComplianceRequirement.id)
+        overall = (
             db.query(
-                ComplianceRequirement.status,
-                func.count(ComplianceRequirement.id).label('count')
+                requirement_count.label('total'),
+                requirement_count.filter(
+                    ComplianceRequirement.status == ComplianceStatus.COMPLIANT
+                ).label('compliant'),
+                requirement_count.filter(
+                    ComplianceRequirement.status == ComplianceStatus.WARNING
+                ).label('warning'),
+                requirement_count.filter(
+                    ComplianceRequirement.status == ComplianceStatus.NON_COMPLIANT
+                ).label('non_compliant'),
+                requirement_count.filter(
+                    ComplianceRequirement.status == ComplianceStatus.PENDING
+                ).label('pending'),
+                (cast(func.sum(status_weight), Float) / func.nullif(requirement_count, 0)).label('score')
             )
             .filter(ComplianceRequirement.organization_id == organization_id)
-            .group_by(ComplianceRequirement.status)
-            .all()
+            .one()
         )
         
-        status_counts = {status: 0 for status in ComplianceStatus}
-        for status, count in requirement_counts:
-            status_counts[status] = count
-        
-        total_requirements = sum(status_counts.values())
+        total_requirements = overall.total
+        overall_score = overall.score if overall.score is not None else 100.0
         
-        # Calculate overall compliance score
-        if total_requirements > 0:
-            compliant_weight = status_counts.get(ComplianceStatus.COMPLIANT, 0) * 100
-            warning_weight = status_counts.get(ComplianceStatus.WARNING, 0) * 70
-            pending_weight = status_counts.get(ComplianceStatus.PENDING, 0) * 50
-            
-            overall_score = (compliant_weight + warning_weight + pending_weight) / total_requirements
-        else:
-            overall_score = 100.0
-        
-        # Get categories summary
+        # Active categories with their stored requirement totals
         categories = (
-            db.query(ComplianceCategory)
+            db.query(
+                ComplianceCategory.id,
+                ComplianceCategory.name,
+                ComplianceCategory.code,
+                ComplianceCategory.total_requirements,
+                ComplianceCategory.compliant_requirements,
+                ComplianceCategory.compliance_score
+            )
             .filter(ComplianceCategory.organization_id == organization_id)
             .filter(ComplianceCategory.is_active == True)
             .all()
@@ -291,66 +486,68 @@ class CRUDComplianceDashboard:
         
         categories_summary = []
         for category in categories:
-            cat_requirements = (
-                db.query(ComplianceRequirement)
-                .filter(ComplianceRequirement.category_id == category.id)
-                .all()
-            )
-            
-            cat_total = len(cat_requirements)
-            cat_compliant = len([r for r in cat_requirements if r.status == ComplianceStatus.COMPLIANT])
-            cat_score = (cat_compliant / cat_total * 100) if cat_total > 0 else 100
+            cat_score = category.compliance_score
             
             categories_summary.append({
                 "id": str(category.id),
                 "name": category.name,
                 "code": category.code,
-                "total_requirements": cat_total,
-                "compliant_requirements": cat_compliant,
+                "total_requirements": category.total_requirements,
+                "compliant_requirements": category.compliant_requirements,
                 "compliance_score": round(cat_score, 1),
                 "status": "compliant" if cat_score >= 95 else "warning" if cat_score >= 80 else "non_compliant"
             })
         
-        # Get recent assessments
+        # Get recent assessments, selecting only the columns shown
         recent_assessments = (
-            db.query(ComplianceAssessment)
+            db.query(
+                ComplianceAssessment.id,
+                ComplianceAssessment.assessment_date,
+                ComplianceAssessment.status,
+                ComplianceAssessment.score,
+                ComplianceAssessment.assessment_type
+            )
             .filter(ComplianceAssessment.organization_id == organization_id)
             .order_by(ComplianceAssessment.assessment_date.desc())
             .limit(5)
             .all()
         )
         
-        # Get upcoming reviews
+        # Get upcoming reviews with their category name, selecting only the
+        # columns shown
         upcoming_reviews = (
-            db.query(ComplianceRequirement)
+            db.query(
+                ComplianceRequirement.id,
+                ComplianceRequirement.title,
+                ComplianceRequirement.next_review_date,
+                ComplianceRequirement.status,
+                ComplianceCategory.name.label('category_name')
+            )
+            .outerjoin(ComplianceCategory, ComplianceRequirement.category_id == ComplianceCategory.id)
             .filter(ComplianceRequirement.organization_id == organization_id)
-            .filter(ComplianceRequirement.next_review_date >= datetime.utcnow())
-            .filter(ComplianceRequirement.next_review_date <= datetime.utcnow() + timedelta(days=30))
+            .filter(ComplianceRequirement.next_review_date >= now)
+            .filter(ComplianceRequirement.next_review_date <= review_horizon)
             .order_by(ComplianceRequirement.next_review_date.asc())
             .limit(10)
             .all()
         )
         
-        # Get regulatory updates count
-        total_updates = (
-            db.query(RegulatoryUpdate)
-            .filter(RegulatoryUpdate.organization_id == organization_id)
-            .count()
-        )
-        
-        unreviewed_updates = (
-            db.query(RegulatoryUpdate)
+        # Get total and unreviewed regulatory update counts in one scan
+        total_updates, unreviewed_updates = (
+            db.query(
+                func.count(RegulatoryUpdate.id),
+                func.count(RegulatoryUpdate.id).filter(RegulatoryUpdate.is_reviewed == False)
+            )
             .filter(RegulatoryUpdate.organization_id == organization_id)
-            .filter(RegulatoryUpdate.is_reviewed == False)
-            .count()
+            .one()
         )
         
         return {
             "total_requirements": total_requirements,
-            "compliant_requirements": status_counts.get(ComplianceStatus.COMPLIANT, 0),
-            "warning_requirements": status_counts.get(ComplianceStatus.WARNING, 0),
-            "non_compliant_requirements": status_counts.get(ComplianceStatus.NON_COMPLIANT, 0),
-            "pending_requirements": status_counts.get(ComplianceStatus.PENDING, 0),
+            "compliant_requirements": overall.compliant,
+            "warning_requirements": overall.warning,
+            "non_compliant_requirements": overall.non_compliant,
+            "pending_requirements": overall.pending,
             "overall_compliance_score": round(overall_score, 1),
             "categories_summary": categories_summary,
             "recent_assessments": [
@@ -368,7 +565,7 @@ class CRUDComplianceDashboard:
                     "title": r.title,
                     "next_review_date": r.next_review_date.isoformat() if r.next_review_date else None,
                     "status": r.status,
-                    "category_name": r.category.name if r.category else None
+                    "category_name": r.category_name
                 } for r in upcoming_reviews
             ],
             "regulatory_updates_count": total_updates,
@@ -1,13 +1,19 @@
 """
 CRUD operations for Deal model
 """
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload, selectinload
-from sqlalchemy import func, and_, desc
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, desc, func, literal_column, select, tuple_
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, STREAM_BATCH_SIZE
 from app.models.deal import Deal
+from app.models.document import Document
+from app.models.financial_model import FinancialModel
+from app.models.organization import Organization
+from app.models.task import Task
 from app.schemas.deal import DealCreate, DealUpdate
 
 
@@ -23,17 +29,30 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
         limit: int = 100,
         stage: Optional[str] = None,
         status: Optional[str] = None,
-        include_relations: bool = False
-    ) -> List[Deal]:
-        """Get deals by organization with optional filters and eager loading"""
+        include_relations: bool = False,
+        before_updated_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None,
+        stream: bool = False
+    ) -> Union[List[Deal], Iterator[Deal]]:
+        """Get deals by organization with optional filters and eager loading
+
+        Pass the ``updated_at`` and ``id`` of the last deal of the previous
+        page as ``before_updated_at``/``before_id`` to seek past it instead of
+        scanning and discarding ``skip`` rows.
+
+        With ``stream=True`` the deals are returned as an iterator fetched in
+        batches over a server-side cursor, for large exports; consume it
+        before the session is closed.
+        """
         query = db.query(Deal).filter(Deal.organization_id == organization_id)
 
-        # Add eager loading to prevent N+1 queries
+        # Add eager loading to prevent N+1 queries; parents are selectin-loaded
+        # so the deal rows stay narrow, and the organization (the filter value)
+        # is attached below instead of being joined onto every row
         if include_relations:
             query = query.options(
-                joinedload(Deal.client),
-                joinedload(Deal.created_by),
-                joinedload(Deal.organization),
+                selectinload(Deal.client),
+                selectinload(Deal.created_by),
                 selectinload(Deal.tasks),
                 selectinload(Deal.documents),
                 selectinload(Deal.financial_models)
@@ -44,10 +63,39 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
         if status:
             query = query.filter(Deal.status == status)
 
-        # Add ordering for consistent results
-        query = query.order_by(desc(Deal.updated_at))
+        if before_updated_at is not None and before_id is not None:
+            query = query.filter(tuple_(Deal.updated_at, Deal.id) < (before_updated_at, before_id))
+        elif skip:
+            query = query.offset(skip)
 
-        return query.offset(skip).limit(limit).all()
+        # Add ordering for consistent results; id breaks updated_at ties
+        query = query.order_by(desc(Deal.updated_at), desc(Deal.id))
+
+        query = query.limit(limit)
+        if stream:
+            return self._stream_with_organization(
+                db, query.yield_per(STREAM_BATCH_SIZE), organization_id, include_relations
+            )
+
+        deals = query.all()
+        if include_relations and deals:
+            organization = db.get(Organization, organization_id)
+            for deal in deals:
+                set_committed_value(deal, "organization", organization)
+        return deals
+
+    @staticmethod
+    def _stream_with_organization(
+        db: Session,
+        deals: Iterator[Deal],
+        organization_id: UUID,
+        include_relations: bool
+    ) -> Iterator[Deal]:
+        organization = db.get(Organization, organization_id) if include_relations else None
+        for deal in deals:
+            if organization is not None:
+                set_committed_value(deal, "organization", organization)
+            yield deal
     
     def get_by_client(
         self,
@@ -58,15 +106,19 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
         limit: int = 100,
         include_relations: bool = False
     ) -> List[Deal]:
-        """Get deals by client with optional eager loading"""
+        """Get deals by client with optional eager loading
+
+        Parents are selectin-loaded: each distinct client, creator and
+        organization is fetched once instead of widening every deal row.
+        """
         query = db.query(Deal).filter(Deal.client_id == client_id)
 
         # Add eager loading to prevent N+1 queries
         if include_relations:
             query = query.options(
-                joinedload(Deal.client),
-                joinedload(Deal.created_by),
-                joinedload(Deal.organization),
+                selectinload(Deal.client),
+                selectinload(Deal.created_by),
+                selectinload(Deal.organization),
                 selectinload(Deal.tasks),
                 selectinload(Deal.documents)
             )
@@ -94,9 +146,9 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
         # Add eager loading to prevent N+1 queries
         if include_relations:
             query = query.options(
-                joinedload(Deal.client),
-                joinedload(Deal.created_by),
-                joinedload(Deal.organization),
+                selectinload(Deal.client),
+                selectinload(Deal.created_by),
+                selectinload(Deal.organization),
                 selectinload(Deal.tasks),
                 selectinload(Deal.documents)
             )
@@ -125,7 +177,7 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
             query = query.options(
                 joinedload(Deal.client),
                 joinedload(Deal.created_by),
-                selectinload(Deal.tasks).joinedload("assignee")
+                selectinload(Deal.tasks).joinedload(Task.assignee)
             )
 
         return (
@@ -138,52 +190,92 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
     def get_organization_stats(self, db: Session, *, organization_id: UUID) -> Dict[str, Any]:
         """Get deal statistics for organization"""
         
-        # Basic counts
-        total_deals = db.query(Deal).filter(Deal.organization_id == organization_id).count()
-        active_deals = db.query(Deal).filter(
-            and_(Deal.organization_id == organization_id, Deal.status == "active")
-        ).count()
-        closed_deals = db.query(Deal).filter(
-            and_(Deal.organization_id == organization_id, Deal.stage == "closed")
-        ).count()
-        
-        # Financial metrics
-        total_value_result = db.query(func.sum(Deal.deal_value)).filter(
-            Deal.organization_id == organization_id
-        ).scalar()
-        total_value = float(total_value_result) if total_value_result else 0.0
-        
-        average_deal_size = total_value / total_deals if total_deals > 0 else 0.0
+        # Counts and value totals in one scan via FILTER aggregates
+        totals = (
+            db.query(
+                func.count(Deal.id).label("total"),
+                func.count(Deal.id).filter(Deal.status == "active").label("active"),
+                func.count(Deal.id).filter(Deal.stage == "closed").label("closed"),
+                func.count(Deal.id).filter(Deal.stage == "lost").label("lost"),
+                func.coalesce(func.sum(Deal.deal_value), 0).label("total_value"),
+                func.coalesce(
+                    func.sum(Deal.deal_value) / func.nullif(func.count(Deal.id), 0), 0
+                ).label("average_value")
+            )
+            .filter(Deal.organization_id == organization_id)
+            .one()
+        )
+        total_deals = totals.total
+        active_deals = totals.active
+        closed_deals = totals.closed
+        total_value = float(totals.total_value)
+        average_deal_size = float(totals.average_value)
         
         # Win rate calculation
-        lost_deals = db.query(Deal).filter(
-            and_(Deal.organization_id == organization_id, Deal.stage == "lost")
-        ).count()
-        completed_deals = closed_deals + lost_deals
+        completed_deals = closed_deals + totals.lost
         win_rate = (closed_deals / completed_deals * 100) if completed_deals > 0 else 0.0
         
-        # Deals by stage
-        stage_counts = db.query(Deal.stage, func.count(Deal.id)).filter(
-            Deal.organization_id == organization_id
-        ).group_by(Deal.stage).all()
-        deals_by_stage = {stage: count for stage, count in stage_counts}
-        
-        # Deals by type
-        type_counts = db.query(Deal.deal_type, func.count(Deal.id)).filter(
-            Deal.organization_id == organization_id
-        ).group_by(Deal.deal_type).all()
-        deals_by_type = {deal_type: count for deal_type, count in type_counts}
+        # Deals by stage and by type in one grouped scan over
+        # GROUPING SETS ((stage), (deal_type)); GROUPING(stage) is 1 on the
+        # rows that group by deal_type
+        grouped_counts = (
+            db.query(
+                func.grouping(Deal.stage),
+                Deal.stage,
+                Deal.deal_type,
+                func.count(Deal.id)
+            )
+            .filter(Deal.organization_id == organization_id)
+            .group_by(func.grouping_sets(tuple_(Deal.stage), tuple_(Deal.deal_type)))
+            .all()
+        )
+        deals_by_stage = {}
+        deals_by_type = {}
+        for stage_rolled_up, stage, deal_type, count in grouped_counts:
+            if stage_rolled_up:
+                deals_by_type[deal_type] = count
+            else:
+                deals_by_stage[stage] = count
         
-        # Monthly revenue (simplified - last 12 months)
-        monthly_revenue = []
-        for i in range(12):
-            month_name = f"Month {i+1}"  # Simplified for now
-            revenue = total_value / 12  # Simplified calculation
-            monthly_revenue.append({
-                "month": month_name,
-                "revenue": revenue,
-                "deals": total_deals // 12
-            })
+        # Monthly revenue of closed deals over the last 12 months; the months
+        # come from generate_series so months without closings report zero,
+        # and each month is matched as a close-date range on
+        # (organization_id, actual_close_date)
+        current_month = func.date_trunc("month", func.current_date())
+        months = (
+            select(
+                func.generate_series(
+                    current_month - literal_column("interval '11 months'"),
+                    current_month,
+                    literal_column("interval '1 month'")
+                ).label("month")
+            )
+            .subquery()
+        )
+        monthly_rows = (
+            db.query(
+                months.c.month,
+                func.coalesce(func.sum(Deal.deal_value), 0),
+                func.count(Deal.id)
+            )
+            .select_from(months)
+            .outerjoin(
+                Deal,
+                and_(
+                    Deal.organization_id == organization_id,
+                    Deal.actual_close_date >= months.c.month,
+                    Deal.actual_close_date < months.c.month + literal_column("interval '1 month'"),
+                    Deal.stage == "closed"
+                )
+            )
+            .group_by(months.c.month)
+            .order_by(months.c.month)
+            .all()
+        )
+        monthly_revenue = [
+            {"month": month.strftime("%b %Y"), "revenue": float(revenue), "deals": deals}
+            for month, revenue, deals in monthly_rows
+        ]
         
         return {
             "total_deals": total_deals,
@@ -245,9 +337,9 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
                 joinedload(Deal.client),
                 joinedload(Deal.created_by),
                 joinedload(Deal.organization),
-                selectinload(Deal.tasks).joinedload("assignee"),
-                selectinload(Deal.documents).joinedload("uploaded_by"),
-                selectinload(Deal.financial_models).joinedload("created_by")
+                selectinload(Deal.tasks).joinedload(Task.assignee),
+                selectinload(Deal.documents).joinedload(Document.uploaded_by),
+                selectinload(Deal.financial_models).joinedload(FinancialModel.created_by)
             )
             .first()
         )
@@ -267,7 +359,7 @@ class CRUDDeal(CRUDBase[Deal, DealCreate, DealUpdate]):
                 joinedload(Deal.client),
                 joinedload(Deal.created_by),
                 # Only load task count, not full tasks
-                selectinload(Deal.tasks).load_only("id", "status")
+                selectinload(Deal.tasks).load_only(Task.id, Task.status)
             )
             .order_by(desc(Deal.updated_at))
             .limit(limit)
@@ -2,16 +2,23 @@
 CRUD operations for Document model
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Union
 from uuid import UUID
 
+from sqlalchemy import desc, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, STREAM_BATCH_SIZE
 from app.models.document import Document
 from app.schemas.document import DocumentCreate, DocumentUpdate
 
 
+# Shared base statement for the listing reads; immutable, so each method
+# derives its query from it and the hot paths keep a small, stable set of
+# statement shapes in SQLAlchemy's compiled cache
+_ACTIVE_DOCUMENTS = select(Document).where(Document.is_archived == False)
+
+
 class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
     """CRUD operations for Document model"""
     
@@ -23,26 +30,42 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100,
         document_type: Optional[str] = None,
         deal_id: Optional[UUID] = None,
-        status: Optional[str] = None
-    ) -> List[Document]:
-        """Get documents by organization with optional filters"""
-        query = (
-            db.query(self.model)
-            .filter(Document.organization_id == organization_id)
-            .filter(Document.is_archived == False)
-        )
+        status: Optional[str] = None,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None,
+        stream: bool = False
+    ) -> Union[List[Document], Iterator[Document]]:
+        """Get documents by organization with optional filters, newest first
+
+        Pass the ``created_at`` and ``id`` of the last document of the previous
+        page as ``before_created_at``/``before_id`` to seek past it instead of
+        scanning and discarding ``skip`` rows.
+
+        With ``stream=True`` the documents are returned as an iterator fetched
+        in batches over a server-side cursor; consume it before the session
+        is closed.
+        """
+        stmt = _ACTIVE_DOCUMENTS.where(Document.organization_id == organization_id)
 
         # Apply optional filters
         if document_type:
-            query = query.filter(Document.document_type == document_type)
+            stmt = stmt.where(Document.document_type == document_type)
 
         if deal_id:
-            query = query.filter(Document.deal_id == deal_id)
+            stmt = stmt.where(Document.deal_id == deal_id)
 
         if status:
-            query = query.filter(Document.status == status)
+            stmt = stmt.where(Document.status == status)
 
-        return query.offset(skip).limit(limit).all()
+        if before_created_at is not None and before_id is not None:
+            stmt = stmt.where(tuple_(Document.created_at, Document.id) < (before_created_at, before_id))
+        elif skip:
+            stmt = stmt.offset(skip)
+
+        stmt = stmt.order_by(desc(Document.created_at), desc(Document.id)).limit(limit)
+        if stream:
+            return iter(db.scalars(stmt, execution_options={"yield_per": STREAM_BATCH_SIZE}))
+        return db.scalars(stmt).all()
     
     def get_by_deal(
         self, 
@@ -52,14 +75,8 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100
     ) -> List[Document]:
         """Get documents by deal"""
-        return (
-            db.query(self.model)
-            .filter(Document.deal_id == deal_id)
-            .filter(Document.is_archived == False)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        stmt = _ACTIVE_DOCUMENTS.where(Document.deal_id == deal_id).offset(skip).limit(limit)
+        return db.scalars(stmt).all()
     
     def get_by_type(
         self, 
@@ -70,16 +87,12 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100
     ) -> List[Document]:
         """Get documents by type"""
-        query = (
-            db.query(self.model)
-            .filter(Document.document_type == document_type)
-            .filter(Document.is_archived == False)
-        )
+        stmt = _ACTIVE_DOCUMENTS.where(Document.document_type == document_type)
         
         if organization_id:
-            query = query.filter(Document.organization_id == organization_id)
+            stmt = stmt.where(Document.organization_id == organization_id)
             
-        return query.offset(skip).limit(limit).all()
+        return db.scalars(stmt.offset(skip).limit(limit)).all()
     
     def get_by_category(
         self, 
@@ -90,16 +103,12 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100
     ) -> List[Document]:
         """Get documents by category"""
-        query = (
-            db.query(self.model)
-            .filter(Document.category == category)
-            .filter(Document.is_archived == False)
-        )
+        stmt = _ACTIVE_DOCUMENTS.where(Document.category == category)
         
         if organization_id:
-            query = query.filter(Document.organization_id == organization_id)
+            stmt = stmt.where(Document.organization_id == organization_id)
             
-        return query.offset(skip).limit(limit).all()
+        return db.scalars(stmt.offset(skip).limit(limit)).all()
     
     def get_by_status(
         self, 
@@ -110,16 +119,12 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100
     ) -> List[Document]:
         """Get documents by status"""
-        query = (
-            db.query(self.model)
-            .filter(Document.status == status)
-            .filter(Document.is_archived == False)
-        )
+        stmt = _ACTIVE_DOCUMENTS.where(Document.status == status)
         
         if organization_id:
-            query = query.filter(Document.organization_id == organization_id)
+            stmt = stmt.where(Document.organization_id == organization_id)
             
-        return query.offset(skip).limit(limit).all()
+        return db.scalars(stmt.offset(skip).limit(limit)).all()
     
     def get_confidential(
         self, 
@@ -129,15 +134,14 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         limit: int = 100
     ) -> List[Document]:
         """Get confidential documents"""
-        return (
-            db.query(self.model)
-            .filter(Document.organization_id == organization_id)
-            .filter(Document.is_confidential == True)
-            .filter(Document.is_archived == False)
+        stmt = (
+            _ACTIVE_DOCUMENTS
+            .where(Document.organization_id == organization_id)
+            .where(Document.is_confidential == True)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return db.scalars(stmt).all()
     
     def search_documents(
         self, 
@@ -168,13 +172,21 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         db: Session, 
         document_id: UUID
     ) -> Optional[Document]:
-        """Increment download count and update last accessed"""
-        document = self.get(db, id=document_id)
-        if document:
-            document.download_count += 1
-            document.last_accessed = datetime.utcnow()
-            db.commit()
-            db.refresh(document)
+        """Increment download count and update last accessed
+
+        A single UPDATE ... RETURNING, so concurrent downloads can't lose
+        increments between a read and the write.
+        """
+        document = db.scalars(
+            update(Document)
+            .where(Document.id == document_id)
+            .values(
+                download_count=Document.download_count + 1,
+                last_accessed=datetime.utcnow()
+            )
+            .returning(Document)
+        ).one_or_none()
+        db.commit()
         return document
     
     def archive_document(
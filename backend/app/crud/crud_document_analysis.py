@@ -1,15 +1,21 @@
 """
 CRUD operations for Document Analysis and Risk Assessment
 """
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Union
 from uuid import UUID
 from datetime import datetime, timedelta
 from decimal import Decimal
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import and_, desc, asc, func, case, exists, tuple_
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, STREAM_BATCH_SIZE, clamp_limit
+from app.services.cache_service import (
+    ORGANIZATION_STATS_TTL,
+    cache_service,
+    invalidate_organization_stats,
+    organization_stats_key,
+)
 from app.models.document_analysis import (
     DocumentAnalysis,
     RiskAssessment,
@@ -19,6 +25,60 @@ from app.models.document_analysis import (
 )
 
 
+# Columns rendered by the summary listings; the large JSON analysis payloads
+# are left unloaded (and lazy-load if accessed)
+_ANALYSIS_SUMMARY_COLUMNS = (
+    DocumentAnalysis.id,
+    DocumentAnalysis.document_id,
+    DocumentAnalysis.analysis_date,
+    DocumentAnalysis.overall_risk_score,
+    DocumentAnalysis.risk_level,
+    DocumentAnalysis.confidence_score,
+    DocumentAnalysis.summary,
+    DocumentAnalysis.critical_issues,
+    DocumentAnalysis.compliance_flags,
+)
+_ASSESSMENT_SUMMARY_COLUMNS = (
+    RiskAssessment.id,
+    RiskAssessment.assessment_name,
+    RiskAssessment.assessment_type,
+    RiskAssessment.assessment_date,
+    RiskAssessment.overall_risk_score,
+    RiskAssessment.risk_level,
+    RiskAssessment.confidence_level,
+    RiskAssessment.deal_id,
+    RiskAssessment.document_ids,
+    RiskAssessment.critical_issues,
+)
+
+# Relationships rendered alongside each row, selectin-loaded in one extra
+# query per relationship when include_relations is set
+_ANALYSIS_RELATIONS = (
+    selectinload(DocumentAnalysis.created_by),
+    selectinload(DocumentAnalysis.document),
+)
+_ASSESSMENT_RELATIONS = (selectinload(RiskAssessment.deal),)
+_REVIEW_RELATIONS = (
+    selectinload(DocumentReview.reviewer),
+    selectinload(DocumentReview.document),
+)
+_COMPARISON_RELATIONS = (
+    selectinload(DocumentComparison.primary_document),
+    selectinload(DocumentComparison.secondary_document),
+)
+
+
+def _filtered_query(db: Session, model, **equals: Any):
+    """Query ``model`` with an equality filter for every non-empty keyword
+
+    Shared by the listings below, whose optional filters are all
+    ``column == value`` and are skipped when the value is not given.
+    """
+    return db.query(model).filter(
+        *(getattr(model, column) == value for column, value in equals.items() if value)
+    )
+
+
 class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
     """CRUD operations for DocumentAnalysis"""
     
@@ -45,24 +105,63 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         db.add(analysis)
         db.commit()
         db.refresh(analysis)
+        invalidate_organization_stats(organization_id)
         return analysis
     
+    def create_analyses_bulk(
+        self,
+        db: Session,
+        *,
+        items: List[Dict[str, Any]],
+        organization_id: UUID,
+        created_by_id: UUID
+    ) -> List[DocumentAnalysis]:
+        """Create several document analyses in one INSERT and one commit
+
+        Each item carries ``document_id``, ``analysis_type`` and the analysis
+        result fields accepted by ``create_analysis``.
+        """
+        if not items:
+            return []
+        
+        rows = [
+            {**item, "organization_id": organization_id, "created_by_id": created_by_id}
+            for item in items
+        ]
+        # bulk_create keeps the RETURNING values loaded across the commit
+        analyses = self.bulk_create(db, objs_in=rows)
+        invalidate_organization_stats(organization_id)
+        return analyses
+    
     def get_by_document(
         self,
         db: Session,
         *,
         document_id: UUID,
-        analysis_type: Optional[str] = None
-    ) -> List[DocumentAnalysis]:
-        """Get analyses for a specific document"""
-        query = db.query(DocumentAnalysis).filter(
-            DocumentAnalysis.document_id == document_id
+        analysis_type: Optional[str] = None,
+        limit: int = 100,
+        strict_limit: bool = False,
+        include_relations: bool = False,
+        stream: bool = False
+    ) -> Union[List[DocumentAnalysis], Iterator[DocumentAnalysis]]:
+        """Get analyses for a specific document, newest first
+
+        ``limit`` is capped at MAX_PAGE_SIZE (see ``clamp_limit``). With
+        ``stream=True`` every analysis is returned as an iterator fetched in
+        batches over a server-side cursor; consume it before the session is
+        closed.
+        """
+        query = _filtered_query(
+            db, DocumentAnalysis, document_id=document_id, analysis_type=analysis_type
         )
         
-        if analysis_type:
-            query = query.filter(DocumentAnalysis.analysis_type == analysis_type)
+        if include_relations:
+            query = query.options(*_ANALYSIS_RELATIONS)
         
-        return query.order_by(desc(DocumentAnalysis.analysis_date)).all()
+        query = query.order_by(desc(DocumentAnalysis.analysis_date))
+        if stream:
+            return iter(query.yield_per(STREAM_BATCH_SIZE))
+        return query.limit(clamp_limit(limit, strict=strict_limit)).all()
     
     def get_latest_analysis(
         self,
@@ -72,13 +171,9 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         analysis_type: Optional[str] = None
     ) -> Optional[DocumentAnalysis]:
         """Get the latest analysis for a document"""
-        query = db.query(DocumentAnalysis).filter(
-            DocumentAnalysis.document_id == document_id
+        query = _filtered_query(
+            db, DocumentAnalysis, document_id=document_id, analysis_type=analysis_type
         )
-        
-        if analysis_type:
-            query = query.filter(DocumentAnalysis.analysis_type == analysis_type)
-        
         return query.order_by(desc(DocumentAnalysis.analysis_date)).first()
     
     def get_by_organization(
@@ -91,18 +186,32 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         analysis_type: Optional[str] = None,
         risk_level: Optional[str] = None,
         date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None
-    ) -> List[DocumentAnalysis]:
-        """Get analyses by organization with filters"""
-        query = db.query(DocumentAnalysis).filter(
-            DocumentAnalysis.organization_id == organization_id
+        date_to: Optional[datetime] = None,
+        before_analysis_date: Optional[datetime] = None,
+        before_id: Optional[UUID] = None,
+        include_relations: bool = False,
+        stream: bool = False
+    ) -> Union[List[DocumentAnalysis], Iterator[DocumentAnalysis]]:
+        """Get analyses by organization with filters, newest first
+
+        Pass the ``analysis_date`` and ``id`` of the last analysis of the
+        previous page as ``before_analysis_date``/``before_id`` to seek past it
+        instead of scanning and discarding ``skip`` rows.
+
+        With ``stream=True`` the analyses are returned as an iterator fetched
+        in batches over a server-side cursor; consume it before the session
+        is closed.
+        """
+        query = _filtered_query(
+            db,
+            DocumentAnalysis,
+            organization_id=organization_id,
+            analysis_type=analysis_type,
+            risk_level=risk_level
         )
         
-        if analysis_type:
-            query = query.filter(DocumentAnalysis.analysis_type == analysis_type)
-        
-        if risk_level:
-            query = query.filter(DocumentAnalysis.risk_level == risk_level)
+        if include_relations:
+            query = query.options(*_ANALYSIS_RELATIONS)
         
         if date_from:
             query = query.filter(DocumentAnalysis.analysis_date >= date_from)
@@ -110,7 +219,19 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         if date_to:
             query = query.filter(DocumentAnalysis.analysis_date <= date_to)
         
-        return query.order_by(desc(DocumentAnalysis.analysis_date)).offset(skip).limit(limit).all()
+        if before_analysis_date is not None and before_id is not None:
+            query = query.filter(
+                tuple_(DocumentAnalysis.analysis_date, DocumentAnalysis.id) < (before_analysis_date, before_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        
+        query = query.order_by(
+            desc(DocumentAnalysis.analysis_date), desc(DocumentAnalysis.id)
+        ).limit(limit)
+        if stream:
+            return iter(query.yield_per(STREAM_BATCH_SIZE))
+        return query.all()
     
     def get_high_risk_analyses(
         self,
@@ -118,15 +239,44 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         *,
         organization_id: UUID,
         risk_threshold: float = 70.0,
-        limit: int = 20
+        limit: int = 20,
+        summary_only: bool = False
     ) -> List[DocumentAnalysis]:
-        """Get high-risk document analyses"""
-        return db.query(DocumentAnalysis).filter(
+        """Get high-risk document analyses
+
+        With ``summary_only=True`` only the summary listing columns are loaded.
+        """
+        query = db.query(DocumentAnalysis).filter(
             and_(
                 DocumentAnalysis.organization_id == organization_id,
                 DocumentAnalysis.overall_risk_score >= risk_threshold
             )
-        ).order_by(desc(DocumentAnalysis.overall_risk_score)).limit(limit).all()
+        )
+        
+        if summary_only:
+            query = query.options(load_only(*_ANALYSIS_SUMMARY_COLUMNS))
+        
+        return query.order_by(desc(DocumentAnalysis.overall_risk_score)).limit(limit).all()
+    
+    def has_high_risk_analyses(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        risk_threshold: float = 70.0
+    ) -> bool:
+        """Whether the organization has any high-risk analysis
+        
+        Uses EXISTS, which stops at the first match instead of sorting.
+        """
+        return bool(
+            db.query(
+                exists().where(
+                    DocumentAnalysis.organization_id == organization_id,
+                    DocumentAnalysis.overall_risk_score >= risk_threshold
+                )
+            ).scalar()
+        )
     
     def get_analysis_statistics(
         self,
@@ -137,19 +287,40 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
         date_to: Optional[datetime] = None
     ) -> Dict[str, Any]:
         """Get analysis statistics for organization"""
-        query = db.query(DocumentAnalysis).filter(
-            DocumentAnalysis.organization_id == organization_id
-        )
+        cache_key = organization_stats_key(organization_id, "document_analysis", date_from, date_to)
+        stats = cache_service.get(cache_key)
+        if stats is None:
+            stats = self._build_analysis_statistics(
+                db, organization_id=organization_id, date_from=date_from, date_to=date_to
+            )
+            cache_service.set(cache_key, stats, ttl=ORGANIZATION_STATS_TTL)
+        return stats
+    
+    def _build_analysis_statistics(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Aggregate the analysis statistics served by get_analysis_statistics"""
+        filters = [DocumentAnalysis.organization_id == organization_id]
         
         if date_from:
-            query = query.filter(DocumentAnalysis.analysis_date >= date_from)
+            filters.append(DocumentAnalysis.analysis_date >= date_from)
         
         if date_to:
-            query = query.filter(DocumentAnalysis.analysis_date <= date_to)
+            filters.append(DocumentAnalysis.analysis_date <= date_to)
         
-        analyses = query.all()
+        # Totals, average score and high-risk count in a single aggregate row
+        total_analyses, average_risk_score, high_risk_count = db.query(
+            func.count(DocumentAnalysis.id),
+            func.avg(DocumentAnalysis.overall_risk_score),
+            func.sum(case((DocumentAnalysis.overall_risk_score >= 70, 1), else_=0))
+        ).filter(*filters).one()
         
-        if not analyses:
+        if not total_analyses:
             return {
                 "total_analyses": 0,
                 "average_risk_score": 0,
@@ -158,35 +329,26 @@ class CRUDDocumentAnalysis(CRUDBase[DocumentAnalysis, dict, dict]):
                 "high_risk_count": 0
             }
         
-        # Calculate statistics
-        total_analyses = len(analyses)
-        risk_scores = [float(a.overall_risk_score) for a in analyses if a.overall_risk_score is not None]
-        average_risk_score = sum(risk_scores) / len(risk_scores) if risk_scores else 0
-        
-        # Risk level distribution
-        risk_level_dist = {}
-        analysis_type_dist = {}
-        high_risk_count = 0
-        
-        for analysis in analyses:
-            # Risk level distribution
-            risk_level = analysis.risk_level or "unknown"
-            risk_level_dist[risk_level] = risk_level_dist.get(risk_level, 0) + 1
-            
-            # Analysis type distribution
-            analysis_type = analysis.analysis_type or "unknown"
-            analysis_type_dist[analysis_type] = analysis_type_dist.get(analysis_type, 0) + 1
-            
-            # High risk count
-            if analysis.overall_risk_score and float(analysis.overall_risk_score) >= 70:
-                high_risk_count += 1
+        # Distributions come back pre-grouped, one row per distinct value,
+        # with missing values already bucketed as "unknown"
+        risk_level = func.coalesce(func.nullif(DocumentAnalysis.risk_level, ""), "unknown")
+        risk_level_dist = dict(
+            db.query(risk_level, func.count(DocumentAnalysis.id))
+            .filter(*filters).group_by(risk_level).all()
+        )
+        
+        analysis_type = func.coalesce(func.nullif(DocumentAnalysis.analysis_type, ""), "unknown")
+        analysis_type_dist = dict(
+            db.query(analysis_type, func.count(DocumentAnalysis.id))
+            .filter(*filters).group_by(analysis_type).all()
+        )
         
         return {
             "total_analyses": total_analyses,
-            "average_risk_score": average_risk_score,
+            "average_risk_score": float(average_risk_score) if average_risk_score is not None else 0,
             "risk_level_distribution": risk_level_dist,
             "analysis_type_distribution": analysis_type_dist,
-            "high_risk_count": high_risk_count
+            "high_risk_count": int(high_risk_count or 0)
         }
 
 
@@ -211,24 +373,59 @@ class CRUDRiskAssessment(CRUDBase[RiskAssessment, dict, dict]):
         db.add(assessment)
         db.commit()
         db.refresh(assessment)
+        invalidate_organization_stats(organization_id)
         return assessment
     
+    def create_assessments_bulk(
+        self,
+        db: Session,
+        *,
+        items: List[Dict[str, Any]],
+        organization_id: UUID,
+        created_by_id: UUID
+    ) -> List[RiskAssessment]:
+        """Create several risk assessments in one INSERT and one commit"""
+        if not items:
+            return []
+        
+        rows = [
+            {**item, "organization_id": organization_id, "created_by_id": created_by_id}
+            for item in items
+        ]
+        # bulk_create keeps the RETURNING values loaded across the commit
+        assessments = self.bulk_create(db, objs_in=rows)
+        invalidate_organization_stats(organization_id)
+        return assessments
+    
     def get_by_deal(
         self,
         db: Session,
         *,
         deal_id: UUID,
-        assessment_type: Optional[str] = None
-    ) -> List[RiskAssessment]:
-        """Get risk assessments for a specific deal"""
-        query = db.query(RiskAssessment).filter(
-            RiskAssessment.deal_id == deal_id
+        assessment_type: Optional[str] = None,
+        limit: int = 100,
+        strict_limit: bool = False,
+        include_relations: bool = False,
+        stream: bool = False
+    ) -> Union[List[RiskAssessment], Iterator[RiskAssessment]]:
+        """Get risk assessments for a specific deal, newest first
+
+        ``limit`` is capped at MAX_PAGE_SIZE (see ``clamp_limit``). With
+        ``stream=True`` every assessment is returned as an iterator fetched in
+        batches over a server-side cursor; consume it before the session is
+        closed.
+        """
+        query = _filtered_query(
+            db, RiskAssessment, deal_id=deal_id, assessment_type=assessment_type
         )
         
-        if assessment_type:
-            query = query.filter(RiskAssessment.assessment_type == assessment_type)
+        if include_relations:
+            query = query.options(*_ASSESSMENT_RELATIONS)
         
-        return query.order_by(desc(RiskAssessment.assessment_date)).all()
+        query = query.order_by(desc(RiskAssessment.assessment_date))
+        if stream:
+            return iter(query.yield_per(STREAM_BATCH_SIZE))
+        return query.limit(clamp_limit(limit, strict=strict_limit)).all()
     
     def get_latest_assessment(
         self,
@@ -253,20 +450,51 @@ class CRUDRiskAssessment(CRUDBase[RiskAssessment, dict, dict]):
         skip: int = 0,
         limit: int = 100,
         assessment_type: Optional[str] = None,
-        risk_level: Optional[str] = None
-    ) -> List[RiskAssessment]:
-        """Get risk assessments by organization"""
-        query = db.query(RiskAssessment).filter(
-            RiskAssessment.organization_id == organization_id
+        risk_level: Optional[str] = None,
+        before_assessment_date: Optional[datetime] = None,
+        before_id: Optional[UUID] = None,
+        include_relations: bool = False,
+        stream: bool = False,
+        summary_only: bool = False
+    ) -> Union[List[RiskAssessment], Iterator[RiskAssessment]]:
+        """Get risk assessments by organization, newest first
+
+        Pass the ``assessment_date`` and ``id`` of the last assessment of the
+        previous page as ``before_assessment_date``/``before_id`` to seek past
+        it instead of scanning and discarding ``skip`` rows. With
+        ``summary_only=True`` only the summary listing columns are loaded.
+
+        With ``stream=True`` the assessments are returned as an iterator
+        fetched in batches over a server-side cursor; consume it before the
+        session is closed.
+        """
+        query = _filtered_query(
+            db,
+            RiskAssessment,
+            organization_id=organization_id,
+            assessment_type=assessment_type,
+            risk_level=risk_level
         )
         
-        if assessment_type:
-            query = query.filter(RiskAssessment.assessment_type == assessment_type)
+        if summary_only:
+            query = query.options(load_only(*_ASSESSMENT_SUMMARY_COLUMNS))
         
-        if risk_level:
-            query = query.filter(RiskAssessment.risk_level == risk_level)
+        if include_relations:
+            query = query.options(*_ASSESSMENT_RELATIONS)
         
-        return query.order_by(desc(RiskAssessment.assessment_date)).offset(skip).limit(limit).all()
+        if before_assessment_date is not None and before_id is not None:
+            query = query.filter(
+                tuple_(RiskAssessment.assessment_date, RiskAssessment.id) < (before_assessment_date, before_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        
+        query = query.order_by(
+            desc(RiskAssessment.assessment_date), desc(RiskAssessment.id)
+        ).limit(limit)
+        if stream:
+            return iter(query.yield_per(STREAM_BATCH_SIZE))
+        return query.all()
     
     def get_critical_assessments(
         self,
@@ -282,6 +510,17 @@ class CRUDRiskAssessment(CRUDBase[RiskAssessment, dict, dict]):
                 RiskAssessment.risk_level == "critical"
             )
         ).order_by(desc(RiskAssessment.overall_risk_score)).limit(limit).all()
+    
+    def has_critical_assessments(self, db: Session, *, organization_id: UUID) -> bool:
+        """Whether the organization has any critical risk assessment"""
+        return bool(
+            db.query(
+                exists().where(
+                    RiskAssessment.organization_id == organization_id,
+                    RiskAssessment.risk_level == "critical"
+                )
+            ).scalar()
+        )
 
 
 class CRUDDocumentCategory(CRUDBase[DocumentCategory, dict, dict]):
@@ -291,12 +530,14 @@ class CRUDDocumentCategory(CRUDBase[DocumentCategory, dict, dict]):
         self,
         db: Session,
         *,
-        organization_id: UUID
+        organization_id: UUID,
+        limit: int = 100,
+        strict_limit: bool = False
     ) -> List[DocumentCategory]:
-        """Get document categories for organization"""
+        """Get document categories for organization, ``limit`` capped at MAX_PAGE_SIZE"""
         return db.query(DocumentCategory).filter(
             DocumentCategory.organization_id == organization_id
-        ).order_by(DocumentCategory.name).all()
+        ).order_by(DocumentCategory.name).limit(clamp_limit(limit, strict=strict_limit)).all()
     
     def get_by_name(
         self,
@@ -353,6 +594,7 @@ class CRUDDocumentReview(CRUDBase[DocumentReview, dict, dict]):
         db.add(review)
         db.commit()
         db.refresh(review)
+        invalidate_organization_stats(organization_id)
         return review
     
     def get_by_document(
@@ -360,38 +602,68 @@ class CRUDDocumentReview(CRUDBase[DocumentReview, dict, dict]):
         db: Session,
         *,
         document_id: UUID,
-        review_type: Optional[str] = None
+        review_type: Optional[str] = None,
+        limit: int = 100,
+        strict_limit: bool = False,
+        include_relations: bool = False
     ) -> List[DocumentReview]:
-        """Get reviews for a specific document"""
-        query = db.query(DocumentReview).filter(
-            DocumentReview.document_id == document_id
+        """Get reviews for a specific document, ``limit`` capped at MAX_PAGE_SIZE"""
+        query = _filtered_query(
+            db, DocumentReview, document_id=document_id, review_type=review_type
         )
         
-        if review_type:
-            query = query.filter(DocumentReview.review_type == review_type)
+        if include_relations:
+            query = query.options(*_REVIEW_RELATIONS)
         
-        return query.order_by(desc(DocumentReview.created_at)).all()
+        return query.order_by(desc(DocumentReview.created_at)).limit(
+            clamp_limit(limit, strict=strict_limit)
+        ).all()
     
     def get_pending_reviews(
         self,
         db: Session,
         *,
         organization_id: UUID,
-        reviewer_id: Optional[UUID] = None
+        reviewer_id: Optional[UUID] = None,
+        limit: int = 100,
+        strict_limit: bool = False,
+        include_relations: bool = False
     ) -> List[DocumentReview]:
-        """Get pending reviews for organization or specific reviewer"""
-        query = db.query(DocumentReview).filter(
-            and_(
-                DocumentReview.organization_id == organization_id,
-                DocumentReview.review_status == "pending"
-            )
+        """Get pending reviews for organization or specific reviewer
+
+        ``limit`` is capped at MAX_PAGE_SIZE (see ``clamp_limit``).
+        """
+        query = _filtered_query(
+            db,
+            DocumentReview,
+            organization_id=organization_id,
+            review_status="pending",
+            reviewer_id=reviewer_id
         )
         
-        if reviewer_id:
-            query = query.filter(DocumentReview.reviewer_id == reviewer_id)
+        if include_relations:
+            query = query.options(*_REVIEW_RELATIONS)
         
-        return query.order_by(DocumentReview.review_deadline).all()
+        return query.order_by(DocumentReview.review_deadline).limit(
+            clamp_limit(limit, strict=strict_limit)
+        ).all()
 
+    
+    def has_pending_reviews(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        reviewer_id: Optional[UUID] = None
+    ) -> bool:
+        """Whether the organization (or reviewer) has any pending review"""
+        criteria = [
+            DocumentReview.organization_id == organization_id,
+            DocumentReview.review_status == "pending"
+        ]
+        if reviewer_id:
+            criteria.append(DocumentReview.reviewer_id == reviewer_id)
+        return bool(db.query(exists().where(*criteria)).scalar())
 
 class CRUDDocumentComparison(CRUDBase[DocumentComparison, dict, dict]):
     """CRUD operations for DocumentComparison"""
@@ -421,21 +693,20 @@ class CRUDDocumentComparison(CRUDBase[DocumentComparison, dict, dict]):
         db: Session,
         *,
         primary_document_id: UUID,
-        secondary_document_id: UUID
+        secondary_document_id: UUID,
+        include_relations: bool = False
     ) -> List[DocumentComparison]:
-        """Get comparisons between two specific documents"""
-        return db.query(DocumentComparison).filter(
-            or_(
-                and_(
-                    DocumentComparison.primary_document_id == primary_document_id,
-                    DocumentComparison.secondary_document_id == secondary_document_id
-                ),
-                and_(
-                    DocumentComparison.primary_document_id == secondary_document_id,
-                    DocumentComparison.secondary_document_id == primary_document_id
-                )
-            )
-        ).order_by(desc(DocumentComparison.comparison_date)).all()
+        """Get comparisons between two specific documents, in either order"""
+        document_id_low, document_id_high = sorted((primary_document_id, secondary_document_id))
+        query = db.query(DocumentComparison).filter(
+            DocumentComparison.document_id_low == document_id_low,
+            DocumentComparison.document_id_high == document_id_high
+        )
+        
+        if include_relations:
+            query = query.options(*_COMPARISON_RELATIONS)
+        
+        return query.order_by(desc(DocumentComparison.comparison_date)).all()
 
 
 # Create instances
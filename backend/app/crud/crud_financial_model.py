@@ -4,11 +4,27 @@ CRUD operations for FinancialModel model
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import func, inspect
 from sqlalchemy.orm import Session
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, clamp_limit
 from app.models.financial_model import FinancialModel
 from app.schemas.financial_model import FinancialModelCreate, FinancialModelUpdate
+from app.services.cache_service import (
+    ORGANIZATION_STATS_TTL,
+    cache_service,
+    invalidate_organization_stats,
+    organization_stats_key,
+)
+
+
+# Columns copied from the original model into a new version; identity,
+# timestamps and version bookkeeping are set explicitly instead
+_VERSIONED_COLUMNS = tuple(
+    attr.key
+    for attr in inspect(FinancialModel).column_attrs
+    if attr.key not in {"id", "created_at", "updated_at", "version", "is_current", "parent_model_id"}
+)
 
 
 class CRUDFinancialModel(CRUDBase[FinancialModel, FinancialModelCreate, FinancialModelUpdate]):
@@ -121,9 +137,14 @@ class CRUDFinancialModel(CRUDBase[FinancialModel, FinancialModelCreate, Financia
     def get_model_versions(
         self, 
         db: Session, 
-        parent_model_id: UUID
+        parent_model_id: UUID,
+        limit: int = 100,
+        strict_limit: bool = False
     ) -> List[FinancialModel]:
-        """Get all versions of a financial model"""
+        """Get the versions of a financial model, newest first
+
+        ``limit`` is capped at MAX_PAGE_SIZE (see ``clamp_limit``).
+        """
         return (
             db.query(self.model)
             .filter(
@@ -131,6 +152,7 @@ class CRUDFinancialModel(CRUDBase[FinancialModel, FinancialModelCreate, Financia
                 (FinancialModel.id == parent_model_id)
             )
             .order_by(FinancialModel.version.desc())
+            .limit(clamp_limit(limit, strict=strict_limit))
             .all()
         )
     
@@ -148,23 +170,21 @@ class CRUDFinancialModel(CRUDBase[FinancialModel, FinancialModelCreate, Financia
         # Mark current model as not current
         original_model.is_current = False
         
-        # Create new version
-        new_version_data = original_model.__dict__.copy()
-        new_version_data.pop('id', None)
-        new_version_data.pop('created_at', None)
-        new_version_data.pop('updated_at', None)
+        # Create new version from the mapped columns only, so no instance
+        # state or loaded relationships are carried over
+        new_version_data = {key: getattr(original_model, key) for key in _VERSIONED_COLUMNS}
         new_version_data['version'] = original_model.version + 1
         new_version_data['is_current'] = True
         new_version_data['parent_model_id'] = original_model.parent_model_id or original_model.id
         
         # Update with new data
-        for field, value in obj_in.dict(exclude_unset=True).items():
-            new_version_data[field] = value
+        new_version_data.update(obj_in.model_dump(exclude_unset=True))
         
         new_model = FinancialModel(**new_version_data)
         db.add(new_model)
         db.commit()
         db.refresh(new_model)
+        invalidate_organization_stats(new_model.organization_id)
         
         return new_model
 
@@ -174,35 +194,31 @@ class CRUDFinancialModel(CRUDBase[FinancialModel, FinancialModelCreate, Financia
         organization_id: UUID
     ) -> dict:
         """Get statistics for financial models"""
-        total_models = (
-            db.query(self.model)
-            .filter(FinancialModel.organization_id == organization_id)
-            .filter(FinancialModel.is_current == True)
-            .count()
-        )
-
-        active_models = (
-            db.query(self.model)
-            .filter(FinancialModel.organization_id == organization_id)
-            .filter(FinancialModel.status == "approved")
-            .filter(FinancialModel.is_current == True)
-            .count()
-        )
-
-        models_in_review = (
-            db.query(self.model)
-            .filter(FinancialModel.organization_id == organization_id)
-            .filter(FinancialModel.status == "review")
-            .filter(FinancialModel.is_current == True)
-            .count()
-        )
+        cache_key = organization_stats_key(organization_id, "financial_models")
+        stats = cache_service.get(cache_key)
+        if stats is None:
+            stats = self._build_model_statistics(db, organization_id)
+            cache_service.set(cache_key, stats, ttl=ORGANIZATION_STATS_TTL)
+        return stats
 
-        draft_models = (
-            db.query(self.model)
+    def _build_model_statistics(
+        self,
+        db: Session,
+        organization_id: UUID
+    ) -> dict:
+        """Count the current financial models served by get_model_statistics"""
+        # One scan over the organization's current models, per-status counts
+        # as FILTER aggregates
+        total_models, active_models, models_in_review, draft_models = (
+            db.query(
+                func.count(FinancialModel.id),
+                func.count(FinancialModel.id).filter(FinancialModel.status == "approved"),
+                func.count(FinancialModel.id).filter(FinancialModel.status == "review"),
+                func.count(FinancialModel.id).filter(FinancialModel.status == "draft")
+            )
             .filter(FinancialModel.organization_id == organization_id)
-            .filter(FinancialModel.status == "draft")
             .filter(FinancialModel.is_current == True)
-            .count()
+            .one()
         )
 
         return {
@@ -1,14 +1,20 @@
 """
 CRUD operations for Organization model
 """
+from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 
 from app.crud.base import CRUDBase
-from app.models.organization import Organization
+from app.models.organization import Organization, OrganizationCounters
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate
+from app.services.cache_service import (
+    ORGANIZATION_STATS_TTL,
+    cache_service,
+    organization_stats_key,
+)
 
 
 class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUpdate]):
@@ -20,6 +26,15 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
     
     def get_organization_stats(self, db: Session, *, organization_id: UUID) -> Dict[str, Any]:
         """Get comprehensive organization statistics"""
+        cache_key = organization_stats_key(organization_id, "organization")
+        stats = cache_service.get(cache_key)
+        if stats is None:
+            stats = self._build_organization_stats(db, organization_id=organization_id)
+            cache_service.set(cache_key, stats, ttl=ORGANIZATION_STATS_TTL)
+        return stats
+    
+    def _build_organization_stats(self, db: Session, *, organization_id: UUID) -> Dict[str, Any]:
+        """Compute the organization statistics served by get_organization_stats"""
         
         # Import here to avoid circular imports
         from app.models.user import User
@@ -28,42 +43,73 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
         from app.models.task import Task
         from app.models.document import Document
         
-        # Get counts for all entities
-        users_count = db.query(User).filter(User.organization_id == organization_id).count()
-        deals_count = db.query(Deal).filter(Deal.organization_id == organization_id).count()
-        clients_count = db.query(Client).filter(Client.organization_id == organization_id).count()
-        tasks_count = db.query(Task).filter(Task.organization_id == organization_id).count()
-        documents_count = db.query(Document).filter(Document.organization_id == organization_id).count()
-        
-        # Get active counts
-        active_users = db.query(User).filter(
-            User.organization_id == organization_id,
-            User.is_active == True
-        ).count()
+        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
         
-        active_deals = db.query(Deal).filter(
-            Deal.organization_id == organization_id,
-            Deal.status == "active"
-        ).count()
+        def count_where(model, *criteria):
+            return (
+                select(func.count())
+                .select_from(model)
+                .where(model.organization_id == organization_id, *criteria)
+                .scalar_subquery()
+            )
         
-        # Get financial metrics
-        total_deal_value = db.query(func.sum(Deal.deal_value)).filter(
-            Deal.organization_id == organization_id
-        ).scalar() or 0
+        recent_deals_query = count_where(Deal, Deal.created_at >= thirty_days_ago)
+        recent_clients_query = count_where(Client, Client.created_at >= thirty_days_ago)
         
-        # Get recent activity counts (last 30 days)
-        from datetime import datetime, timedelta
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        # Entity totals come from the trigger-maintained counters row; only
+        # the 30-day activity window is counted live, in the same SELECT
+        row = db.query(
+            OrganizationCounters.users_count,
+            OrganizationCounters.active_users,
+            OrganizationCounters.deals_count,
+            OrganizationCounters.active_deals,
+            OrganizationCounters.pipeline_value,
+            func.coalesce(
+                OrganizationCounters.pipeline_value / func.nullif(OrganizationCounters.deals_count, 0), 0
+            ),
+            recent_deals_query,
+            OrganizationCounters.clients_count,
+            recent_clients_query,
+            OrganizationCounters.tasks_count,
+            OrganizationCounters.documents_count,
+        ).filter(OrganizationCounters.organization_id == organization_id).one_or_none()
         
-        recent_deals = db.query(Deal).filter(
-            Deal.organization_id == organization_id,
-            Deal.created_at >= thirty_days_ago
-        ).count()
+        if row is None:
+            # No counters row yet (triggers not installed): every metric is a
+            # scalar subquery of one SELECT, still a single round-trip
+            row = db.query(
+                count_where(User),
+                count_where(User, User.is_active == True),
+                count_where(Deal),
+                count_where(Deal, Deal.status == "active"),
+                select(func.coalesce(func.sum(Deal.deal_value), 0))
+                .where(Deal.organization_id == organization_id)
+                .scalar_subquery(),
+                select(
+                    func.coalesce(func.sum(Deal.deal_value) / func.nullif(func.count(Deal.id), 0), 0)
+                )
+                .where(Deal.organization_id == organization_id)
+                .scalar_subquery(),
+                recent_deals_query,
+                count_where(Client),
+                recent_clients_query,
+                count_where(Task),
+                count_where(Document),
+            ).one()
         
-        recent_clients = db.query(Client).filter(
-            Client.organization_id == organization_id,
-            Client.created_at >= thirty_days_ago
-        ).count()
+        (
+            users_count,
+            active_users,
+            deals_count,
+            active_deals,
+            total_deal_value,
+            average_deal_size,
+            recent_deals,
+            clients_count,
+            recent_clients,
+            tasks_count,
+            documents_count,
+        ) = row
         
         return {
             "overview": {
@@ -77,7 +123,7 @@ class CRUDOrganization(CRUDBase[Organization, OrganizationCreate, OrganizationUp
             },
             "financial": {
                 "total_pipeline_value": float(total_deal_value),
-                "average_deal_size": float(total_deal_value / deals_count) if deals_count > 0 else 0
+                "average_deal_size": float(average_deal_size)
             },
             "recent_activity": {
                 "new_deals_30d": recent_deals,
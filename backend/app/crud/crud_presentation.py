@@ -1,21 +1,30 @@
 """
 CRUD operations for Presentation models
 """
-from typing import List, Optional, Dict, Any
-from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Union
+from uuid import UUID, uuid4
+from sqlalchemy.orm import Session, aliased, defer, selectinload
+from sqlalchemy import DateTime, and_, or_, delete, desc, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 from app.crud.base import CRUDBase
+from app.services.cache_service import (
+    cache_service,
+    invalidate_public_templates,
+    public_templates_key,
+)
 from app.models.presentation import (
     Presentation,
     PresentationSlide,
     PresentationTemplate,
     PresentationComment,
     PresentationCollaboration,
+    PresentationCollaborator,
     PresentationStatus,
     PresentationType
 )
+from app.models.user import User
 from app.schemas.presentation import (
     PresentationCreate,
     PresentationUpdate,
@@ -27,6 +36,106 @@ from app.schemas.presentation import (
     PresentationCommentUpdate
 )
 
+# Loader options applied when a caller asks for include_relations, so author,
+# slide, replies and collaborator users arrive in batched IN queries
+_COMMENT_RELATIONS = (
+    selectinload(PresentationComment.author),
+    selectinload(PresentationComment.slide),
+    selectinload(PresentationComment.replies),
+)
+_COLLABORATION_RELATIONS = (selectinload(PresentationCollaboration.user),)
+
+# Fields of the (flat) create schema, resolved once instead of per dump
+_PRESENTATION_CREATE_FIELDS = tuple(PresentationCreate.model_fields)
+
+# Columns a new version copies unchanged from the version it replaces
+_VERSIONED_COLUMNS = (
+    "title", "description", "presentation_type", "content_data", "theme_settings",
+    "layout_settings", "is_shared", "access_level", "collaborators", "tags", "notes",
+    "deal_value", "client_name", "target_audience", "presentation_date",
+    "organization_id", "deal_id",
+)
+
+# Columns a duplicated slide copies unchanged from the original
+_DUPLICATED_SLIDE_COLUMNS = (
+    "slide_type", "content_data", "layout_type", "background_settings", "elements",
+    "animations", "transitions", "notes", "duration_seconds", "presentation_id",
+)
+
+def _sync_collaborators(db: Session, presentation_id: UUID, collaborators: Optional[List[Any]]) -> None:
+    """Rebuild a presentation's presentation_collaborators rows from its
+    collaborators array (flushed first); ids that are not users are skipped"""
+    db.execute(
+        delete(PresentationCollaborator)
+        .where(PresentationCollaborator.presentation_id == presentation_id)
+    )
+    user_ids = set()
+    for value in collaborators or []:
+        try:
+            user_ids.add(UUID(str(value)))
+        except ValueError:
+            continue
+    if user_ids:
+        db.execute(
+            insert(PresentationCollaborator).from_select(
+                ["user_id", "presentation_id"],
+                select(
+                    User.id,
+                    literal(presentation_id, PresentationCollaborator.presentation_id.type)
+                ).where(User.id.in_(user_ids))
+            )
+        )
+
+
+# Public templates change rarely but are listed on every editor load; pages
+# are cached as column snapshots and dropped on any template write
+PUBLIC_TEMPLATES_TTL = 300
+
+# Cached snapshots are JSON, so these columns come back as strings
+_TEMPLATE_UUID_COLUMNS = tuple(
+    column.key for column in PresentationTemplate.__table__.columns
+    if isinstance(column.type, PG_UUID)
+)
+_TEMPLATE_DATETIME_COLUMNS = tuple(
+    column.key for column in PresentationTemplate.__table__.columns
+    if isinstance(column.type, DateTime)
+)
+
+
+def _template_from_snapshot(row: Dict[str, Any]) -> PresentationTemplate:
+    """Rebuild a detached template from a cached column snapshot"""
+    for name in _TEMPLATE_UUID_COLUMNS:
+        if row.get(name) is not None:
+            row[name] = UUID(row[name])
+    for name in _TEMPLATE_DATETIME_COLUMNS:
+        if row.get(name) is not None:
+            row[name] = datetime.fromisoformat(row[name])
+    return PresentationTemplate(**row)
+
+
+# Slide content and design payloads, left out of metadata-only listings
+_PRESENTATION_CONTENT_COLUMNS = (
+    Presentation.content_data,
+    Presentation.theme_settings,
+    Presentation.layout_settings,
+)
+
+
+def _current_presentations(db: Session, organization_id: UUID, *criteria, summary_only: bool = False):
+    """Current-version presentations of an organization, newest first
+
+    With ``summary_only=True`` the content columns are deferred; they
+    lazy-load per row if accessed, so only pass it when they are not.
+    """
+    query = db.query(Presentation).filter(
+        Presentation.organization_id == organization_id,
+        Presentation.is_current == True,
+        *criteria
+    )
+    if summary_only:
+        query = query.options(*(defer(column) for column in _PRESENTATION_CONTENT_COLUMNS))
+    return query.order_by(desc(Presentation.updated_at))
+
 
 class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUpdate]):
     """CRUD operations for Presentation"""
@@ -41,24 +150,23 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         status: Optional[str] = None,
         presentation_type: Optional[str] = None,
         created_by_id: Optional[UUID] = None,
-        deal_id: Optional[UUID] = None
+        deal_id: Optional[UUID] = None,
+        summary_only: bool = False
     ) -> List[Presentation]:
         """Get presentations by organization with optional filters"""
-        query = db.query(Presentation).filter(
-            Presentation.organization_id == organization_id,
-            Presentation.is_current == True  # Only get current versions
-        )
-        
+        criteria = []
         if status:
-            query = query.filter(Presentation.status == status)
+            criteria.append(Presentation.status == status)
         if presentation_type:
-            query = query.filter(Presentation.presentation_type == presentation_type)
+            criteria.append(Presentation.presentation_type == presentation_type)
         if created_by_id:
-            query = query.filter(Presentation.created_by_id == created_by_id)
+            criteria.append(Presentation.created_by_id == created_by_id)
         if deal_id:
-            query = query.filter(Presentation.deal_id == deal_id)
+            criteria.append(Presentation.deal_id == deal_id)
         
-        return query.order_by(desc(Presentation.updated_at)).offset(skip).limit(limit).all()
+        return _current_presentations(
+            db, organization_id, *criteria, summary_only=summary_only
+        ).offset(skip).limit(limit).all()
     
     def get_by_deal(
         self,
@@ -67,16 +175,13 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         deal_id: UUID,
         organization_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        summary_only: bool = False
     ) -> List[Presentation]:
         """Get presentations by deal"""
-        return db.query(Presentation).filter(
-            and_(
-                Presentation.deal_id == deal_id,
-                Presentation.organization_id == organization_id,
-                Presentation.is_current == True
-            )
-        ).order_by(desc(Presentation.updated_at)).offset(skip).limit(limit).all()
+        return _current_presentations(
+            db, organization_id, Presentation.deal_id == deal_id, summary_only=summary_only
+        ).offset(skip).limit(limit).all()
     
     def get_shared_presentations(
         self,
@@ -85,20 +190,23 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         user_id: UUID,
         organization_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        summary_only: bool = False
     ) -> List[Presentation]:
         """Get presentations shared with user"""
-        return db.query(Presentation).filter(
-            and_(
-                Presentation.organization_id == organization_id,
-                Presentation.is_shared == True,
-                Presentation.is_current == True,
-                or_(
-                    Presentation.collaborators.contains([str(user_id)]),
-                    Presentation.access_level.in_(["team", "organization", "public"])
-                )
-            )
-        ).order_by(desc(Presentation.updated_at)).offset(skip).limit(limit).all()
+        return _current_presentations(
+            db,
+            organization_id,
+            Presentation.is_shared == True,
+            or_(
+                Presentation.id.in_(
+                    select(PresentationCollaborator.presentation_id)
+                    .where(PresentationCollaborator.user_id == user_id)
+                ),
+                Presentation.access_level.in_(["team", "organization", "public"])
+            ),
+            summary_only=summary_only
+        ).offset(skip).limit(limit).all()
     
     def create_with_user(
         self,
@@ -108,14 +216,15 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         created_by_id: UUID
     ) -> Presentation:
         """Create presentation with user context"""
-        obj_in_data = obj_in.dict()
+        obj_in_data = {field: getattr(obj_in, field) for field in _PRESENTATION_CREATE_FIELDS}
         obj_in_data["created_by_id"] = created_by_id
         obj_in_data["last_modified_by_id"] = created_by_id
         
         db_obj = Presentation(**obj_in_data)
         db.add(db_obj)
+        db.flush()
+        _sync_collaborators(db, db_obj.id, db_obj.collaborators)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
     
     def update_with_user(
@@ -127,15 +236,18 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         updated_by_id: UUID
     ) -> Presentation:
         """Update presentation with user context"""
-        update_data = obj_in.dict(exclude_unset=True)
+        # Only the fields the client sent, as exclude_unset would select
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         update_data["last_modified_by_id"] = updated_by_id
         
         for field, value in update_data.items():
             setattr(db_obj, field, value)
         
         db.add(db_obj)
+        if "collaborators" in update_data:
+            db.flush()
+            _sync_collaborators(db, db_obj.id, db_obj.collaborators)
         db.commit()
-        db.refresh(db_obj)
         return db_obj
     
     def create_version(
@@ -146,47 +258,43 @@ class CRUDPresentation(CRUDBase[Presentation, PresentationCreate, PresentationUp
         created_by_id: UUID
     ) -> Presentation:
         """Create a new version of an existing presentation"""
-        # Get the current presentation
-        current_presentation = db.query(Presentation).filter(
-            Presentation.id == presentation_id
+        now = datetime.utcnow()
+        
+        # Mark current presentation as not current; no row means no presentation
+        retired = db.execute(
+            update(Presentation)
+            .where(Presentation.id == presentation_id)
+            .values(is_current=False, updated_at=now)
+            .returning(Presentation.id)
         ).first()
         
-        if not current_presentation:
+        if not retired:
             return None
         
-        # Mark current presentation as not current
-        current_presentation.is_current = False
-        
-        # Create new version
-        new_version_data = {
-            "title": current_presentation.title,
-            "description": current_presentation.description,
-            "presentation_type": current_presentation.presentation_type,
-            "content_data": current_presentation.content_data,
-            "theme_settings": current_presentation.theme_settings,
-            "layout_settings": current_presentation.layout_settings,
-            "is_shared": current_presentation.is_shared,
-            "access_level": current_presentation.access_level,
-            "collaborators": current_presentation.collaborators,
-            "tags": current_presentation.tags,
-            "notes": current_presentation.notes,
-            "deal_value": current_presentation.deal_value,
-            "client_name": current_presentation.client_name,
-            "target_audience": current_presentation.target_audience,
-            "presentation_date": current_presentation.presentation_date,
-            "organization_id": current_presentation.organization_id,
-            "deal_id": current_presentation.deal_id,
-            "created_by_id": created_by_id,
-            "last_modified_by_id": created_by_id,
-            "parent_presentation_id": current_presentation.id,
-            "version": current_presentation.version + 1,
-            "status": PresentationStatus.DRAFT
+        # Copy the row server-side into the new version, so its content never
+        # travels through Python; both statements commit together
+        new_values = {
+            **{name: getattr(Presentation, name) for name in _VERSIONED_COLUMNS},
+            "id": literal(uuid4(), Presentation.id.type),
+            "created_by_id": literal(created_by_id, Presentation.created_by_id.type),
+            "last_modified_by_id": literal(created_by_id, Presentation.last_modified_by_id.type),
+            "parent_presentation_id": Presentation.id,
+            "version": Presentation.version + 1,
+            "is_current": literal(True),
+            "status": literal(PresentationStatus.DRAFT, Presentation.status.type),
+            "created_at": literal(now, Presentation.created_at.type),
+            "updated_at": literal(now, Presentation.updated_at.type),
         }
-        
-        new_presentation = Presentation(**new_version_data)
-        db.add(new_presentation)
+        new_presentation = db.scalars(
+            insert(Presentation)
+            .from_select(
+                list(new_values),
+                select(*new_values.values()).where(Presentation.id == presentation_id)
+            )
+            .returning(Presentation)
+        ).one()
+        _sync_collaborators(db, new_presentation.id, new_presentation.collaborators)
         db.commit()
-        db.refresh(new_presentation)
         
         return new_presentation
 
@@ -215,24 +323,35 @@ class CRUDPresentationSlide(CRUDBase[PresentationSlide, PresentationSlideCreate,
         slide_orders: List[Dict[str, Any]]
     ) -> List[PresentationSlide]:
         """Reorder slides in a presentation"""
-        slides = []
-        for order_data in slide_orders:
-            slide = db.query(PresentationSlide).filter(
+        slide_numbers = {
+            UUID(str(order_data["slide_id"])): order_data["slide_number"]
+            for order_data in slide_orders
+        }
+        if not slide_numbers:
+            return []
+        
+        # One SELECT keeps only the ids that belong to this presentation
+        slide_ids = [
+            slide_id for (slide_id,) in db.query(PresentationSlide.id).filter(
                 and_(
-                    PresentationSlide.id == order_data["slide_id"],
-                    PresentationSlide.presentation_id == presentation_id
+                    PresentationSlide.presentation_id == presentation_id,
+                    PresentationSlide.id.in_(slide_numbers)
                 )
-            ).first()
-            
-            if slide:
-                slide.slide_number = order_data["slide_number"]
-                slides.append(slide)
+            )
+        ]
+        if not slide_ids:
+            return []
         
+        # One executemany UPDATE by primary key for the whole reorder
+        db.bulk_update_mappings(
+            PresentationSlide,
+            [{"id": slide_id, "slide_number": slide_numbers[slide_id]} for slide_id in slide_ids]
+        )
         db.commit()
-        for slide in slides:
-            db.refresh(slide)
         
-        return slides
+        return db.query(PresentationSlide).filter(
+            PresentationSlide.id.in_(slide_ids)
+        ).order_by(PresentationSlide.slide_number).all()
     
     def duplicate_slide(
         self,
@@ -242,46 +361,47 @@ class CRUDPresentationSlide(CRUDBase[PresentationSlide, PresentationSlideCreate,
         new_slide_number: int
     ) -> Optional[PresentationSlide]:
         """Duplicate a slide"""
-        original_slide = db.query(PresentationSlide).filter(
-            PresentationSlide.id == slide_id
-        ).first()
-        
-        if not original_slide:
-            return None
+        original = aliased(PresentationSlide, name="original")
+        now = datetime.utcnow()
         
-        # Shift existing slides
-        db.query(PresentationSlide).filter(
-            and_(
-                PresentationSlide.presentation_id == original_slide.presentation_id,
+        # Shift existing slides in a CTE of the same INSERT, so the shift and
+        # the copy run as one atomic statement in one round-trip
+        shifted = (
+            update(PresentationSlide)
+            .where(
+                PresentationSlide.presentation_id == select(original.presentation_id)
+                .where(original.id == slide_id)
+                .scalar_subquery(),
                 PresentationSlide.slide_number >= new_slide_number
             )
-        ).update({"slide_number": PresentationSlide.slide_number + 1})
+            .values(slide_number=PresentationSlide.slide_number + 1, updated_at=now)
+            .returning(PresentationSlide.id)
+            .cte("shifted")
+        )
         
-        # Create duplicate
-        duplicate_data = {
-            "title": f"{original_slide.title} (Copy)",
-            "slide_number": new_slide_number,
-            "slide_type": original_slide.slide_type,
-            "content_data": original_slide.content_data,
-            "layout_type": original_slide.layout_type,
-            "background_settings": original_slide.background_settings,
-            "elements": original_slide.elements,
-            "animations": original_slide.animations,
-            "transitions": original_slide.transitions,
-            "notes": original_slide.notes,
-            "duration_seconds": original_slide.duration_seconds,
-            "presentation_id": original_slide.presentation_id
+        # Create duplicate; an unknown slide selects no row and shifts nothing
+        duplicate_values = {
+            **{name: getattr(original, name) for name in _DUPLICATED_SLIDE_COLUMNS},
+            "id": literal(uuid4(), PresentationSlide.id.type),
+            "title": func.concat(original.title, " (Copy)"),
+            "slide_number": literal(new_slide_number, PresentationSlide.slide_number.type),
+            "created_at": literal(now, PresentationSlide.created_at.type),
+            "updated_at": literal(now, PresentationSlide.updated_at.type),
         }
-        
-        duplicate_slide = PresentationSlide(**duplicate_data)
-        db.add(duplicate_slide)
+        duplicate_slide = db.scalars(
+            insert(PresentationSlide)
+            .from_select(
+                list(duplicate_values),
+                select(*duplicate_values.values()).where(original.id == slide_id)
+            )
+            .add_cte(shifted)
+            .returning(PresentationSlide)
+        ).first()
         db.commit()
-        db.refresh(duplicate_slide)
         
         return duplicate_slide
 
 
-
 class CRUDPresentationTemplate(CRUDBase[PresentationTemplate, PresentationTemplateCreate, PresentationTemplateUpdate]):
     """CRUD operations for PresentationTemplate"""
 
@@ -294,7 +414,16 @@ class CRUDPresentationTemplate(CRUDBase[PresentationTemplate, PresentationTempla
         category: Optional[str] = None,
         featured_only: bool = False
     ) -> List[PresentationTemplate]:
-        """Get public templates"""
+        """Get public templates
+
+        Pages are served from cache when warm, as detached read-only
+        instances rebuilt from their column values.
+        """
+        cache_key = public_templates_key(category, featured_only, skip, limit)
+        rows = cache_service.get(cache_key)
+        if rows is not None:
+            return [_template_from_snapshot(row) for row in rows]
+
         query = db.query(PresentationTemplate).filter(
             PresentationTemplate.is_public == True
         )
@@ -304,11 +433,16 @@ class CRUDPresentationTemplate(CRUDBase[PresentationTemplate, PresentationTempla
         if featured_only:
             query = query.filter(PresentationTemplate.is_featured == True)
 
-        return query.order_by(
+        templates = query.order_by(
             desc(PresentationTemplate.is_featured),
             desc(PresentationTemplate.usage_count)
         ).offset(skip).limit(limit).all()
 
+        cache_service.set(
+            cache_key, [template.to_dict() for template in templates], ttl=PUBLIC_TEMPLATES_TTL
+        )
+        return templates
+
     def get_by_organization(
         self,
         db: Session,
@@ -341,17 +475,50 @@ class CRUDPresentationTemplate(CRUDBase[PresentationTemplate, PresentationTempla
         template_id: UUID
     ) -> Optional[PresentationTemplate]:
         """Increment template usage count"""
-        template = db.query(PresentationTemplate).filter(
-            PresentationTemplate.id == template_id
+        # Incremented server-side in one atomic round-trip, so concurrent
+        # uses of a template never lose a count
+        template = db.scalars(
+            update(PresentationTemplate)
+            .where(PresentationTemplate.id == template_id)
+            .values(usage_count=PresentationTemplate.usage_count + 1)
+            .returning(PresentationTemplate)
         ).first()
 
         if template:
-            template.usage_count += 1
             db.commit()
-            db.refresh(template)
+            invalidate_public_templates()
 
         return template
 
+    def create(
+        self,
+        db: Session,
+        *,
+        obj_in: Union[PresentationTemplateCreate, Dict[str, Any]]
+    ) -> PresentationTemplate:
+        """Create a template and drop the cached public listings"""
+        template = super().create(db, obj_in=obj_in)
+        invalidate_public_templates()
+        return template
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: PresentationTemplate,
+        obj_in: Union[PresentationTemplateUpdate, Dict[str, Any]]
+    ) -> PresentationTemplate:
+        """Update a template and drop the cached public listings"""
+        template = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        invalidate_public_templates()
+        return template
+
+    def remove(self, db: Session, *, id: Any) -> PresentationTemplate:
+        """Delete a template and drop the cached public listings"""
+        template = super().remove(db, id=id)
+        invalidate_public_templates()
+        return template
+
 
 class CRUDPresentationComment(CRUDBase[PresentationComment, PresentationCommentCreate, PresentationCommentUpdate]):
     """CRUD operations for PresentationComment"""
@@ -363,7 +530,8 @@ class CRUDPresentationComment(CRUDBase[PresentationComment, PresentationCommentC
         presentation_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        resolved_only: Optional[bool] = None
+        resolved_only: Optional[bool] = None,
+        include_relations: bool = False
     ) -> List[PresentationComment]:
         """Get comments by presentation"""
         query = db.query(PresentationComment).filter(
@@ -374,6 +542,9 @@ class CRUDPresentationComment(CRUDBase[PresentationComment, PresentationCommentC
         if resolved_only is not None:
             query = query.filter(PresentationComment.is_resolved == resolved_only)
 
+        if include_relations:
+            query = query.options(*_COMMENT_RELATIONS)
+
         return query.order_by(desc(PresentationComment.created_at)).offset(skip).limit(limit).all()
 
     def get_by_slide(
@@ -382,13 +553,19 @@ class CRUDPresentationComment(CRUDBase[PresentationComment, PresentationCommentC
         *,
         slide_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_relations: bool = False
     ) -> List[PresentationComment]:
         """Get comments by slide"""
-        return db.query(PresentationComment).filter(
+        query = db.query(PresentationComment).filter(
             PresentationComment.slide_id == slide_id,
             PresentationComment.parent_comment_id.is_(None)
-        ).order_by(desc(PresentationComment.created_at)).offset(skip).limit(limit).all()
+        )
+
+        if include_relations:
+            query = query.options(*_COMMENT_RELATIONS)
+
+        return query.order_by(desc(PresentationComment.created_at)).offset(skip).limit(limit).all()
 
     def resolve_comment(
         self,
@@ -398,18 +575,21 @@ class CRUDPresentationComment(CRUDBase[PresentationComment, PresentationCommentC
         resolved_by_id: UUID
     ) -> Optional[PresentationComment]:
         """Resolve a comment"""
-        from datetime import datetime
-
-        comment = db.query(PresentationComment).filter(
-            PresentationComment.id == comment_id
+        comment = db.scalars(
+            update(PresentationComment)
+            .where(PresentationComment.id == comment_id)
+            .values(
+                is_resolved=True,
+                resolved_by_id=resolved_by_id,
+                # Stamped by the database clock (now() on PostgreSQL,
+                # CURRENT_TIMESTAMP on SQLite)
+                resolved_at=func.now()
+            )
+            .returning(PresentationComment)
         ).first()
 
         if comment:
-            comment.is_resolved = True
-            comment.resolved_by_id = resolved_by_id
-            comment.resolved_at = datetime.utcnow()
             db.commit()
-            db.refresh(comment)
 
         return comment
 
@@ -438,9 +618,26 @@ class CRUDPresentationCollaboration(CRUDBase[PresentationCollaboration, dict, di
 
         db.add(activity)
         db.commit()
-        db.refresh(activity)
         return activity
 
+    def bulk_log_activity(
+        self,
+        db: Session,
+        *,
+        activities: List[Dict[str, Any]]
+    ) -> List[UUID]:
+        """Log several collaboration activities with one multi-row INSERT"""
+        if not activities:
+            return []
+
+        rows = [{"activity_data": {}, **activity} for activity in activities]
+        activity_ids = list(db.scalars(
+            insert(PresentationCollaboration).returning(PresentationCollaboration.id),
+            rows
+        ))
+        db.commit()
+        return activity_ids
+
     def get_recent_activities(
         self,
         db: Session,
@@ -458,15 +655,21 @@ class CRUDPresentationCollaboration(CRUDBase[PresentationCollaboration, dict, di
         self,
         db: Session,
         *,
-        presentation_id: UUID
+        presentation_id: UUID,
+        include_relations: bool = True
     ) -> List[PresentationCollaboration]:
         """Get currently active users on a presentation"""
-        return db.query(PresentationCollaboration).filter(
+        query = db.query(PresentationCollaboration).filter(
             and_(
                 PresentationCollaboration.presentation_id == presentation_id,
                 PresentationCollaboration.is_active == True
             )
-        ).all()
+        )
+
+        if include_relations:
+            query = query.options(*_COLLABORATION_RELATIONS)
+
+        return query.all()
 
 
 # Create CRUD instances
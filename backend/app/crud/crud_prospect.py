@@ -1,15 +1,20 @@
 """
 CRUD operations for Prospect AI module
 """
-from typing import List, Optional, Dict, Any
+import json
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Union
 from uuid import UUID
 from datetime import datetime, timedelta
 from decimal import Decimal
+from itertools import groupby
+from operator import attrgetter
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc, func
+from sqlalchemy import and_, or_, desc, asc, func, case, exists, insert, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, STREAM_BATCH_SIZE
 from app.models.prospect import Prospect, ProspectAnalysis, MarketIntelligence
 from app.schemas.prospect import (
     ProspectCreate, 
@@ -19,9 +24,89 @@ from app.schemas.prospect import (
 )
 
 
+# Statuses worked through the follow-up queue (matches the predicate of the
+# idx_prospects_follow_up_queue partial index)
+_FOLLOW_UP_STATUSES = ("contacted", "engaged")
+
+# Planner estimates below this many rows (or pages starting past it) are
+# replaced by an exact count, which is cheap there and keeps the last pages
+# of a listing accurate
+APPROXIMATE_COUNT_THRESHOLD = 10000
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement, with its parameters bound as usual"""
+    inherit_cache = False
+    
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
     """CRUD operations for Prospect"""
     
+    def _apply_prospect_filters(self, query, filters: Optional[ProspectSearchRequest]):
+        """Apply the optional search filters shared by the prospect listings"""
+        if not filters:
+            return query
+        
+        # Equality predicates first, then ranges, then the ILIKE text
+        # matches, so the most selective conditions lead the WHERE clause
+        if filters.industry:
+            query = query.filter(Prospect.industry == filters.industry)
+        
+        if filters.status:
+            query = query.filter(Prospect.status == filters.status)
+        
+        if filters.stage:
+            query = query.filter(Prospect.stage == filters.stage)
+        
+        if filters.priority:
+            query = query.filter(Prospect.priority == filters.priority)
+        
+        if filters.assigned_to_id:
+            query = query.filter(Prospect.assigned_to_id == filters.assigned_to_id)
+        
+        if filters.min_revenue:
+            query = query.filter(Prospect.revenue >= filters.min_revenue)
+        
+        if filters.max_revenue:
+            query = query.filter(Prospect.revenue <= filters.max_revenue)
+        
+        if filters.min_ai_score:
+            query = query.filter(Prospect.ai_score >= filters.min_ai_score)
+        
+        if filters.location:
+            query = query.filter(Prospect.location.ilike(f"%{filters.location}%"))
+        
+        if filters.query:
+            search_term = f"%{filters.query}%"
+            query = query.filter(
+                or_(
+                    Prospect.company_name.ilike(search_term),
+                    Prospect.description.ilike(search_term),
+                    Prospect.industry.ilike(search_term)
+                )
+            )
+        
+        return query
+    
+    def _apply_prospect_sort(self, query, filters: Optional[ProspectSearchRequest]):
+        """Order a prospect listing by the requested column, AI score by default"""
+        if not filters:
+            # Default sorting by AI score descending
+            return query.order_by(desc(Prospect.ai_score))
+        
+        sort_column = getattr(Prospect, filters.sort_by, Prospect.ai_score)
+        if filters.sort_order == "desc":
+            return query.order_by(desc(sort_column))
+        return query.order_by(asc(sort_column))
+    
     def get_by_organization(
         self,
         db: Session,
@@ -29,62 +114,65 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
         organization_id: UUID,
         skip: int = 0,
         limit: int = 100,
-        filters: Optional[ProspectSearchRequest] = None
-    ) -> List[Prospect]:
-        """Get prospects by organization with optional filters"""
+        filters: Optional[ProspectSearchRequest] = None,
+        stream: bool = False
+    ) -> Union[List[Prospect], Iterator[Prospect]]:
+        """Get prospects by organization with optional filters
+
+        With ``stream=True`` every matching prospect is returned as an
+        iterator fetched in batches over a server-side cursor, for exports;
+        consume it before the session is closed.
+        """
         query = db.query(Prospect).filter(Prospect.organization_id == organization_id)
+        query = self._apply_prospect_filters(query, filters)
+        query = self._apply_prospect_sort(query, filters)
         
-        if filters:
-            # Apply search filters
-            if filters.query:
-                search_term = f"%{filters.query}%"
-                query = query.filter(
-                    or_(
-                        Prospect.company_name.ilike(search_term),
-                        Prospect.description.ilike(search_term),
-                        Prospect.industry.ilike(search_term)
-                    )
-                )
-            
-            if filters.industry:
-                query = query.filter(Prospect.industry == filters.industry)
-            
-            if filters.location:
-                query = query.filter(Prospect.location.ilike(f"%{filters.location}%"))
-            
-            if filters.min_revenue:
-                query = query.filter(Prospect.revenue >= filters.min_revenue)
-            
-            if filters.max_revenue:
-                query = query.filter(Prospect.revenue <= filters.max_revenue)
-            
-            if filters.min_ai_score:
-                query = query.filter(Prospect.ai_score >= filters.min_ai_score)
-            
-            if filters.status:
-                query = query.filter(Prospect.status == filters.status)
-            
-            if filters.stage:
-                query = query.filter(Prospect.stage == filters.stage)
-            
-            if filters.priority:
-                query = query.filter(Prospect.priority == filters.priority)
-            
-            if filters.assigned_to_id:
-                query = query.filter(Prospect.assigned_to_id == filters.assigned_to_id)
-            
-            # Apply sorting
-            sort_column = getattr(Prospect, filters.sort_by, Prospect.ai_score)
-            if filters.sort_order == "desc":
-                query = query.order_by(desc(sort_column))
-            else:
-                query = query.order_by(asc(sort_column))
-        else:
-            # Default sorting by AI score descending
-            query = query.order_by(desc(Prospect.ai_score))
-        
+        if stream:
+            return iter(query.yield_per(STREAM_BATCH_SIZE))
         return query.offset(skip).limit(limit).all()
     
+    def get_page_by_organization(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[ProspectSearchRequest] = None,
+        approximate_total: bool = False
+    ) -> Tuple[List[Prospect], int]:
+        """Get a page of prospects together with the total filtered count
+
+        With ``approximate_total=True`` the total is the planner's estimate
+        from ``approximate_count_by_organization`` instead of an exact count.
+        """
+        if approximate_total:
+            query = db.query(Prospect).filter(Prospect.organization_id == organization_id)
+            query = self._apply_prospect_filters(query, filters)
+            query = self._apply_prospect_sort(query, filters)
+            total = self.approximate_count_by_organization(
+                db, organization_id=organization_id, filters=filters, skip=skip
+            )
+            return query.offset(skip).limit(limit).all(), total
+        
+        # The total rides along on every row as a window count, so the page
+        # and the count share one round-trip and one filtered scan
+        query = db.query(Prospect, func.count().over().label("total")).filter(
+            Prospect.organization_id == organization_id
+        )
+        query = self._apply_prospect_filters(query, filters)
+        query = self._apply_prospect_sort(query, filters)
+        
+        rows = query.offset(skip).limit(limit).all()
+        if rows:
+            return [row.Prospect for row in rows], rows[0].total
+        
+        # A page past the end carries no rows to read the total from
+        total = self.count_by_organization(
+            db, organization_id=organization_id, filters=filters
+        ) if skip else 0
+        return [], total
+    
     def count_by_organization(
         self,
         db: Session,
@@ -96,48 +184,40 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
         query = db.query(func.count(Prospect.id)).filter(
             Prospect.organization_id == organization_id
         )
-        
-        if filters:
-            # Apply same filters as get_by_organization
-            if filters.query:
-                search_term = f"%{filters.query}%"
-                query = query.filter(
-                    or_(
-                        Prospect.company_name.ilike(search_term),
-                        Prospect.description.ilike(search_term),
-                        Prospect.industry.ilike(search_term)
-                    )
-                )
-            
-            if filters.industry:
-                query = query.filter(Prospect.industry == filters.industry)
-            
-            if filters.location:
-                query = query.filter(Prospect.location.ilike(f"%{filters.location}%"))
-            
-            if filters.min_revenue:
-                query = query.filter(Prospect.revenue >= filters.min_revenue)
-            
-            if filters.max_revenue:
-                query = query.filter(Prospect.revenue <= filters.max_revenue)
-            
-            if filters.min_ai_score:
-                query = query.filter(Prospect.ai_score >= filters.min_ai_score)
-            
-            if filters.status:
-                query = query.filter(Prospect.status == filters.status)
-            
-            if filters.stage:
-                query = query.filter(Prospect.stage == filters.stage)
-            
-            if filters.priority:
-                query = query.filter(Prospect.priority == filters.priority)
-            
-            if filters.assigned_to_id:
-                query = query.filter(Prospect.assigned_to_id == filters.assigned_to_id)
+        query = self._apply_prospect_filters(query, filters)
         
         return query.scalar()
     
+    def approximate_count_by_organization(
+        self,
+        db: Session,
+        *,
+        organization_id: UUID,
+        filters: Optional[ProspectSearchRequest] = None,
+        skip: int = 0
+    ) -> int:
+        """Estimate the number of prospects matching the filters
+
+        Reads the row estimate PostgreSQL's planner makes for the filtered
+        listing instead of counting it, for "page 1 of ~N" pagination on
+        large organizations. Falls back to ``count_by_organization`` on other
+        databases, for small estimates and for pages deep in the listing.
+        """
+        if skip > APPROXIMATE_COUNT_THRESHOLD or db.get_bind().dialect.name != "postgresql":
+            return self.count_by_organization(db, organization_id=organization_id, filters=filters)
+        
+        query = db.query(Prospect.id).filter(Prospect.organization_id == organization_id)
+        query = self._apply_prospect_filters(query, filters)
+        
+        plan = db.execute(_ExplainJSON(query.statement)).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        
+        if estimate < APPROXIMATE_COUNT_THRESHOLD:
+            return self.count_by_organization(db, organization_id=organization_id, filters=filters)
+        return estimate
+    
     def get_by_company_name(
         self,
         db: Session,
@@ -153,6 +233,19 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
             )
         ).first()
     
+    def exists_by_company_name(
+        self,
+        db: Session,
+        *,
+        company_name: str,
+        organization_id: UUID
+    ) -> bool:
+        """Whether the organization already has a prospect with this company name"""
+        return bool(db.query(exists().where(
+            Prospect.company_name == company_name,
+            Prospect.organization_id == organization_id
+        )).scalar())
+    
     def get_high_priority_prospects(
         self,
         db: Session,
@@ -186,10 +279,35 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
             and_(
                 Prospect.organization_id == organization_id,
                 Prospect.next_follow_up <= cutoff_date,
-                Prospect.status.in_(["contacted", "engaged"])
+                Prospect.status.in_(_FOLLOW_UP_STATUSES)
             )
         ).order_by(Prospect.next_follow_up).all()
     
+    def get_prospects_requiring_follow_up_all_orgs(
+        self,
+        db: Session,
+        *,
+        days_ahead: int = 7
+    ) -> Dict[UUID, List[Prospect]]:
+        """Get prospects requiring follow-up for every organization at once
+
+        One query for scheduled runs instead of one per organization; the
+        result maps organization id to its prospects, earliest follow-up first.
+        """
+        cutoff_date = datetime.utcnow() + timedelta(days=days_ahead)
+        
+        prospects = db.query(Prospect).filter(
+            and_(
+                Prospect.next_follow_up <= cutoff_date,
+                Prospect.status.in_(_FOLLOW_UP_STATUSES)
+            )
+        ).order_by(Prospect.organization_id, Prospect.next_follow_up).all()
+        
+        return {
+            organization_id: list(group)
+            for organization_id, group in groupby(prospects, key=attrgetter("organization_id"))
+        }
+    
     def update_ai_scores(
         self,
         db: Session,
@@ -204,33 +322,37 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
         recommended_approach: Optional[str] = None
     ) -> Prospect:
         """Update AI scoring results for a prospect"""
-        prospect = db.query(Prospect).filter(Prospect.id == prospect_id).first()
+        values = {
+            "ai_score": ai_score,
+            "confidence_level": confidence_level,
+            "deal_probability": deal_probability,
+            "analysis_date": datetime.utcnow(),
+            # Update status if it's still in initial stages
+            "status": case(
+                (Prospect.status == "identified", "analyzing"),
+                else_=Prospect.status
+            ),
+        }
+        
+        if estimated_deal_size is not None:
+            values["estimated_deal_size"] = estimated_deal_size
+        
+        if risk_factors is not None:
+            values["risk_factors"] = risk_factors
+        
+        if opportunities is not None:
+            values["opportunities"] = opportunities
+        
+        if recommended_approach is not None:
+            values["recommended_approach"] = recommended_approach
+        
+        # One UPDATE ... RETURNING instead of load, modify, commit and refresh
+        prospect = db.scalars(
+            update(Prospect).where(Prospect.id == prospect_id).values(**values).returning(Prospect)
+        ).first()
         
         if prospect:
-            prospect.ai_score = ai_score
-            prospect.confidence_level = confidence_level
-            prospect.deal_probability = deal_probability
-            prospect.analysis_date = datetime.utcnow()
-            
-            if estimated_deal_size is not None:
-                prospect.estimated_deal_size = estimated_deal_size
-            
-            if risk_factors is not None:
-                prospect.risk_factors = risk_factors
-            
-            if opportunities is not None:
-                prospect.opportunities = opportunities
-            
-            if recommended_approach is not None:
-                prospect.recommended_approach = recommended_approach
-            
-            # Update status if it's still in initial stages
-            if prospect.status == "identified":
-                prospect.status = "analyzing"
-            
-            db.add(prospect)
             db.commit()
-            db.refresh(prospect)
         
         return prospect
     
@@ -242,14 +364,20 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
         industry: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get statistics for prospects by industry"""
-        query = db.query(Prospect).filter(Prospect.organization_id == organization_id)
+        filters = [Prospect.organization_id == organization_id]
         
         if industry:
-            query = query.filter(Prospect.industry == industry)
+            filters.append(Prospect.industry == industry)
         
-        prospects = query.all()
+        # Totals and averages in a single aggregate row
+        total_prospects, average_ai_score, average_deal_probability, total_estimated_value = db.query(
+            func.count(Prospect.id),
+            func.avg(Prospect.ai_score),
+            func.avg(Prospect.deal_probability),
+            func.sum(Prospect.estimated_deal_size)
+        ).filter(*filters).one()
         
-        if not prospects:
+        if not total_prospects:
             return {
                 "total_prospects": 0,
                 "average_ai_score": 0,
@@ -259,25 +387,21 @@ class CRUDProspect(CRUDBase[Prospect, ProspectCreate, ProspectUpdate]):
                 "priority_breakdown": {}
             }
         
-        # Calculate statistics
-        total_prospects = len(prospects)
-        ai_scores = [p.ai_score for p in prospects if p.ai_score is not None]
-        deal_probs = [p.deal_probability for p in prospects if p.deal_probability is not None]
-        deal_sizes = [p.estimated_deal_size for p in prospects if p.estimated_deal_size is not None]
-        
-        # Status and priority breakdowns
-        status_breakdown = {}
-        priority_breakdown = {}
-        
-        for prospect in prospects:
-            status_breakdown[prospect.status] = status_breakdown.get(prospect.status, 0) + 1
-            priority_breakdown[prospect.priority] = priority_breakdown.get(prospect.priority, 0) + 1
+        # Breakdowns come back pre-grouped, one row per distinct value
+        status_breakdown = dict(
+            db.query(Prospect.status, func.count(Prospect.id))
+            .filter(*filters).group_by(Prospect.status).all()
+        )
+        priority_breakdown = dict(
+            db.query(Prospect.priority, func.count(Prospect.id))
+            .filter(*filters).group_by(Prospect.priority).all()
+        )
         
         return {
             "total_prospects": total_prospects,
-            "average_ai_score": sum(ai_scores) / len(ai_scores) if ai_scores else 0,
-            "average_deal_probability": sum(deal_probs) / len(deal_probs) if deal_probs else 0,
-            "total_estimated_value": sum(deal_sizes) if deal_sizes else 0,
+            "average_ai_score": average_ai_score if average_ai_score is not None else 0,
+            "average_deal_probability": average_deal_probability if average_deal_probability is not None else 0,
+            "total_estimated_value": total_estimated_value if total_estimated_value is not None else 0,
             "status_breakdown": status_breakdown,
             "priority_breakdown": priority_breakdown
         }
@@ -294,9 +418,14 @@ class CRUDProspectAnalysis(CRUDBase[ProspectAnalysis, dict, dict]):
         analysis_type: str,
         results: Dict[str, Any],
         organization_id: UUID,
-        created_by_id: UUID
-    ) -> ProspectAnalysis:
-        """Create a new prospect analysis"""
+        created_by_id: UUID,
+        refresh: bool = False
+    ) -> Union[ProspectAnalysis, UUID]:
+        """Create a new prospect analysis.
+
+        Returns only the new id unless ``refresh`` is set, in which case the
+        loaded analysis is returned.
+        """
         analysis_data = {
             "prospect_id": prospect_id,
             "analysis_type": analysis_type,
@@ -305,6 +434,13 @@ class CRUDProspectAnalysis(CRUDBase[ProspectAnalysis, dict, dict]):
             **results
         }
         
+        if not refresh:
+            analysis_id = db.execute(
+                insert(ProspectAnalysis).values(**analysis_data).returning(ProspectAnalysis.id)
+            ).scalar_one()
+            db.commit()
+            return analysis_id
+        
         analysis = ProspectAnalysis(**analysis_data)
         db.add(analysis)
         db.commit()
@@ -359,15 +495,27 @@ class CRUDMarketIntelligence(CRUDBase[MarketIntelligence, dict, dict]):
         *,
         data: Dict[str, Any],
         organization_id: UUID,
-        created_by_id: UUID
-    ) -> MarketIntelligence:
-        """Create a new market intelligence report"""
+        created_by_id: UUID,
+        refresh: bool = False
+    ) -> Union[MarketIntelligence, UUID]:
+        """Create a new market intelligence report.
+
+        Returns only the new id unless ``refresh`` is set, in which case the
+        loaded report is returned.
+        """
         intelligence_data = {
             "organization_id": organization_id,
             "created_by_id": created_by_id,
             **data
         }
         
+        if not refresh:
+            intelligence_id = db.execute(
+                insert(MarketIntelligence).values(**intelligence_data).returning(MarketIntelligence.id)
+            ).scalar_one()
+            db.commit()
+            return intelligence_id
+        
         intelligence = MarketIntelligence(**intelligence_data)
         db.add(intelligence)
         db.commit()
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import desc, tuple_
 from sqlalchemy.orm import Session
 
 from app.crud.base import CRUDBase
@@ -15,53 +16,85 @@ from app.schemas.task import TaskCreate, TaskUpdate
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
     """CRUD operations for Task model"""
     
+    def _paginate(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        before_created_at: Optional[datetime],
+        before_id: Optional[UUID]
+    ) -> List[Task]:
+        """Order a task listing newest first and fetch one page of it
+
+        Pass the ``created_at`` and ``id`` of the last task of the previous
+        page as ``before_created_at``/``before_id`` to seek past it instead of
+        scanning and discarding ``skip`` rows.
+        """
+        if before_created_at is not None and before_id is not None:
+            query = query.filter(tuple_(Task.created_at, Task.id) < (before_created_at, before_id))
+        elif skip:
+            query = query.offset(skip)
+        
+        # id breaks created_at ties so the seek never skips or repeats a row
+        return query.order_by(desc(Task.created_at), desc(Task.id)).limit(limit).all()
+    
     def get_by_organization(
         self, 
         db: Session, 
         organization_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        status: Optional[str] = None,
+        priority: Optional[str] = None,
+        assignee_id: Optional[UUID] = None,
+        deal_id: Optional[UUID] = None,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Task]:
-        """Get tasks by organization"""
-        return (
-            db.query(self.model)
-            .filter(Task.organization_id == organization_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        """Get tasks by organization with optional filters"""
+        query = db.query(self.model).filter(Task.organization_id == organization_id)
+        
+        if status:
+            query = query.filter(Task.status == status)
+        if priority:
+            query = query.filter(Task.priority == priority)
+        if assignee_id:
+            query = query.filter(Task.assignee_id == assignee_id)
+        if deal_id:
+            query = query.filter(Task.deal_id == deal_id)
+        
+        return self._paginate(query, skip, limit, before_created_at, before_id)
     
     def get_by_assignee(
         self, 
         db: Session, 
         assignee_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        status: Optional[str] = None,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Task]:
         """Get tasks by assignee"""
-        return (
-            db.query(self.model)
-            .filter(Task.assignee_id == assignee_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(self.model).filter(Task.assignee_id == assignee_id)
+        
+        if status:
+            query = query.filter(Task.status == status)
+        
+        return self._paginate(query, skip, limit, before_created_at, before_id)
     
     def get_by_deal(
         self, 
         db: Session, 
         deal_id: UUID,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Task]:
         """Get tasks by deal"""
-        return (
-            db.query(self.model)
-            .filter(Task.deal_id == deal_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(self.model).filter(Task.deal_id == deal_id)
+        return self._paginate(query, skip, limit, before_created_at, before_id)
     
     def get_by_status(
         self, 
@@ -69,7 +102,9 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         status: str,
         organization_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Task]:
         """Get tasks by status"""
         query = db.query(self.model).filter(Task.status == status)
@@ -77,7 +112,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         if organization_id:
             query = query.filter(Task.organization_id == organization_id)
             
-        return query.offset(skip).limit(limit).all()
+        return self._paginate(query, skip, limit, before_created_at, before_id)
     
     def get_by_priority(
         self, 
@@ -85,7 +120,9 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         priority: str,
         organization_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        before_created_at: Optional[datetime] = None,
+        before_id: Optional[UUID] = None
     ) -> List[Task]:
         """Get tasks by priority"""
         query = db.query(self.model).filter(Task.priority == priority)
@@ -93,7 +130,7 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         if organization_id:
             query = query.filter(Task.organization_id == organization_id)
             
-        return query.offset(skip).limit(limit).all()
+        return self._paginate(query, skip, limit, before_created_at, before_id)
     
     def get_overdue_tasks(
         self, 
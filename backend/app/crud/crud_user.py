@@ -6,7 +6,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
@@ -74,6 +74,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             return None
         if not verify_password(password, user.hashed_password):
             return None
+        if password_needs_rehash(user.hashed_password):
+            # Upgrade legacy bcrypt hashes to the current scheme
+            user.hashed_password = get_password_hash(password)
+            db.add(user)
+            db.commit()
         return user
     
     def is_active(self, user: User) -> bool:
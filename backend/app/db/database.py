@@ -61,6 +61,7 @@ else:
         database_url,
         poolclass=QueuePool,
         echo=settings.DEBUG and settings.ENVIRONMENT == "development",  # SQL logging only in dev
+        query_cache_size=1200,     # Compiled statement cache (default 500) for the many CRUD query shapes
         **pool_config
     )
 
@@ -1,6 +1,6 @@
 # Import all models to ensure they are registered with SQLAlchemy
 from .user import User
-from .organization import Organization
+from .organization import Organization, OrganizationCounters
 from .deal import Deal
 from .client import Client
 from .task import Task
@@ -18,7 +18,8 @@ from .presentation import (
     PresentationSlide,
     PresentationTemplate,
     PresentationComment,
-    PresentationCollaboration
+    PresentationCollaboration,
+    PresentationCollaborator
 )
 from .prospect import (
     Prospect,
@@ -36,6 +37,7 @@ from .document_analysis import (
 __all__ = [
     "User",
     "Organization",
+    "OrganizationCounters",
     "Deal",
     "Client",
     "Task",
@@ -51,6 +53,7 @@ __all__ = [
     "PresentationTemplate",
     "PresentationComment",
     "PresentationCollaboration",
+    "PresentationCollaborator",
     "Prospect",
     "ProspectAnalysis",
     "MarketIntelligence",
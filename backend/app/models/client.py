@@ -82,6 +82,7 @@ class Client(BaseModel):
         Index('idx_clients_org_type', 'organization_id', 'client_type'),
         Index('idx_clients_org_status', 'organization_id', 'relationship_status'),
         Index('idx_clients_org_industry', 'organization_id', 'industry'),
+        Index('idx_clients_org_source', 'organization_id', 'source'),
         Index('idx_clients_org_created', 'organization_id', 'created_at'),
         Index('idx_clients_type_status', 'client_type', 'relationship_status'),
         Index('idx_clients_org_type_status', 'organization_id', 'client_type', 'relationship_status'),
@@ -1,7 +1,7 @@
 """
 Compliance models for regulatory tracking and audit management
 """
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Float, DateTime, Enum
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Float, DateTime, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -19,6 +19,11 @@ class ComplianceStatus(str, enum.Enum):
     UNDER_REVIEW = "under_review"
 
 
+# Native PostgreSQL enum shared by requirement and assessment status; rows
+# hold the member names and compare as enum values, not varchar
+COMPLIANCE_STATUS_TYPE = Enum(ComplianceStatus, name="compliancestatus", native_enum=True)
+
+
 class ComplianceCategory(BaseModel):
     """Compliance categories (SEC, FINRA, AML, etc.)"""
     
@@ -39,6 +44,12 @@ class ComplianceCategory(BaseModel):
     regulation_url = Column(String(500))
     last_updated = Column(DateTime, default=datetime.utcnow)
     
+    # Requirement totals, maintained by the requirement CRUD writes so the
+    # dashboard reads them instead of aggregating on every request
+    total_requirements = Column(Integer, default=0, server_default="0", nullable=False)
+    compliant_requirements = Column(Integer, default=0, server_default="0", nullable=False)
+    compliance_score = Column(Float, default=100.0, server_default="100", nullable=False)
+    
     # Organization relationship
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     organization = relationship("Organization")
@@ -76,7 +87,7 @@ class ComplianceRequirement(BaseModel):
     next_review_date = Column(DateTime)
     
     # Status tracking
-    status = Column(Enum(ComplianceStatus), default=ComplianceStatus.PENDING)
+    status = Column(COMPLIANCE_STATUS_TYPE, default=ComplianceStatus.PENDING)
     completion_percentage = Column(Float, default=0.0)
     
     # Category relationship
@@ -91,6 +102,16 @@ class ComplianceRequirement(BaseModel):
     assessments = relationship("ComplianceAssessment", back_populates="requirement")
     audit_logs = relationship("ComplianceAuditLog", back_populates="requirement")
     
+    # Indexes for the overdue and upcoming-review listings; the overdue one
+    # only covers open requirements (status holds the enum member name)
+    __table_args__ = (
+        Index(
+            'idx_compliance_requirements_org_due_open', 'organization_id', 'due_date', 'id',
+            postgresql_where=text("status <> 'COMPLIANT'")
+        ),
+        Index('idx_compliance_requirements_org_review', 'organization_id', 'next_review_date', 'id'),
+    )
+    
     def __repr__(self):
         return f"<ComplianceRequirement(id={self.id}, title='{self.title}', status='{self.status}')>"
 
@@ -105,7 +126,7 @@ class ComplianceAssessment(BaseModel):
     assessment_type = Column(String(50), default="regular")  # regular, audit, spot_check, annual
     
     # Results
-    status = Column(Enum(ComplianceStatus), nullable=False)
+    status = Column(COMPLIANCE_STATUS_TYPE, nullable=False)
     score = Column(Float)  # 0-100 compliance score
     findings = Column(Text)
     recommendations = Column(Text)
@@ -138,6 +159,11 @@ class ComplianceAssessment(BaseModel):
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     organization = relationship("Organization")
     
+    # Index for organization assessment listings, newest first
+    __table_args__ = (
+        Index('idx_compliance_assessments_org_date', 'organization_id', 'assessment_date'),
+    )
+    
     def __repr__(self):
         return f"<ComplianceAssessment(id={self.id}, status='{self.status}', score={self.score})>"
 
@@ -214,6 +240,14 @@ class RegulatoryUpdate(BaseModel):
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     organization = relationship("Organization")
     
+    # Index for the unreviewed updates listing, newest first
+    __table_args__ = (
+        Index(
+            'idx_regulatory_updates_org_pub_unreviewed', 'organization_id', 'publication_date',
+            postgresql_where=text("is_reviewed = false")
+        ),
+    )
+    
     def __repr__(self):
         return f"<RegulatoryUpdate(id={self.id}, title='{self.title}', impact='{self.impact_level}')>"
 
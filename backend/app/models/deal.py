@@ -94,6 +94,12 @@ class Deal(BaseModel):
         Index('idx_deals_org_status', 'organization_id', 'status'),
         Index('idx_deals_org_type', 'organization_id', 'deal_type'),
         Index('idx_deals_org_created', 'organization_id', 'created_at'),
+        # Organization listing ordered by (updated_at, id); the included
+        # columns let the planner answer summary reads from the index alone
+        Index(
+            'idx_deals_org_updated', 'organization_id', 'updated_at', 'id',
+            postgresql_include=['stage', 'status', 'title', 'client_id']
+        ),
         Index('idx_deals_stage_status', 'stage', 'status'),
         Index('idx_deals_org_stage_status', 'organization_id', 'stage', 'status'),
         Index('idx_deals_client_stage', 'client_id', 'stage'),
@@ -101,6 +107,7 @@ class Deal(BaseModel):
 
         # Indexes for date-based queries
         Index('idx_deals_org_close_date', 'organization_id', 'expected_close_date'),
+        Index('idx_deals_org_actual_close_date', 'organization_id', 'actual_close_date'),
         Index('idx_deals_stage_close_date', 'stage', 'expected_close_date'),
 
         # Indexes for value-based queries and sorting
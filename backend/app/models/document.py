@@ -1,7 +1,7 @@
 """
 Document model for file management and due diligence
 """
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Index
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -67,6 +67,10 @@ class Document(BaseModel):
     access_level = Column(String(50), default="organization")  # public, organization, deal_team, restricted
     allowed_roles = Column(JSON, default=list)
     
+    # Usage tracking
+    download_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_accessed = Column(DateTime)
+    
     # Organization relationship
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     organization = relationship("Organization", back_populates="documents")
@@ -120,6 +124,24 @@ class Document(BaseModel):
         Index('idx_documents_org_status', 'organization_id', 'status'),
         Index('idx_documents_org_archived', 'organization_id', 'is_archived'),
         Index('idx_documents_org_created', 'organization_id', 'created_at'),
+        # Partial indexes over non-archived documents for the flag/status/category listings
+        Index(
+            'idx_documents_org_confidential_active', 'organization_id',
+            postgresql_where=text("is_confidential = true AND is_archived = false")
+        ),
+        Index(
+            'idx_documents_status_org_active', 'status', 'organization_id',
+            postgresql_where=text("is_archived = false")
+        ),
+        Index(
+            'idx_documents_category_org_active', 'category', 'organization_id',
+            postgresql_where=text("is_archived = false")
+        ),
+        # Organization listing of non-archived documents ordered by (created_at, id)
+        Index(
+            'idx_documents_org_active_created', 'organization_id', 'created_at', 'id',
+            postgresql_where=text("is_archived = false")
+        ),
         Index('idx_documents_deal_type', 'deal_id', 'document_type'),
         Index('idx_documents_deal_status', 'deal_id', 'status'),
         Index('idx_documents_client_type', 'client_id', 'document_type'),
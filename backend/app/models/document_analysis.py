@@ -1,9 +1,9 @@
 """
 Enhanced document analysis models for Diligence Navigator
 """
-from sqlalchemy import Column, String, Text, Numeric, JSON, DateTime, Boolean, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, Numeric, JSON, DateTime, Boolean, ForeignKey, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 import uuid
 
@@ -73,6 +73,19 @@ class DocumentAnalysis(BaseModel):
     document = relationship("Document", back_populates="analyses")
     organization = relationship("Organization")
     created_by = relationship("User")
+    
+    # Indexes for the organization listing (newest first, keyset on id), the
+    # high-risk listing and the per-document latest-analysis lookup
+    __table_args__ = (
+        Index('idx_document_analyses_org_date', 'organization_id', 'analysis_date', 'id'),
+        Index('idx_document_analyses_org_risk', 'organization_id', 'overall_risk_score'),
+        # Only the high-risk slice read by the high-risk listing (default threshold 70)
+        Index(
+            'idx_document_analyses_org_high_risk', 'organization_id', 'overall_risk_score',
+            postgresql_where=text("overall_risk_score >= 70")
+        ),
+        Index('idx_document_analyses_doc_type_date', 'document_id', 'analysis_type', 'analysis_date'),
+    )
 
 
 class RiskAssessment(BaseModel):
@@ -134,6 +147,18 @@ class RiskAssessment(BaseModel):
     deal = relationship("Deal")
     organization = relationship("Organization")
     created_by = relationship("User")
+    
+    # Indexes for the organization listing, the per-deal latest assessment and
+    # the critical listing
+    __table_args__ = (
+        Index('idx_risk_assessments_org_date', 'organization_id', 'assessment_date', 'id'),
+        Index('idx_risk_assessments_deal_type_date', 'deal_id', 'assessment_type', 'assessment_date'),
+        # Only the critical assessments read by the critical listing
+        Index(
+            'idx_risk_assessments_org_critical', 'organization_id', 'overall_risk_score',
+            postgresql_where=text("risk_level = 'critical'")
+        ),
+    )
 
 
 class DocumentCategory(BaseModel):
@@ -212,6 +237,19 @@ class DocumentReview(BaseModel):
     reviewer = relationship("User", foreign_keys=[reviewer_id])
     escalated_to = relationship("User", foreign_keys=[escalated_to_id])
     organization = relationship("Organization")
+    
+    # Partial indexes over pending reviews only, for the pending listing
+    # ordered by deadline, with and without a reviewer filter
+    __table_args__ = (
+        Index(
+            'idx_document_reviews_pending_org_deadline', 'organization_id', 'review_deadline',
+            postgresql_where=text("review_status = 'pending'")
+        ),
+        Index(
+            'idx_document_reviews_pending_reviewer_deadline', 'organization_id', 'reviewer_id', 'review_deadline',
+            postgresql_where=text("review_status = 'pending'")
+        ),
+    )
 
 
 class DocumentComparison(BaseModel):
@@ -228,6 +266,11 @@ class DocumentComparison(BaseModel):
     primary_document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
     secondary_document_id = Column(UUID(as_uuid=True), ForeignKey("documents.id"), nullable=False)
     
+    # The compared pair in canonical (lower, higher) order, kept in sync with
+    # the two ids above so order-agnostic lookups are a single equality probe
+    document_id_low = Column(UUID(as_uuid=True))
+    document_id_high = Column(UUID(as_uuid=True))
+    
     # Comparison results
     similarity_score = Column(Numeric(5, 2))  # 0-100
     differences_found = Column(JSON, default=list)  # List of differences
@@ -256,6 +299,21 @@ class DocumentComparison(BaseModel):
     secondary_document = relationship("Document", foreign_keys=[secondary_document_id])
     organization = relationship("Organization")
     created_by = relationship("User")
+    
+    # Index for order-agnostic lookups of the comparisons between two
+    # documents, returned newest first straight from the index
+    __table_args__ = (
+        Index('idx_document_comparisons_pair_date', 'document_id_low', 'document_id_high', 'comparison_date'),
+    )
+    
+    @validates("primary_document_id", "secondary_document_id")
+    def _sync_document_pair(self, key, value):
+        other = self.secondary_document_id if key == "primary_document_id" else self.primary_document_id
+        if value is not None and other is not None:
+            self.document_id_low, self.document_id_high = sorted(
+                (uuid.UUID(str(value)), uuid.UUID(str(other)))
+            )
+        return value
 
 
 # Add relationships to existing Document model
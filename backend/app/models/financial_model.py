@@ -1,7 +1,7 @@
 """
 Financial Model for valuation and modeling hub
 """
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -71,5 +71,10 @@ class FinancialModel(BaseModel):
     parent_model = relationship("FinancialModel", remote_side="FinancialModel.id")
     child_models = relationship("FinancialModel", back_populates="parent_model")
     
+    # Index for the current-version statistics and status listings
+    __table_args__ = (
+        Index('idx_financial_models_org_current_status', 'organization_id', 'is_current', 'status'),
+    )
+    
     def __repr__(self):
         return f"<FinancialModel(id={self.id}, name='{self.name}', type='{self.model_type}', version={self.version})>"
@@ -1,10 +1,13 @@
 """
 Organization model
 """
-from sqlalchemy import Column, String, Text, JSON
+from datetime import datetime
+
+from sqlalchemy import Column, String, Text, JSON, Integer, Numeric, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import Base, BaseModel
 
 
 class Organization(BaseModel):
@@ -48,3 +51,32 @@ class Organization(BaseModel):
     
     def __repr__(self):
         return f"<Organization(id={self.id}, name='{self.name}', slug='{self.slug}')>"
+
+
+class OrganizationCounters(Base):
+    """Per-organization entity totals for the organization overview
+
+    Maintained by database triggers on users, deals, clients, tasks and
+    documents (see add_organization_counters.py), so the overview reads one
+    row instead of counting every table.
+    """
+    
+    __tablename__ = "organization_counters"
+    
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    users_count = Column(Integer, default=0, server_default="0", nullable=False)
+    active_users = Column(Integer, default=0, server_default="0", nullable=False)
+    deals_count = Column(Integer, default=0, server_default="0", nullable=False)
+    active_deals = Column(Integer, default=0, server_default="0", nullable=False)
+    pipeline_value = Column(Numeric(15, 2), default=0, server_default="0", nullable=False)
+    clients_count = Column(Integer, default=0, server_default="0", nullable=False)
+    tasks_count = Column(Integer, default=0, server_default="0", nullable=False)
+    documents_count = Column(Integer, default=0, server_default="0", nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<OrganizationCounters(organization_id={self.organization_id}, deals={self.deals_count})>"
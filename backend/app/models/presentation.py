@@ -1,13 +1,13 @@
 """
 Presentation models for PitchCraft Suite
 """
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Float, DateTime, Enum
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, JSON, Boolean, Float, DateTime, Enum, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
-from app.models.base import BaseModel
+from app.models.base import Base, BaseModel
 
 
 class PresentationStatus(str, enum.Enum):
@@ -94,10 +94,45 @@ class Presentation(BaseModel):
     slides = relationship("PresentationSlide", back_populates="presentation", cascade="all, delete-orphan")
     comments = relationship("PresentationComment", back_populates="presentation", cascade="all, delete-orphan")
     
+    # Partial indexes over current versions only, for the listings by
+    # organization and by deal ordered by last update
+    __table_args__ = (
+        Index(
+            'idx_presentations_current_org_updated', 'organization_id', 'updated_at',
+            postgresql_where=text("is_current = true")
+        ),
+        Index(
+            'idx_presentations_current_deal_org_updated', 'deal_id', 'organization_id', 'updated_at',
+            postgresql_where=text("is_current = true")
+        ),
+    )
+    
     def __repr__(self):
         return f"<Presentation(id={self.id}, title='{self.title}', type='{self.presentation_type}', status='{self.status}')>"
 
 
+class PresentationCollaborator(Base):
+    """One user listed in a presentation's collaborators
+
+    Mirrors Presentation.collaborators, kept in sync by a database trigger
+    (see add_presentation_collaborators.py), so shared-with-user lookups
+    probe an index instead of parsing the JSON of every row.
+    """
+    
+    __tablename__ = "presentation_collaborators"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    presentation_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("presentations.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True
+    )
+    
+    def __repr__(self):
+        return f"<PresentationCollaborator(user_id={self.user_id}, presentation_id={self.presentation_id})>"
+
+
 class PresentationSlide(BaseModel):
     """Individual slides within a presentation"""
     
@@ -127,6 +162,11 @@ class PresentationSlide(BaseModel):
     presentation_id = Column(UUID(as_uuid=True), ForeignKey("presentations.id"), nullable=False)
     presentation = relationship("Presentation", back_populates="slides")
     
+    # Index for slide lookups and ordering within a presentation
+    __table_args__ = (
+        Index('idx_presentation_slides_presentation_number', 'presentation_id', 'slide_number'),
+    )
+    
     def __repr__(self):
         return f"<PresentationSlide(id={self.id}, number={self.slide_number}, title='{self.title}')>"
 
@@ -202,6 +242,19 @@ class PresentationComment(BaseModel):
     parent_comment = relationship("PresentationComment", remote_side="PresentationComment.id")
     replies = relationship("PresentationComment", back_populates="parent_comment")
     
+    # Partial indexes over top-level comments only, for the newest-first
+    # listings by presentation and by slide
+    __table_args__ = (
+        Index(
+            'idx_presentation_comments_toplevel_presentation_created', 'presentation_id', 'created_at',
+            postgresql_where=text("parent_comment_id IS NULL")
+        ),
+        Index(
+            'idx_presentation_comments_toplevel_slide_created', 'slide_id', 'created_at',
+            postgresql_where=text("parent_comment_id IS NULL")
+        ),
+    )
+    
     def __repr__(self):
         return f"<PresentationComment(id={self.id}, type='{self.comment_type}', resolved={self.is_resolved})>"
 
@@ -227,6 +280,11 @@ class PresentationCollaboration(BaseModel):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     user = relationship("User")
     
+    # Index for the per-presentation activity feed
+    __table_args__ = (
+        Index('idx_presentation_collaborations_presentation_created', 'presentation_id', 'created_at'),
+    )
+    
     def __repr__(self):
         return f"<PresentationCollaboration(id={self.id}, activity='{self.activity_type}', presentation_id={self.presentation_id})>"
 
@@ -1,7 +1,7 @@
 """
 Prospect model for AI-powered deal sourcing and scoring
 """
-from sqlalchemy import Column, String, Text, Numeric, JSON, DateTime, Boolean, ForeignKey, Integer
+from sqlalchemy import Column, String, Text, Numeric, JSON, DateTime, Boolean, ForeignKey, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -96,6 +96,15 @@ class Prospect(BaseModel):
     created_by = relationship("User", foreign_keys=[created_by_id])
     assigned_to = relationship("User", foreign_keys=[assigned_to_id])
     analyses = relationship("ProspectAnalysis", back_populates="prospect")
+    
+    # Indexes for the score-ranked listing and the (partial) follow-up queue
+    __table_args__ = (
+        Index('idx_prospects_org_ai_score', 'organization_id', 'ai_score'),
+        Index(
+            'idx_prospects_follow_up_queue', 'organization_id', 'next_follow_up',
+            postgresql_where=text("status IN ('contacted', 'engaged')")
+        ),
+    )
 
 
 class ProspectAnalysis(BaseModel):
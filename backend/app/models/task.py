@@ -1,7 +1,7 @@
 """
 Task model for project and deal management
 """
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, JSON, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -81,12 +81,15 @@ class Task(BaseModel):
         Index('idx_tasks_deal_status', 'deal_id', 'status'),
         Index('idx_tasks_status_priority', 'status', 'priority'),
         Index('idx_tasks_org_status_priority', 'organization_id', 'status', 'priority'),
+        Index('idx_tasks_org_created', 'organization_id', 'created_at', 'id'),
 
         # Indexes for date-based queries
         Index('idx_tasks_org_due_date', 'organization_id', 'due_date'),
         Index('idx_tasks_assignee_due_date', 'assignee_id', 'due_date'),
         Index('idx_tasks_status_due_date', 'status', 'due_date'),
         Index('idx_tasks_priority_due_date', 'priority', 'due_date'),
+        Index('idx_tasks_open_due_date', 'due_date',
+              postgresql_where=text("status IN ('todo', 'in_progress')")),
 
         # Indexes for task management workflows
         Index('idx_tasks_type_status', 'task_type', 'status'),
@@ -283,7 +283,7 @@ class AdvancedAnalyticsService:
             model_types[model_type] = model_types.get(model_type, 0) + 1
         
         # Deal value analysis
-        deals = crud_deal.get_by_organization(db, organization_id=organization_id, limit=1000)
+        deals = crud_deal.get_by_organization(db, organization_id=organization_id, limit=1000, stream=True)
         deals_in_period = [d for d in deals if start_date <= d.created_at <= end_date]
         
         total_deal_value = sum(d.deal_value or 0 for d in deals_in_period)
@@ -243,7 +243,8 @@ class CacheService:
             f"dealverse:tasks:*{organization_id}*",
             f"dealverse:users:*{organization_id}*",
             f"dealverse:dashboard:*{organization_id}*",
-            f"dealverse:analytics:*{organization_id}*"
+            f"dealverse:analytics:*{organization_id}*",
+            f"dealverse:orgstats:{organization_id}:*"
         ]
         
         total_deleted = 0
@@ -276,6 +277,33 @@ class CacheService:
 cache_service = CacheService()
 
 
+# Organization statistics (dashboard reads) are cached briefly and dropped by
+# the CRUD writes that feed them
+ORGANIZATION_STATS_TTL = 60
+
+
+def organization_stats_key(organization_id: Any, name: str, *parts: Any) -> str:
+    """Build the cache key for one organization-scoped statistics read"""
+    suffix = "".join(f":{part}" for part in parts)
+    return f"dealverse:orgstats:{organization_id}:{name}{suffix}"
+
+
+def invalidate_organization_stats(organization_id: Any) -> int:
+    """Drop every cached statistics read for an organization"""
+    return cache_service.delete_pattern(f"dealverse:orgstats:{organization_id}:*")
+
+
+def public_templates_key(*parts: Any) -> str:
+    """Build the cache key for one page of public presentation templates"""
+    suffix = "".join(f":{part}" for part in parts)
+    return f"dealverse:templates:public{suffix}"
+
+
+def invalidate_public_templates() -> int:
+    """Drop every cached public template page"""
+    return cache_service.delete_pattern("dealverse:templates:public:*")
+
+
 def cached(
     ttl: int = 300,
     key_prefix: str = "default",
@@ -19,6 +19,7 @@ from anthropic import AsyncAnthropic
 from app.core.ai_config import (
     get_ai_settings, 
     get_ai_prompt, 
+    render_prompt,
     RISK_SCORING_CONFIG,
     ENTITY_EXTRACTION_CONFIG
 )
@@ -204,7 +205,7 @@ class RealAIService:
         """Call OpenAI GPT-4 API"""
         
         system_prompt = get_ai_prompt(prompt_type, "system")
-        user_prompt = get_ai_prompt(prompt_type, "user_template").format(**context)
+        user_prompt = render_prompt(prompt_type, **context)
         
         # Truncate content if too long
         user_prompt = self._truncate_content(user_prompt, self.settings.openai_max_tokens)
@@ -226,17 +227,11 @@ class RealAIService:
         """Call OpenRouter API with DeepSeek optimization"""
 
         system_prompt = get_ai_prompt(prompt_type, "system")
-        user_prompt = get_ai_prompt(prompt_type, "user_template").format(**context)
+        user_prompt = render_prompt(prompt_type, **context)
 
         # Enhanced content truncation for DeepSeek
         user_prompt = self._truncate_content_smart(user_prompt, self.settings.openrouter_max_tokens)
 
-        # Prepare headers for OpenRouter with enhanced metadata
-        extra_headers = {
-            "HTTP-Referer": self.settings.openrouter_site_url or "https://dealverse.com",
-            "X-Title": self.settings.openrouter_site_name or "DealVerse OS - AI Document Analysis"
-        }
-
         # DeepSeek-specific optimizations
         model_params = {
             "model": self.settings.openrouter_model,
@@ -247,7 +242,7 @@ class RealAIService:
             "max_tokens": self.settings.openrouter_max_tokens,
             "temperature": self.settings.openrouter_temperature,
             "timeout": self.settings.request_timeout,
-            "extra_headers": extra_headers
+            "extra_headers": self.settings.openrouter_default_headers
         }
 
         # Add DeepSeek-specific parameters if using DeepSeek model
@@ -276,7 +271,7 @@ class RealAIService:
         """Call Anthropic Claude API"""
         
         system_prompt = get_ai_prompt(prompt_type, "system")
-        user_prompt = get_ai_prompt(prompt_type, "user_template").format(**context)
+        user_prompt = render_prompt(prompt_type, **context)
         
         # Truncate content if too long
         user_prompt = self._truncate_content(user_prompt, self.settings.anthropic_max_tokens)
@@ -17,6 +17,17 @@ def create_compliance_tables():
     
     try:
         with engine.connect() as connection:
+            # Create the native status enum used by the ORM models
+            connection.execute(text("""
+                DO $$ BEGIN
+                    CREATE TYPE compliancestatus AS ENUM (
+                        'COMPLIANT', 'WARNING', 'NON_COMPLIANT', 'PENDING', 'UNDER_REVIEW'
+                    );
+                EXCEPTION
+                    WHEN duplicate_object THEN NULL;
+                END $$
+            """))
+            
             # Create compliance_categories table
             connection.execute(text("""
                 CREATE TABLE IF NOT EXISTS compliance_categories (
@@ -32,6 +43,9 @@ def create_compliance_tables():
                     regulatory_body VARCHAR(255),
                     regulation_url VARCHAR(500),
                     last_updated TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+                    total_requirements INTEGER NOT NULL DEFAULT 0,
+                    compliant_requirements INTEGER NOT NULL DEFAULT 0,
+                    compliance_score FLOAT NOT NULL DEFAULT 100,
                     organization_id UUID NOT NULL REFERENCES organizations(id),
                     UNIQUE(code, organization_id)
                 )
@@ -54,7 +68,7 @@ def create_compliance_tables():
                     review_frequency_days INTEGER DEFAULT 90,
                     last_review_date TIMESTAMP WITH TIME ZONE,
                     next_review_date TIMESTAMP WITH TIME ZONE,
-                    status VARCHAR(20) DEFAULT 'pending',
+                    status compliancestatus DEFAULT 'PENDING',
                     completion_percentage FLOAT DEFAULT 0.0,
                     category_id UUID NOT NULL REFERENCES compliance_categories(id),
                     organization_id UUID NOT NULL REFERENCES organizations(id)
@@ -69,7 +83,7 @@ def create_compliance_tables():
                     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                     assessment_date TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                     assessment_type VARCHAR(50) DEFAULT 'regular',
-                    status VARCHAR(20) NOT NULL,
+                    status compliancestatus NOT NULL,
                     score FLOAT,
                     findings TEXT,
                     recommendations TEXT,
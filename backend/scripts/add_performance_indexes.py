@@ -21,8 +21,32 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_index_if_not_exists(index_name: str, table_name: str, columns: str):
-    """Create index if it doesn't already exist"""
+def ensure_extension(extension_name: str):
+    """Create a PostgreSQL extension if it isn't installed yet"""
+    db = SessionLocal()
+    try:
+        db.execute(text(f'CREATE EXTENSION IF NOT EXISTS "{extension_name}"'))
+        db.commit()
+        logger.info(f"Extension {extension_name} is available")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error creating extension {extension_name}: {e}")
+    finally:
+        db.close()
+
+def create_index_if_not_exists(
+    index_name: str,
+    table_name: str,
+    columns: str,
+    using: str = None,
+    where: str = None,
+    include: str = None
+):
+    """Create index if it doesn't already exist
+
+    ``using`` selects the index method (e.g. "gin"), ``where`` makes it a
+    partial index and ``include`` adds non-key covering columns.
+    """
     db = SessionLocal()
     try:
         # Check if index exists
@@ -38,7 +62,13 @@ def create_index_if_not_exists(index_name: str, table_name: str, columns: str):
             return
 
         # Create the index (without CONCURRENTLY for development)
-        create_query = text(f"CREATE INDEX {index_name} ON {table_name} ({columns})")
+        using_clause = f" USING {using}" if using else ""
+        include_clause = f" INCLUDE ({include})" if include else ""
+        where_clause = f" WHERE {where}" if where else ""
+        create_query = text(
+            f"CREATE INDEX {index_name} ON {table_name}{using_clause} ({columns})"
+            f"{include_clause}{where_clause}"
+        )
         db.execute(create_query)
         db.commit()
         logger.info(f"Created index: {index_name}")
@@ -80,6 +110,7 @@ def add_performance_indexes():
         ("idx_deals_client_stage", "deals", "client_id, stage"),
         ("idx_deals_created_by_stage", "deals", "created_by_id, stage"),
         ("idx_deals_org_close_date", "deals", "organization_id, expected_close_date"),
+        ("idx_deals_org_actual_close_date", "deals", "organization_id, actual_close_date"),
         ("idx_deals_stage_close_date", "deals", "stage, expected_close_date"),
         ("idx_deals_org_value", "deals", "organization_id, deal_value"),
         ("idx_deals_stage_value", "deals", "stage, deal_value"),
@@ -102,6 +133,7 @@ def add_performance_indexes():
         ("idx_clients_org_type", "clients", "organization_id, client_type"),
         ("idx_clients_org_status", "clients", "organization_id, relationship_status"),
         ("idx_clients_org_industry", "clients", "organization_id, industry"),
+        ("idx_clients_org_source", "clients", "organization_id, source"),
         ("idx_clients_org_created", "clients", "organization_id, created_at"),
         ("idx_clients_type_status", "clients", "client_type, relationship_status"),
         ("idx_clients_org_type_status", "clients", "organization_id, client_type, relationship_status"),
@@ -114,6 +146,30 @@ def add_performance_indexes():
     for index_name, table_name, columns in client_indexes:
         create_index_if_not_exists(index_name, table_name, columns)
 
+    # Trigram GIN indexes so ILIKE '%term%' searches can use an index. They are
+    # only created here, after pg_trgm is installed, and not declared on the
+    # models, where create_all would fail on a database without the extension
+    logger.info("Adding trigram search indexes...")
+    ensure_extension("pg_trgm")
+    trigram_indexes = [
+        ("idx_clients_name_trgm", "clients", "name gin_trgm_ops"),
+        ("idx_clients_company_trgm", "clients", "company gin_trgm_ops"),
+        ("idx_clients_email_trgm", "clients", "email gin_trgm_ops"),
+        ("idx_deals_title_trgm", "deals", "title gin_trgm_ops"),
+        ("idx_deals_description_trgm", "deals", "description gin_trgm_ops"),
+        ("idx_deals_target_company_trgm", "deals", "target_company gin_trgm_ops"),
+        ("idx_documents_title_trgm", "documents", "title gin_trgm_ops"),
+        ("idx_documents_filename_trgm", "documents", "filename gin_trgm_ops"),
+        ("idx_documents_description_trgm", "documents", "description gin_trgm_ops"),
+        ("idx_prospects_company_name_trgm", "prospects", "company_name gin_trgm_ops"),
+        ("idx_prospects_description_trgm", "prospects", "description gin_trgm_ops"),
+        ("idx_prospects_industry_trgm", "prospects", "industry gin_trgm_ops"),
+        ("idx_prospects_location_trgm", "prospects", "location gin_trgm_ops"),
+    ]
+
+    for index_name, table_name, columns in trigram_indexes:
+        create_index_if_not_exists(index_name, table_name, columns, using="gin")
+
     # Document indexes
     logger.info("Adding Document table indexes...")
     document_indexes = [
@@ -217,6 +273,129 @@ def add_performance_indexes():
     for index_name, table_name, columns in task_indexes:
         create_index_if_not_exists(index_name, table_name, columns)
 
+    # Indexes matching the WHERE/ORDER BY of the paginated listings
+    logger.info("Adding listing indexes...")
+    create_index_if_not_exists(
+        "idx_deals_org_updated", "deals", "organization_id, updated_at, id",
+        include="stage, status, title, client_id"
+    )
+    create_index_if_not_exists(
+        "idx_documents_org_active_created", "documents", "organization_id, created_at, id",
+        where="is_archived = false"
+    )
+    create_index_if_not_exists(
+        "idx_documents_org_confidential_active", "documents", "organization_id",
+        where="is_confidential = true AND is_archived = false"
+    )
+    create_index_if_not_exists(
+        "idx_documents_status_org_active", "documents", "status, organization_id",
+        where="is_archived = false"
+    )
+    create_index_if_not_exists(
+        "idx_documents_category_org_active", "documents", "category, organization_id",
+        where="is_archived = false"
+    )
+    create_index_if_not_exists(
+        "idx_compliance_requirements_org_due_open", "compliance_requirements",
+        "organization_id, due_date, id", where="status <> 'COMPLIANT'"
+    )
+    create_index_if_not_exists(
+        "idx_compliance_requirements_org_review", "compliance_requirements",
+        "organization_id, next_review_date, id"
+    )
+    create_index_if_not_exists(
+        "idx_compliance_assessments_org_date", "compliance_assessments",
+        "organization_id, assessment_date"
+    )
+    create_index_if_not_exists(
+        "idx_regulatory_updates_org_pub_unreviewed", "regulatory_updates",
+        "organization_id, publication_date", where="is_reviewed = false"
+    )
+    create_index_if_not_exists(
+        "idx_document_analyses_org_date", "document_analyses",
+        "organization_id, analysis_date, id"
+    )
+    create_index_if_not_exists(
+        "idx_document_analyses_org_risk", "document_analyses",
+        "organization_id, overall_risk_score"
+    )
+    create_index_if_not_exists(
+        "idx_document_analyses_org_high_risk", "document_analyses",
+        "organization_id, overall_risk_score", where="overall_risk_score >= 70"
+    )
+    create_index_if_not_exists(
+        "idx_document_analyses_doc_type_date", "document_analyses",
+        "document_id, analysis_type, analysis_date"
+    )
+    create_index_if_not_exists(
+        "idx_risk_assessments_org_date", "risk_assessments",
+        "organization_id, assessment_date, id"
+    )
+    create_index_if_not_exists(
+        "idx_risk_assessments_deal_type_date", "risk_assessments",
+        "deal_id, assessment_type, assessment_date"
+    )
+    create_index_if_not_exists(
+        "idx_risk_assessments_org_critical", "risk_assessments",
+        "organization_id, overall_risk_score", where="risk_level = 'critical'"
+    )
+    create_index_if_not_exists(
+        "idx_document_reviews_pending_org_deadline", "document_reviews",
+        "organization_id, review_deadline", where="review_status = 'pending'"
+    )
+    create_index_if_not_exists(
+        "idx_document_reviews_pending_reviewer_deadline", "document_reviews",
+        "organization_id, reviewer_id, review_deadline", where="review_status = 'pending'"
+    )
+    create_index_if_not_exists(
+        "idx_financial_models_org_current_status", "financial_models",
+        "organization_id, is_current, status"
+    )
+    create_index_if_not_exists(
+        "idx_document_comparisons_pair_date", "document_comparisons",
+        "document_id_low, document_id_high, comparison_date"
+    )
+    create_index_if_not_exists(
+        "idx_presentations_current_org_updated", "presentations",
+        "organization_id, updated_at", where="is_current = true"
+    )
+    create_index_if_not_exists(
+        "idx_presentations_current_deal_org_updated", "presentations",
+        "deal_id, organization_id, updated_at", where="is_current = true"
+    )
+    create_index_if_not_exists(
+        "idx_presentation_slides_presentation_number", "presentation_slides",
+        "presentation_id, slide_number"
+    )
+    create_index_if_not_exists(
+        "idx_presentation_comments_toplevel_presentation_created", "presentation_comments",
+        "presentation_id, created_at", where="parent_comment_id IS NULL"
+    )
+    create_index_if_not_exists(
+        "idx_presentation_comments_toplevel_slide_created", "presentation_comments",
+        "slide_id, created_at", where="parent_comment_id IS NULL"
+    )
+    create_index_if_not_exists(
+        "idx_presentation_collaborations_presentation_created", "presentation_collaborations",
+        "presentation_id, created_at"
+    )
+    create_index_if_not_exists(
+        "idx_prospects_org_ai_score", "prospects",
+        "organization_id, ai_score"
+    )
+    create_index_if_not_exists(
+        "idx_prospects_follow_up_queue", "prospects",
+        "organization_id, next_follow_up", where="status IN ('contacted', 'engaged')"
+    )
+    create_index_if_not_exists(
+        "idx_tasks_open_due_date", "tasks",
+        "due_date", where="status IN ('todo', 'in_progress')"
+    )
+    create_index_if_not_exists(
+        "idx_tasks_org_created", "tasks",
+        "organization_id, created_at, id"
+    )
+
     logger.info("Database performance optimization completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""
+Tests for JWT token encoding and verification
+"""
+import base64
+import json
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.core import security
+
+
+def _decode_payload_bytes(token: str) -> bytes:
+    payload_b64 = token.split(".")[1]
+    return base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4))
+
+
+class TestTokenEncoding:
+    """Test the hand-assembled token encoder against verify_token"""
+
+    def test_access_token_round_trip(self):
+        """An access token verifies and carries its claims"""
+        user_id = str(uuid4())
+        session_id = str(uuid4())
+        token = security.create_access_token(
+            user_id,
+            session_id=session_id,
+            additional_claims={"role": "analyst", "org_id": "org-1"}
+        )
+
+        payload = security.verify_token(token, "access", check_blacklist=False)
+
+        assert payload is not None
+        assert payload["sub"] == user_id
+        assert payload["type"] == "access"
+        assert payload["sid"] == session_id
+        assert payload["role"] == "analyst"
+        assert payload["org_id"] == "org-1"
+        assert payload["exp"] > payload["iat"]
+
+    def test_refresh_token_round_trip(self):
+        """A refresh token verifies as refresh and not as access"""
+        user_id = str(uuid4())
+        token = security.create_refresh_token(user_id)
+
+        payload = security.verify_token(token, "refresh", check_blacklist=False)
+
+        assert payload is not None
+        assert payload["sub"] == user_id
+        assert security.verify_token(token, "access", check_blacklist=False) is None
+
+    def test_payload_has_unique_claim_names(self):
+        """Every claim name appears once in the encoded payload"""
+        token = security.create_access_token(
+            str(uuid4()), session_id=str(uuid4()), additional_claims={"role": "admin"}
+        )
+
+        names = []
+
+        def collect(pairs):
+            names.extend(name for name, _ in pairs)
+            return dict(pairs)
+
+        payload = json.loads(_decode_payload_bytes(token), object_pairs_hook=collect)
+
+        assert len(names) == len(set(names))
+        assert payload["role"] == "admin"
+
+    def test_reserved_additional_claims_are_rejected(self):
+        """additional_claims cannot repeat the fixed claim names"""
+        for name in ("type", "sub", "exp", "jti", "iat", "iss"):
+            with pytest.raises(ValueError):
+                security.create_access_token(str(uuid4()), additional_claims={name: "x"})
+
+    def test_expired_token_is_rejected(self):
+        """A token past its expiry does not verify"""
+        token = security.create_access_token(str(uuid4()), expires_delta=timedelta(seconds=-10))
+
+        assert security.verify_token(token, "access", check_blacklist=False) is None